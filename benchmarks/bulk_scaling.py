@@ -0,0 +1,61 @@
+"""Measures the throughput of `imglab.bulk` generating signed URLs with an increasing number of worker processes
+
+Usage:
+    python benchmarks/bulk_scaling.py [--urls N] [--max-workers N] [--chunksize N] [--srcset]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import imglab  # noqa: E402
+from imglab import bulk  # noqa: E402
+
+SOURCE = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+PARAMS = {"width": 400, "height": 300, "format": "webp"}
+
+
+def run(count, workers, chunksize, srcset=False):
+    paths = ("products/%d/image.jpeg" % i for i in range(count))
+    function = bulk.srcsets if srcset else bulk.urls
+
+    started = time.perf_counter()
+    for _ in function(SOURCE, paths, workers=workers, chunksize=chunksize, **PARAMS):
+        pass
+
+    return count / (time.perf_counter() - started)
+
+
+def serial(count, srcset=False):
+    function = imglab.srcset if srcset else imglab.url
+
+    started = time.perf_counter()
+    for i in range(count):
+        function(SOURCE, "products/%d/image.jpeg" % i, **PARAMS)
+
+    return count / (time.perf_counter() - started)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=int, default=200000, help="number of paths to generate (default: 200000)")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="maximum number of workers")
+    parser.add_argument("--chunksize", type=int, default=bulk.DEFAULT_CHUNKSIZE, help="paths per task")
+    parser.add_argument("--srcset", action="store_true", help="generate srcsets instead of URLs")
+    args = parser.parse_args(argv)
+
+    unit = "srcsets" if args.srcset else "URLs"
+    baseline = serial(args.urls, args.srcset)
+    print("%-10s %14s %8s" % ("workers", "%s/s" % unit, "speedup"))
+    print("%-10s %14.0f %8.2f" % ("serial", baseline, 1.0))
+
+    for workers in range(1, args.max_workers + 1):
+        throughput = run(args.urls, workers, args.chunksize, args.srcset)
+        print("%-10d %14.0f %8.2f" % (workers, throughput, throughput / baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Measures the cold start cost of importing imglab using `python -X importtime` in fresh interpreters
+
+Usage:
+    python benchmarks/import_time.py [--runs N] [--statement CODE] [--top N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(statement):
+    """Returns a dict with the cumulative import time in microseconds of every module imported by the statement"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="number of fresh interpreters (default: 20)")
+    parser.add_argument("--statement", default="import imglab", help="code to measure (default: 'import imglab')")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest modules to show (default: 10)")
+    args = parser.parse_args(argv)
+
+    runs = [measure(args.statement) for _ in range(args.runs)]
+    totals = [run.get("imglab", 0) for run in runs]
+
+    median, minimum = statistics.median(totals) / 1000, min(totals) / 1000
+
+    print("statement: %s" % args.statement)
+    print("imglab cumulative import time: median %.2f ms, min %.2f ms" % (median, minimum))
+    print()
+    print("%-40s %12s" % ("module", "median ms"))
+
+    modules = {module for run in runs for module in run}
+    medians = {module: statistics.median(run.get(module, 0) for run in runs) for module in modules}
+
+    for module in sorted(medians, key=medians.get, reverse=True)[: args.top]:
+        print("%-40s %12.2f" % (module, medians[module] / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Measures the memory allocated by imglab scenarios and bulk runs using tracemalloc, optionally comparing it with a
+stored JSON baseline
+
+Usage:
+    python benchmarks/memory.py [--calls N] [--urls N] [--workers N] [--scenario NAME ...] [--save PATH]
+                                [--compare PATH] [--tolerance RATIO] [--max-bytes-per-url BYTES]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+
+from scenarios import SCENARIOS, SECURE_SOURCE
+
+import imglab
+from imglab import bulk
+
+FILTERS = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+
+
+def measure(function, calls):
+    """Returns the peak bytes allocated by a single call of a function, and the bytes and objects retained per call
+    when its results are kept alive"""
+    function()
+
+    peak_bytes = _peak(function)
+
+    results = [None] * calls
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(FILTERS)
+
+    for i in range(calls):
+        results[i] = function()
+
+    after = tracemalloc.take_snapshot().filter_traces(FILTERS)
+    tracemalloc.stop()
+
+    statistics = after.compare_to(before, "filename")
+
+    return {
+        "peak_bytes": peak_bytes,
+        "retained_bytes": sum(stat.size_diff for stat in statistics) / calls,
+        "retained_objects": sum(stat.count_diff for stat in statistics) / calls,
+    }
+
+
+def measure_bulk(count, workers):
+    """Returns the peak bytes per URL of generating a list of signed URLs serially, and of streaming them with
+    `imglab.bulk` (as seen by the main process)"""
+    params = {"width": 400, "height": 300, "format": "webp"}
+
+    def serial():
+        return imglab.urls(SECURE_SOURCE, _paths(count), **params)
+
+    def stream():
+        for _ in bulk.urls(SECURE_SOURCE, _paths(count), workers=workers, **params):
+            pass
+
+    return {
+        "bulk_serial": {"bytes_per_url": _peak(serial) / count},
+        "bulk_stream": {"bytes_per_url": _peak(stream) / count},
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Returns the names of the measurements allocating more bytes than the tolerance allows over the baseline"""
+    regressions = []
+
+    for name, result in results.items():
+        for metric, value in result.items():
+            if not metric.endswith("bytes") and metric != "bytes_per_url":
+                continue
+
+            expected = baseline.get(name, {}).get(metric)
+            if expected is not None and value > expected * (1 + tolerance):
+                regressions.append("%s.%s" % (name, metric))
+
+    return regressions
+
+
+def _peak(function):
+    gc.collect()
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak
+
+
+def _paths(count):
+    return ("products/%d/image.jpeg" % i for i in range(count))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=10000, help="calls per scenario (default: 10000)")
+    parser.add_argument("--urls", type=int, default=1000000, help="URLs per bulk run, 0 to skip (default: 1000000)")
+    parser.add_argument("--workers", type=int, default=None, help="workers of the bulk run (default: CPU count)")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="scenario to run (default: all)")
+    parser.add_argument("--save", metavar="PATH", help="store the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results with a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed allocation growth (default: 0.10)")
+    parser.add_argument("--max-bytes-per-url", type=float, help="fail if a bulk run exceeds these bytes per URL")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name in args.scenario or SCENARIOS:
+        results[name] = measure(SCENARIOS[name], args.calls)
+
+    print("%-20s %12s %16s %18s" % ("scenario", "peak bytes", "retained bytes", "retained objects"))
+    for name, result in results.items():
+        print(
+            "%-20s %12d %16.1f %18.2f"
+            % (name, result["peak_bytes"], result["retained_bytes"], result["retained_objects"])
+        )
+
+    if args.urls:
+        bulk_results = measure_bulk(args.urls, args.workers)
+        results.update(bulk_results)
+
+        print("\n%-20s %12s" % ("bulk (%d URLs)" % args.urls, "bytes/URL"))
+        for name, result in bulk_results.items():
+            print("%-20s %12.1f" % (name, result["bytes_per_url"]))
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"python": platform.python_version(), "results": results}, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file)["results"], args.tolerance)
+
+    if args.max_bytes_per_url is not None:
+        regressions += [
+            "%s.bytes_per_url" % name
+            for name, result in results.items()
+            if result.get("bytes_per_url", 0) > args.max_bytes_per_url
+        ]
+
+    if regressions:
+        print("\nAllocation regressions: %s" % ", ".join(regressions))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
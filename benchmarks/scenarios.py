@@ -0,0 +1,83 @@
+"""Realistic scenarios of the imglab hot path shared by the benchmark scripts
+
+Every scenario is a function without arguments generating a URL, a srcset or a helper value the way applications do.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import imglab  # noqa: E402
+from imglab import color, position, sequence  # noqa: E402
+
+SECURE_SOURCE = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+ON_PREMISES_SOURCE = imglab.Source("assets", host="imglab.net", https=False, port=8080, subdomains=False)
+
+
+def url():
+    return imglab.url("assets", "products/example.jpeg", width=500, height=600, format="webp")
+
+
+def url_signed():
+    return imglab.url(SECURE_SOURCE, "products/example.jpeg", width=500, height=600, format="webp")
+
+
+def url_watermark():
+    watermark = imglab.url("assets", "brand/logo.svg", width=100, format="png")
+
+    return imglab.url(
+        "assets",
+        "products/example.jpeg",
+        width=500,
+        watermark=watermark,
+        watermark_position=position("right", "bottom"),
+        watermark_width=100,
+    )
+
+
+def url_on_premises():
+    return imglab.url(ON_PREMISES_SOURCE, "products/example.jpeg", width=500, height=600, format="webp")
+
+
+def srcset_fixed_dpr():
+    return imglab.srcset("assets", "products/example.jpeg", width=500, height=600, format="webp")
+
+
+def srcset_fluid():
+    return imglab.srcset("assets", "products/example.jpeg", width=range(100, 8192), format="webp")
+
+
+def picture():
+    return imglab.picture(SECURE_SOURCE, "products/example.jpeg", width=range(400, 1600, 400), sizes="100vw")
+
+
+def color_components():
+    return color(255, 128, 122, 64)
+
+
+def color_name():
+    return color("lightslategray")
+
+
+def position_directions():
+    return position("left", "bottom")
+
+
+def sequence_default():
+    return sequence(100, 8192)
+
+
+SCENARIOS = {
+    "url": url,
+    "url_signed": url_signed,
+    "url_watermark": url_watermark,
+    "url_on_premises": url_on_premises,
+    "srcset_fixed_dpr": srcset_fixed_dpr,
+    "srcset_fluid": srcset_fluid,
+    "picture": picture,
+    "color_components": color_components,
+    "color_name": color_name,
+    "position": position_directions,
+    "sequence": sequence_default,
+}
@@ -0,0 +1,116 @@
+"""Measures the throughput and latency of imglab scenarios, optionally comparing them with a stored JSON baseline
+
+Usage:
+    python benchmarks/suite.py [--duration SECONDS] [--scenario NAME ...] [--save PATH] [--compare PATH]
+                               [--tolerance RATIO]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from scenarios import SCENARIOS
+
+BATCH_SIZE = 100
+WARMUP_CALLS = 1000
+
+
+def measure(function, duration):
+    """Returns the operations per second and the p50 and p99 latencies in microseconds of a function
+
+    Half of the duration is used to measure the throughput calling the function in batches, and the other half to
+    time every call individually.
+    """
+    for _ in range(WARMUP_CALLS):
+        function()
+
+    calls = 0
+    started = time.perf_counter()
+    deadline = started + duration / 2
+    while True:
+        for _ in range(BATCH_SIZE):
+            function()
+        calls += BATCH_SIZE
+
+        finished = time.perf_counter()
+        if finished >= deadline:
+            break
+
+    samples = []
+    deadline = time.perf_counter() + duration / 2
+    while time.perf_counter() < deadline:
+        call_started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - call_started)
+
+    samples.sort()
+
+    return {
+        "ops_per_sec": calls / (finished - started),
+        "p50_us": _percentile(samples, 0.50) * 1000000,
+        "p99_us": _percentile(samples, 0.99) * 1000000,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Returns a dict with the relative throughput change of every scenario in the baseline and the names of the
+    scenarios slower than the tolerance allows"""
+    changes, regressions = {}, []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        changes[name] = result["ops_per_sec"] / baseline[name]["ops_per_sec"] - 1
+        if changes[name] < -tolerance:
+            regressions.append(name)
+
+    return changes, regressions
+
+
+def _percentile(samples, quantile):
+    return samples[min(len(samples) - 1, int(quantile * len(samples)))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=1.0, help="seconds per scenario (default: 1.0)")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="scenario to run (default: all)")
+    parser.add_argument("--save", metavar="PATH", help="store the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results with a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed throughput loss (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+
+    results = {}
+    for name in args.scenario or SCENARIOS:
+        results[name] = measure(SCENARIOS[name], args.duration)
+
+    changes, regressions = compare(results, baseline, args.tolerance)
+
+    print("%-20s %12s %10s %10s %10s" % ("scenario", "ops/s", "p50 us", "p99 us", "change"))
+    for name, result in results.items():
+        change = "%+.1f%%" % (changes[name] * 100) if name in changes else "-"
+        values = (name, result["ops_per_sec"], result["p50_us"], result["p99_us"], change)
+        print("%-20s %12.0f %10.2f %10.2f %10s" % values)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"python": platform.python_version(), "results": results}, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+    if regressions:
+        print("\nRegressions over %.0f%%: %s" % (args.tolerance * 100, ", ".join(regressions)))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
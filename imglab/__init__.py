@@ -1,12 +1,106 @@
-from .source import Source
-from .color import color
-from .position import position
-from .sequence import sequence
-from .url import url
-from .srcset import srcset
+import sys
+import types
+from importlib import import_module
 
 from . import _version
 
 __version__ = _version.version
 
-__all__ = ["Source", "color", "position", "sequence", "url", "srcset"]
+__all__ = [
+    "Source",
+    "color",
+    "position",
+    "sequence",
+    "url",
+    "urls",
+    "srcset",
+    "srcset_iter",
+    "picture",
+    "Template",
+    "Layout",
+    "Cache",
+    "SignedCache",
+    "Ladder",
+    "expires",
+    "parse",
+    "verify",
+    "verify_many",
+]
+
+# Public attributes are imported on first access (PEP 562), so `import imglab` does not pay for modules like
+# `urllib.parse` or `hmac` until they are needed.
+_LAZY_ATTRIBUTES = {
+    "Source": (".source", "Source"),
+    "color": (".color", "color"),
+    "position": (".position", "position"),
+    "sequence": (".sequence", "sequence"),
+    "url": (".url", "url"),
+    "urls": (".urls", "urls"),
+    "srcset": (".srcset", "srcset"),
+    "srcset_iter": (".srcset", "srcset_iter"),
+    "picture": (".picture", "picture"),
+    "Template": (".template", "Template"),
+    "Layout": (".layout", "Layout"),
+    "Cache": (".cache", "Cache"),
+    "SignedCache": (".cache", "SignedCache"),
+    "Ladder": (".ladder", "Ladder"),
+    "expires": (".expires", "expires"),
+    "parse": (".parse", "parse"),
+    "verify": (".verify", "verify"),
+    "verify_many": (".verify", "verify_many"),
+    "params": (".params", None),
+    "sources": (".sources", None),
+    "negotiation": (".negotiation", None),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    module = import_module(module_name, __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+class _Package(types.ModuleType):
+    def __setattr__(self, name, value):
+        # Importing a submodule binds it to the package, which would shadow the function with the same name (like
+        # `imglab.url` or `imglab.srcset`), so the function is bound instead as it was with eager imports.
+        if isinstance(value, types.ModuleType) and name in _LAZY_ATTRIBUTES:
+            attribute = _LAZY_ATTRIBUTES[name][1]
+            value = value if attribute is None else getattr(value, attribute)
+
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+if sys.version_info < (3, 7):
+    from .source import Source  # noqa: F401, E402
+    from .color import color  # noqa: F401, E402
+    from .position import position  # noqa: F401, E402
+    from .sequence import sequence  # noqa: F401, E402
+    from .url import url  # noqa: F401, E402
+    from .urls import urls  # noqa: F401, E402
+    from .srcset import srcset, srcset_iter  # noqa: F401, E402
+    from .picture import picture  # noqa: F401, E402
+    from .template import Template  # noqa: F401, E402
+    from .layout import Layout  # noqa: F401, E402
+    from .cache import Cache, SignedCache  # noqa: F401, E402
+    from .ladder import Ladder  # noqa: F401, E402
+    from .expires import expires  # noqa: F401, E402
+    from .parse import parse  # noqa: F401, E402
+    from .verify import verify, verify_many  # noqa: F401, E402
+
+    from . import params  # noqa: F401, E402
+    from . import sources  # noqa: F401, E402
+    from . import negotiation  # noqa: F401, E402
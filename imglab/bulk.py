@@ -0,0 +1,199 @@
+"""Bulk generation of URLs and srcsets using a pool of worker processes (Python 3.7 or newer)
+
+The source and the shared parameters (compiled into a layout for srcsets) are sent once to every worker process
+through the pool initializer, and paths are sent in chunks, keeping a bounded number of chunks in flight so results
+are streamed while the input is consumed.
+"""
+
+import os
+import sys
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from .layout import Layout
+from .srcset import srcset as _srcset
+from .template import Template
+from .url import _source
+from .urls import _url
+
+DEFAULT_CHUNKSIZE = 1000
+
+Error = namedtuple("Error", ["message"])
+
+_worker_source = None
+_worker_state = None
+_worker_return_errors = False
+
+
+def urls(source, paths, workers=None, chunksize=DEFAULT_CHUNKSIZE, ordered=True, return_errors=False, **params):
+    """Returns an iterator of formatted URL strings for a source, generated in parallel by worker processes
+
+    :Examples:
+        >>> from imglab import bulk
+        >>> list(bulk.urls("assets", ["example.jpeg", "example.png"], workers=2, width=500))
+        ['https://assets.imglab-cdn.net/example.jpeg?width=500', 'https://assets.imglab-cdn.net/example.png?width=500']
+
+    :param source: A source name as string or :class:`imglab.Source` object
+    :type source: str, class:`imglab.Source`
+    :param paths: An iterable with paths, or tuples with a path and a dict of parameters, as accepted by `imglab.urls`
+    :type paths: iterable
+    :param workers: The number of worker processes, defaults to the number of CPUs
+    :type workers: int, optional
+    :param chunksize: The number of paths sent to a worker process in every task, defaults to 1000
+    :type chunksize: int, optional
+    :param ordered: `True` to return URLs in the same order as `paths`, `False` to return tuples with the index of
+        the path and its URL as soon as they are generated, defaults to `True`
+    :type ordered: bool, optional
+    :param return_errors: `True` to return a :class:`imglab.bulk.Error` with the message of the ValueError raised
+        generating a URL instead of raising it, defaults to `False`
+    :type return_errors: bool, optional
+    :param params: The query parameters shared by all the URLs as a keyword argument list
+    :type params: list, optional
+    :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object
+    :raises RuntimeError: When running on Python 3.6
+    :return: An iterator with the generated URLs
+    :rtype: iterator
+    """
+    return _map(_urls_chunk, source, paths, workers, chunksize, ordered, return_errors, params)
+
+
+def srcsets(source, paths, workers=None, chunksize=DEFAULT_CHUNKSIZE, ordered=True, return_errors=False, **params):
+    """Returns an iterator of formatted srcset strings for a source, generated in parallel by worker processes
+
+    :Examples:
+        >>> from imglab import bulk
+        >>> list(bulk.srcsets("assets", ["example.jpeg"], workers=1, width=500, dpr=[1, 2]))
+        ['https://assets.imglab-cdn.net/example.jpeg?width=500&dpr=1 1x,\\nhttps://assets.imglab-cdn.net/example.jpeg?width=500&dpr=2 2x']
+
+    :param source: A source name as string or :class:`imglab.Source` object
+    :type source: str, class:`imglab.Source`
+    :param paths: An iterable with paths, or tuples with a path and a dict of parameters added to (or overriding) the
+        shared ones
+    :type paths: iterable
+    :param workers: The number of worker processes, defaults to the number of CPUs
+    :type workers: int, optional
+    :param chunksize: The number of paths sent to a worker process in every task, defaults to 1000
+    :type chunksize: int, optional
+    :param ordered: `True` to return srcsets in the same order as `paths`, `False` to return tuples with the index of
+        the path and its srcset as soon as they are generated, defaults to `True`
+    :type ordered: bool, optional
+    :param return_errors: `True` to return a :class:`imglab.bulk.Error` with the message of the ValueError raised
+        generating a srcset (like some params fluid combinations not allowed) instead of raising it, defaults to `False`
+    :type return_errors: bool, optional
+    :param params: The query parameters shared by all the srcsets as a keyword argument list
+    :type params: list, optional
+    :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object or some
+        params fluid combinations are not allowed
+    :raises RuntimeError: When running on Python 3.6
+    :return: An iterator with the generated srcsets
+    :rtype: iterator
+    """
+    state = (Layout(**params), params)
+
+    return _map(_srcsets_chunk, source, paths, workers, chunksize, ordered, return_errors, state)
+
+
+def _map(function, source, paths, workers, chunksize, ordered, return_errors, state):
+    # Pool initializers (used to send the source and the shared params once to every worker) require Python 3.7
+    if sys.version_info < (3, 7):
+        raise RuntimeError("Bulk generation requires Python 3.7 or later.")
+
+    source = _source(source)
+    workers = workers or os.cpu_count() or 1
+
+    if chunksize < 1:
+        raise ValueError("Invalid chunksize. A positive integer is expected.")
+
+    return _stream(function, source, paths, workers, chunksize, ordered, (source, state, return_errors))
+
+
+def _stream(function, source, paths, workers, chunksize, ordered, initargs):
+    chunks = _chunks(paths, chunksize)
+    max_pending = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize, initargs=initargs) as executor:
+        if ordered:
+            pending = deque(executor.submit(function, *chunk) for chunk in islice(chunks, max_pending))
+
+            while pending:
+                _, results = pending.popleft().result()
+
+                for chunk in islice(chunks, 1):
+                    pending.append(executor.submit(function, *chunk))
+
+                yield from results
+        else:
+            pending = set(executor.submit(function, *chunk) for chunk in islice(chunks, max_pending))
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for chunk in islice(chunks, len(done)):
+                    pending.add(executor.submit(function, *chunk))
+
+                for future in done:
+                    start, results = future.result()
+
+                    yield from enumerate(results, start)
+
+
+def _chunks(paths, chunksize):
+    paths = iter(paths)
+    start = 0
+
+    while True:
+        chunk = list(islice(paths, chunksize))
+
+        if not chunk:
+            return
+
+        yield start, chunk
+
+        start += len(chunk)
+
+
+def _initialize(source, state, return_errors):
+    global _worker_source, _worker_state, _worker_return_errors
+
+    _worker_source = source
+    _worker_state = state
+    _worker_return_errors = return_errors
+
+
+def _urls_chunk(start, paths):
+    template = Template(_worker_source, **_worker_state)
+    generated = {}
+
+    return start, _generate(lambda path: _url(template, generated, path), paths)
+
+
+def _srcsets_chunk(start, paths):
+    layout, params = _worker_state
+
+    return start, _generate(lambda path: _srcset_for_path(layout, params, path), paths)
+
+
+def _generate(function, paths):
+    if not _worker_return_errors:
+        return [function(path) for path in paths]
+
+    # Errors are returned in place of their results, so a single invalid path doesn't discard the whole chunk
+    results = []
+
+    for path in paths:
+        try:
+            results.append(function(path))
+        except ValueError as error:
+            results.append(Error(str(error)))
+
+    return results
+
+
+def _srcset_for_path(layout, params, path):
+    if isinstance(path, str):
+        return layout.srcset(_worker_source, path)
+
+    path, path_params = path
+
+    return _srcset(_worker_source, path, **{**params, **path_params})
@@ -0,0 +1,246 @@
+import random
+import time
+from math import log
+
+from .expires import _expires, _validate as _validate_expires
+from .srcset import srcset as _srcset
+from .url import _source, _url_for_source
+from .utils import url as url_utils
+from .utils.cache import LRU, freeze
+
+
+class Cache:
+    """A class to memoize generated URLs and srcsets in a bounded cache, evicting the least recently used ones
+
+    Entries are keyed by the source, the normalized path and the normalized parameters. Sources are compared by all
+    their settings, including the secure key and salt, so a source with rotated keys never gets a URL signed with the
+    previous ones.
+
+    :Examples:
+        >>> import imglab
+        >>> cache = imglab.Cache(maxsize=100)
+        >>> cache.url("assets", "example.jpeg", width=500)
+        'https://assets.imglab-cdn.net/example.jpeg?width=500'
+        >>> cache.url("assets", "/example.jpeg", width=500)
+        'https://assets.imglab-cdn.net/example.jpeg?width=500'
+        >>> cache.cache_info()
+        CacheInfo(hits=1, misses=1, maxsize=100, currsize=1)
+
+    :param maxsize: The maximum number of URLs and srcsets stored, defaults to 1024
+    :type maxsize: int, optional
+    :raises ValueError: When maxsize is not a positive integer
+    """
+
+    DEFAULT_MAXSIZE = 1024
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self._lru = LRU(maxsize)
+
+    def url(self, source, path, **params):
+        """Returns a formatted URL string for a source, with a path and optional arguments, using the cache
+
+        :param source: A source name as string or :class:`imglab.Source` object
+        :type source: str, class:`imglab.Source`
+        :param path: The path where the resource is located
+        :type path: str
+        :param params: The query parameters that we want to use as a keyword argument list
+        :type params: list, optional
+        :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object
+        :return: A string with the generated URL
+        :rtype: str
+        """
+        source = _source(source)
+
+        return self._get_or_set("url", source, path, params, lambda: _url_for_source(source, path, params))
+
+    def srcset(self, source, path, **params):
+        """Returns a formatted srcset string for a source, with a path and optional arguments, using the cache
+
+        :param source: A source name as string or :class:`imglab.Source` object
+        :type source: str, class:`imglab.Source`
+        :param path: The path where the resource is located
+        :type path: str
+        :param params: The query parameters that we want to use as keyword argument list
+        :type params: list, optional
+        :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object or some
+            params fluid combinations are not allowed
+        :return: A string with the generated srcset value
+        :rtype: str
+        """
+        source = _source(source)
+
+        return self._get_or_set("srcset", source, path, params, lambda: _srcset(source, path, **params))
+
+    def cache_info(self):
+        """Returns the statistics of the cache
+
+        :return: A named tuple with hits, misses, maxsize and currsize values
+        :rtype: class:`imglab.utils.cache.CacheInfo`
+        """
+        return self._lru.info()
+
+    def cache_clear(self):
+        """Removes all the entries of the cache and resets its statistics"""
+        self._lru.clear()
+
+    def _get_or_set(self, kind, source, path, params, function):
+        key = _key(kind, source, path, params)
+
+        if key is None:
+            return function()
+
+        return self._lru.get_or_set(key, function)
+
+
+class SignedCache:
+    """A class to memoize URLs and srcsets expiring after a time, generated with `expires` params rounded up to time
+    buckets
+
+    Every entry gets an `expires` param computed with `imglab.expires(expires_in, expires_bucket)`, so it is valid
+    during `expires_in` seconds at least. Entries are served until their bucket rolls over, and evicted afterwards.
+    Entries are also refreshed with the next bucket a little before that, with a probability growing as the rollover
+    gets closer and proportional to the time taken to generate them (XFetch), so concurrent callers do not regenerate
+    all the entries at the same time.
+
+    :Examples:
+        >>> import imglab
+        >>> source = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+        >>> cache = imglab.SignedCache(3600, 600, clock=lambda: 1464096368)
+        >>> url = cache.url(source, "example.jpeg", width=500)
+        >>> url == imglab.url(source, "example.jpeg", width=500, expires=1464100200)
+        True
+        >>> cache.url(source, "example.jpeg", width=500) == url
+        True
+
+    :param expires_in: The minimum number of seconds the generated URLs are valid
+    :type expires_in: int, float
+    :param expires_bucket: The number of seconds of the buckets used to round up the `expires` params
+    :type expires_bucket: int
+    :param maxsize: The maximum number of URLs and srcsets stored, defaults to 1024
+    :type maxsize: int, optional
+    :param beta: A factor to refresh entries earlier (greater than 1) or later (lower than 1), defaults to 1.0
+    :type beta: float, optional
+    :param clock: A function returning the current timestamp, defaults to `time.time`
+    :type clock: callable, optional
+    :raises ValueError: When maxsize is not a positive integer, expires_in is negative or expires_bucket is not a
+        positive integer
+    """
+
+    DEFAULT_MAXSIZE = 1024
+    DEFAULT_BETA = 1.0
+
+    def __init__(self, expires_in, expires_bucket, maxsize=DEFAULT_MAXSIZE, beta=DEFAULT_BETA, clock=time.time):
+        if expires_bucket is None:
+            raise ValueError("Invalid expires_bucket. A positive integer number of seconds is expected.")
+
+        _validate_expires(expires_in, expires_bucket)
+
+        self._lru = LRU(maxsize)
+        self._expires_in = expires_in
+        self._expires_bucket = expires_bucket
+        self._beta = beta
+        self._clock = clock
+        self._evict_at = float("-inf")
+
+    def url(self, source, path, **params):
+        """Returns a formatted URL string for a source, with a path and optional arguments, using the cache
+
+        :param source: A source name as string or :class:`imglab.Source` object
+        :type source: str, class:`imglab.Source`
+        :param path: The path where the resource is located
+        :type path: str
+        :param params: The query parameters that we want to use as a keyword argument list, without `expires`
+        :type params: list, optional
+        :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object or `expires`
+            is specified
+        :return: A string with the generated URL
+        :rtype: str
+        """
+        _validate_params(params)
+        source = _source(source)
+
+        def generate(expires):
+            return _url_for_source(source, path, {**params, **{"expires": expires}})
+
+        return self._get_or_refresh("url", source, path, params, generate)
+
+    def srcset(self, source, path, **params):
+        """Returns a formatted srcset string for a source, with a path and optional arguments, using the cache
+
+        :param source: A source name as string or :class:`imglab.Source` object
+        :type source: str, class:`imglab.Source`
+        :param path: The path where the resource is located
+        :type path: str
+        :param params: The query parameters that we want to use as keyword argument list, without `expires`
+        :type params: list, optional
+        :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object, `expires` is
+            specified or some params fluid combinations are not allowed
+        :return: A string with the generated srcset value
+        :rtype: str
+        """
+        _validate_params(params)
+        source = _source(source)
+
+        def generate(expires):
+            return _srcset(source, path, **{**params, **{"expires": expires}})
+
+        return self._get_or_refresh("srcset", source, path, params, generate)
+
+    def cache_info(self):
+        """Returns the statistics of the cache
+
+        :return: A named tuple with hits, misses, maxsize and currsize values
+        :rtype: class:`imglab.utils.cache.CacheInfo`
+        """
+        return self._lru.info()
+
+    def cache_clear(self):
+        """Removes all the entries of the cache and resets its statistics"""
+        self._lru.clear()
+
+    def _get_or_refresh(self, kind, source, path, params, function):
+        now = self._clock()
+
+        if now >= self._evict_at:
+            self._evict(now)
+
+        key = _key(kind, source, path, params)
+        entry = None if key is None else self._lru.get(key)
+
+        if entry is not None and not self._should_refresh(entry, now):
+            return entry[0]
+
+        # Entries refreshed before their rollover get the `expires` of the next bucket
+        expires = _expires(self._expires_in, self._expires_bucket, now if entry is None else max(now, entry[1]))
+
+        start = time.perf_counter()
+        value = function(expires)
+        delta = time.perf_counter() - start
+
+        if key is not None:
+            self._lru.set(key, (value, expires - self._expires_in, delta))
+
+        return value
+
+    def _should_refresh(self, entry, now):
+        _, rollover, delta = entry
+
+        return now - delta * self._beta * log(1.0 - random.random()) >= rollover
+
+    def _evict(self, now):
+        self._lru.evict(lambda key, entry: entry[1] <= now)
+        self._evict_at = _expires(self._expires_in, self._expires_bucket, now) - self._expires_in
+
+
+def _validate_params(params):
+    # The expiration of signed URLs is set by the cache, so a different one would be silently replaced
+    if "expires" in params:
+        raise ValueError("Invalid expires param. The expiration is set by expires_in and expires_bucket of the cache.")
+
+
+def _key(kind, source, path, params):
+    try:
+        return (kind, source, url_utils.normalize_path(path), freeze(url_utils.normalize_params(params)))
+    except TypeError:
+        return None
+
@@ -0,0 +1,243 @@
+"""Command line interface streaming imglab URLs or srcsets for paths read from files or the standard input
+
+Every input line is a path, or a JSON object with a `path` and optional `params` added to (or overriding) the shared
+ones. Lines are read, generated and written one at a time (or in bounded chunks when using worker processes), so
+inputs of any size are processed with constant memory.
+
+Usage:
+    python -m imglab --source assets --param width=500 < paths.txt
+    python -m imglab --source assets --srcset --params '{"width": [400, 800]}' --format jsonl paths.jsonl
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from itertools import tee
+
+from .layout import Layout
+from .source import Source
+from .srcset import srcset
+from .template import Template
+
+FORMATS = ["tsv", "csv", "jsonl"]
+INPUTS = ["auto", "lines", "jsonl"]
+
+INVALID_LINE_MESSAGE = "a JSON object with a path string and a params object is expected"
+
+
+def main(argv=None):
+    """Runs the command line interface with a list of arguments, returning the exit status
+
+    :param argv: The command line arguments, defaults to `sys.argv[1:]`
+    :type argv: list, optional
+    :return: 0 when all the lines are generated, 1 when some lines are invalid, 2 when arguments are invalid
+    :rtype: int
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    try:
+        source = Source(
+            args.source,
+            host=args.host,
+            https=args.https,
+            port=args.port,
+            secure_key=args.secure_key,
+            secure_salt=args.secure_salt,
+            subdomains=args.subdomains,
+            canonical=args.canonical,
+        )
+        params = _params(args)
+
+        if args.chunksize < 1:
+            raise ValueError("Invalid chunksize. A positive integer is expected.")
+
+        generate = _generator(source, params, args)
+    except ValueError as error:
+        parser.error(str(error))
+
+    invalid_lines = 0
+
+    def report(number, message=INVALID_LINE_MESSAGE):
+        nonlocal invalid_lines
+        invalid_lines += 1
+        print("%s: line %d: %s" % (parser.prog, number, message), file=sys.stderr)
+
+    items = _items(_lines(args.files), args.input, report)
+    write = _writer(sys.stdout, args.format, "srcset" if args.srcset else "url")
+
+    try:
+        for item, result in generate(items, report):
+            write(item if isinstance(item, str) else item[0], result)
+    except BrokenPipeError:
+        # The reader of the output was closed (like `head`), so the remaining output is discarded
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except ValueError as error:
+        sys.stdout.flush()
+        print("%s: error: %s" % (parser.prog, error), file=sys.stderr)
+        return 1
+
+    return 1 if invalid_lines else 0
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="imglab",
+        description="Streams imglab URLs or srcsets for paths read from files or the standard input.",
+    )
+    parser.add_argument("files", nargs="*", metavar="FILE", help="input files, '-' or none for the standard input")
+    parser.add_argument("--source", required=True, help="the name of the source")
+    parser.add_argument("--host", default=Source.DEFAULT_HOST, help="the host of the source (default: %(default)s)")
+    parser.add_argument("--port", type=int, help="the port of the source")
+    parser.add_argument("--http", dest="https", action="store_false", help="use http instead of https")
+    parser.add_argument("--no-subdomains", dest="subdomains", action="store_false", help="disable subdomains")
+    parser.add_argument("--secure-key", default=os.environ.get("IMGLAB_SECURE_KEY"), help="or $IMGLAB_SECURE_KEY")
+    parser.add_argument("--secure-salt", default=os.environ.get("IMGLAB_SECURE_SALT"), help="or $IMGLAB_SECURE_SALT")
+    parser.add_argument("--canonical", action="store_true", help="canonicalize the params of generated URLs")
+    parser.add_argument("-p", "--param", action="append", default=[], metavar="KEY=VALUE", help="a shared param")
+    parser.add_argument("--params", default="{}", metavar="JSON", help="shared params as a JSON object")
+    parser.add_argument("--srcset", action="store_true", help="generate srcsets instead of URLs")
+    parser.add_argument("--format", choices=FORMATS, default="tsv", help="output format (default: %(default)s)")
+    parser.add_argument("--input", choices=INPUTS, default="auto", help="input format (default: %(default)s)")
+    parser.add_argument("--workers", type=int, help="generate using a pool of worker processes (Python 3.7 or newer)")
+    parser.add_argument("--chunksize", type=int, default=1000, help="paths per worker task (default: %(default)s)")
+
+    return parser
+
+
+def _params(args):
+    try:
+        params = json.loads(args.params)
+    except ValueError:
+        raise ValueError("Invalid params. A JSON object is expected.")
+
+    if not isinstance(params, dict):
+        raise ValueError("Invalid params. A JSON object is expected.")
+
+    for param in args.param:
+        key, separator, value = param.partition("=")
+
+        if not separator:
+            raise ValueError("Invalid param %s. A KEY=VALUE string is expected." % param)
+
+        params[key] = value
+
+    return params
+
+
+def _generator(source, params, args):
+    if args.workers:
+        if sys.version_info < (3, 7):
+            raise ValueError("Invalid workers. Worker processes require Python 3.7 or later.")
+
+        from . import bulk
+
+        function = bulk.srcsets if args.srcset else bulk.urls
+
+        def generate(items, report):
+            items, generated_items = tee(items)
+            paths = (item for _, item in generated_items)
+            results = function(source, paths, args.workers, args.chunksize, True, True, **params)
+
+            for (number, item), result in zip(items, results):
+                if isinstance(result, bulk.Error):
+                    report(number, result.message)
+                    continue
+
+                yield item, result
+
+        return generate
+
+    if args.srcset:
+        layout = Layout(**params)
+
+        def generate_item(item):
+            if isinstance(item, str):
+                return layout.srcset(source, item)
+            else:
+                return srcset(source, item[0], **{**params, **item[1]})
+
+    else:
+        template = Template(source, **params)
+
+        def generate_item(item):
+            if isinstance(item, str):
+                return template(item)
+            else:
+                return template(item[0], **item[1])
+
+    def generate(items, report):
+        for number, item in items:
+            try:
+                result = generate_item(item)
+            except ValueError as error:
+                report(number, str(error))
+                continue
+
+            yield item, result
+
+    return generate
+
+
+def _lines(files):
+    for name in files or ["-"]:
+        if name == "-":
+            yield from enumerate(sys.stdin, 1)
+        else:
+            with open(name, encoding="utf-8") as file:
+                yield from enumerate(file, 1)
+
+
+def _items(lines, input_format, report):
+    for number, line in lines:
+        line = line.rstrip("\r\n")
+
+        if not line.strip():
+            continue
+
+        if input_format == "jsonl" or (input_format == "auto" and line.lstrip().startswith("{")):
+            item = _json_item(line)
+
+            if item is None:
+                report(number)
+                continue
+
+            yield number, item
+        else:
+            yield number, line
+
+
+def _json_item(line):
+    try:
+        value = json.loads(line)
+    except ValueError:
+        return None
+
+    if not isinstance(value, dict) or not isinstance(value.get("path"), str):
+        return None
+
+    params = value.get("params", {})
+
+    if not isinstance(params, dict):
+        return None
+
+    return (value["path"], params) if params else value["path"]
+
+
+def _writer(output, output_format, kind):
+    if output_format == "jsonl":
+
+        def write(path, result):
+            output.write(json.dumps({"path": path, kind: result}, ensure_ascii=False))
+            output.write("\n")
+
+    else:
+        writer = csv.writer(output, dialect="excel-tab" if output_format == "tsv" else "excel", lineterminator="\n")
+
+        def write(path, result):
+            writer.writerow([path, result.replace(",\n", ", ")])
+
+    return write
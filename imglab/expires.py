@@ -0,0 +1,50 @@
+import time
+from math import ceil
+
+
+def expires(expires_in, expires_bucket=None, now=None):
+    """Returns an expiration timestamp for URLs valid during a number of seconds, rounded up to a time bucket
+
+    Without a bucket, every call returns a different timestamp (and a different signature). Rounding the timestamp up
+    to the next multiple of a bucket makes every URL generated during the same bucket identical, so they can be cached
+    by applications and CDNs, while all of them are valid during `expires_in` seconds at least.
+
+    :Examples:
+        >>> import imglab
+        >>> imglab.expires(3600, now=1464096368)
+        1464099968
+        >>> imglab.expires(3600, 600, now=1464096368)
+        1464100200
+        >>> imglab.expires(3600, 600, now=1464096599)
+        1464100200
+        >>> imglab.url("assets", "example.jpeg", width=500, expires=imglab.expires(3600, 600, now=1464096368))
+        'https://assets.imglab-cdn.net/example.jpeg?width=500&expires=1464100200'
+
+    :param expires_in: The minimum number of seconds the URL is valid
+    :type expires_in: int, float
+    :param expires_bucket: The number of seconds of the buckets used to round up the timestamp, defaults to None
+    :type expires_bucket: int, optional
+    :param now: The timestamp of the current time, defaults to the current time
+    :type now: int, float, optional
+    :raises ValueError: When expires_in is negative or expires_bucket is not a positive integer
+    :return: An expiration timestamp as integer, to be used as `expires` param
+    :rtype: int
+    """
+    _validate(expires_in, expires_bucket)
+
+    return _expires(expires_in, expires_bucket, time.time() if now is None else now)
+
+
+def _validate(expires_in, expires_bucket):
+    if not isinstance(expires_in, (int, float)) or isinstance(expires_in, bool) or expires_in < 0:
+        raise ValueError("Invalid expires_in. A non negative number of seconds is expected.")
+
+    if expires_bucket is not None and (type(expires_bucket) is not int or expires_bucket < 1):
+        raise ValueError("Invalid expires_bucket. A positive integer number of seconds is expected.")
+
+
+def _expires(expires_in, expires_bucket, now):
+    if expires_bucket is None:
+        return int(ceil(now + expires_in))
+    else:
+        return (int(now + expires_in) // expires_bucket + 1) * expires_bucket
@@ -0,0 +1,173 @@
+from bisect import bisect_left
+from collections import namedtuple
+
+from .sequence import cached_sequence, DEFAULT_SIZE as SEQUENCE_DEFAULT_SIZE
+
+LadderInfo = namedtuple("LadderInfo", ["requested", "snapped", "collapsed"])
+
+
+class Ladder:
+    """A class to represent a ladder of allowed image widths, snapping requested sizes to the next step
+
+    Arbitrary widths requested by clients (like 437 or 441) are rounded up to the next step of the ladder, so they
+    share a single variant in CDNs and image servers. Widths larger than the last step are snapped to the last step.
+    Heights are scaled with the same ratio as widths, preserving the aspect ratio of the image, and they are snapped
+    to the ladder only when they are specified without a width.
+
+    Ladders created with `statistics=True` keep the distinct sizes requested and generated (up to `STATISTICS_MAXSIZE`
+    of each), so the number of variants collapsed by the ladder can be checked with :meth:`info`. Srcset candidates
+    are counted once, when a layout is compiled for the ladder.
+
+    :Examples:
+        >>> import imglab
+        >>> ladder = imglab.Ladder([320, 480, 640, 960], statistics=True)
+        >>> ladder.snap(437), ladder.snap(1200)
+        (480, 960)
+        >>> ladder.snap_params({"width": 441, "height": 300, "format": "webp"})
+        {'width': 480, 'height': 327, 'format': 'webp'}
+        >>> ladder.info()
+        LadderInfo(requested=1, snapped=1, collapsed=0)
+
+    :param widths: The allowed widths as an iterable of positive integers, like a list or an `imglab.sequence`
+    :type widths: iterable
+    :param statistics: A bool value specifying if the ladder keeps statistics of snapped sizes, defaults to `False`
+    :type statistics: bool, optional
+    :raises ValueError: When widths is empty or some width is not a positive integer
+    """
+
+    STATISTICS_MAXSIZE = 4096
+
+    __slots__ = ("_widths", "_statistics", "_requested", "_snapped")
+
+    def __init__(self, widths, statistics=False):
+        widths = tuple(sorted(set(widths)))
+
+        if not widths or not all(type(width) is int and width > 0 for width in widths):
+            raise ValueError("Invalid widths. A non empty iterable of positive integers is expected.")
+
+        self._widths = widths
+        self._statistics = statistics
+        self._requested = set()
+        self._snapped = set()
+
+    @classmethod
+    def sequence(cls, first, last, size=SEQUENCE_DEFAULT_SIZE):
+        """Returns a ladder with the widths of a geometric sequence, as generated by `imglab.sequence`
+
+        :Examples:
+            >>> import imglab
+            >>> imglab.Ladder.sequence(100, 8192, 4).widths
+            (100, 434, 1886, 8192)
+
+        :param first: The first width of the ladder as integer
+        :type first: int
+        :param last: The last width of the ladder as integer
+        :type last: int
+        :param size: The number of widths of the ladder as integer, defaults to 16
+        :type size: int, optional
+        :raises ValueError: When some width of the sequence is not a positive integer
+        :return: A ladder with the widths of the sequence
+        :rtype: class:`imglab.Ladder`
+        """
+        return cls(cached_sequence(first, last, size))
+
+    def __eq__(self, other):
+        if isinstance(other, Ladder):
+            return self._widths == other._widths
+        else:
+            return NotImplemented
+
+    def __hash__(self):
+        return hash(self._widths)
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, list(self._widths))
+
+    def __reduce__(self):
+        return (self.__class__, (self._widths, self._statistics))
+
+    @property
+    def widths(self):
+        """Returns the allowed widths of the ladder in ascending order
+
+        :return: A tuple with the widths of the ladder
+        :rtype: tuple
+        """
+        return self._widths
+
+    def snap(self, width):
+        """Returns the smallest width of the ladder that is not smaller than the specified width, or the largest width
+        of the ladder when all of them are smaller
+
+        :param width: A width as integer
+        :type width: int
+        :return: A width of the ladder
+        :rtype: int
+        """
+        widths = self._widths
+
+        return widths[min(bisect_left(widths, width), len(widths) - 1)]
+
+    def snap_params(self, params):
+        """Returns a dict of params with width and height values snapped to the ladder, preserving the aspect ratio
+
+        Params without integer width or height values (like missing or invalid values) are returned unchanged.
+
+        :param params: A dict with normalized params
+        :type params: dict
+        :return: A dict with the snapped params
+        :rtype: dict
+        """
+        width, height = _size(params.get("width")), _size(params.get("height"))
+
+        if width is not None:
+            snapped_width = self.snap(width)
+            snapped_height = None if height is None else max(round(height * snapped_width / width), 1)
+        elif height is not None:
+            snapped_width, snapped_height = None, self.snap(height)
+        else:
+            return params
+
+        if self._statistics:
+            self._count((width, height), (snapped_width, snapped_height))
+
+        snapped_params = dict(params)
+
+        if snapped_width is not None:
+            snapped_params["width"] = snapped_width
+
+        if snapped_height is not None:
+            snapped_params["height"] = snapped_height
+
+        return snapped_params
+
+    def info(self):
+        """Returns the number of distinct sizes requested and snapped by the ladder, and the number of variants
+        collapsed by snapping them, or zeros when the ladder doesn't keep statistics
+
+        :return: A named tuple with requested, snapped and collapsed values
+        :rtype: class:`imglab.ladder.LadderInfo`
+        """
+        requested, snapped = len(self._requested), len(self._snapped)
+
+        return LadderInfo(requested, snapped, requested - snapped)
+
+    def reset(self):
+        """Resets the statistics of the ladder"""
+        self._requested.clear()
+        self._snapped.clear()
+
+    def _count(self, requested, snapped):
+        # Distinct sizes are kept up to a maximum, so long running processes don't grow without bound
+        if len(self._requested) < self.STATISTICS_MAXSIZE:
+            self._requested.add(requested)
+            self._snapped.add(snapped)
+
+
+def _size(value):
+    if type(value) is int:
+        return value if value > 0 else None
+    elif isinstance(value, str) and value.isdigit():
+        return int(value) or None
+    else:
+        return None
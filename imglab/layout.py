@@ -0,0 +1,223 @@
+from collections import namedtuple
+
+from . import signature
+from .url import _base_url, _encode_params, _join_query, _prepare_params, _prepares_params, _source
+from .sequence import sequence
+from .utils import srcset as utils
+from .utils import url as url_utils
+
+DEFAULT_DPRS = [1, 2, 3, 4, 5, 6]
+DEFAULT_WIDTHS = sequence(100, 8192)
+
+Candidate = namedtuple("Candidate", ["url", "descriptor"])
+
+
+class Layout:
+    """A class to represent responsive image layouts, compiled once to generate srcsets for many paths
+
+    The srcset mode, the sequences of widths and qualities, and the query string of every candidate are computed when
+    the layout is created, so generating a srcset only needs to encode the path (and sign it for secure sources).
+
+    :Examples:
+        >>> import imglab
+        >>> layout = imglab.Layout(width=[400, 800], format="webp")
+        >>> print(layout.srcset("assets", "example.jpeg"))
+        https://assets.imglab-cdn.net/example.jpeg?width=400&format=webp 400w,
+        https://assets.imglab-cdn.net/example.jpeg?width=800&format=webp 800w
+        >>> layout.descriptors
+        ('400w', '800w')
+
+    :param params: The query parameters as keyword argument list, as expected by `imglab.srcset`
+    :type params: list, optional
+    :raises ValueError: When some params fluid combinations are not allowed
+    """
+
+    def __init__(self, **params):
+        params = url_utils.normalize_params(utils.normalize_params(params))
+        params, split_keys, split_values, descriptor = _resolve(params)
+
+        self._set_resolved((params, split_keys, tuple(split_values), descriptor))
+
+    @classmethod
+    def _for_formats(cls, formats, **params):
+        # The params are resolved once, sharing the sequences of widths and qualities between the layouts of every
+        # format, like the sources of a picture element.
+        params = url_utils.normalize_params(utils.normalize_params(params))
+        params, split_keys, split_values, descriptor = _resolve(params)
+        split_values = tuple(split_values)
+        layouts = []
+
+        for format in formats:
+            format_layout = cls.__new__(cls)
+            format_layout._set_resolved(({**params, **{"format": format}}, split_keys, split_values, descriptor))
+            layouts.append(format_layout)
+
+        return layouts
+
+    def _set_resolved(self, resolved):
+        self._resolved = resolved
+        self._candidates = tuple(_compile(*resolved))
+        self._prepared_candidates = {}
+
+    @property
+    def descriptors(self):
+        """Returns the descriptors of the srcset candidates, as widths like `400w` or pixel densities like `2x`
+
+        :return: A tuple with the descriptors of the candidates
+        :rtype: tuple
+        """
+        return tuple(descriptor for _, descriptor, _ in self._candidates)
+
+    def srcset(self, source, path):
+        """Returns a formatted srcset string for a source and a path
+
+        :param source: A source name as string or :class:`imglab.Source` object
+        :type source: str, class:`imglab.Source`
+        :param path: The path where the resource is located
+        :type path: str
+        :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object
+        :return: A string with the generated srcset value
+        :rtype: str
+        """
+        return ",\n".join("%s %s" % candidate for candidate in self.srcset_iter(source, path))
+
+    def srcset_iter(self, source, path):
+        """Returns a lazy iterator of srcset candidates for a source and a path
+
+        :param source: A source name as string or :class:`imglab.Source` object
+        :type source: str, class:`imglab.Source`
+        :param path: The path where the resource is located
+        :type path: str
+        :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object
+        :return: An iterator of :class:`imglab.srcset.Candidate` named tuples
+        :rtype: iterator
+        """
+        return self._candidates_for_source(_source(source), path)
+
+    def _candidates_for_source(self, source, path):
+        normalized_path = url_utils.normalize_path(path)
+
+        return self._candidates_for_path(source, normalized_path, *_path_settings(source, normalized_path))
+
+    def _candidates_for_path(self, source, normalized_path, base_url, signature_prefix):
+        for compiled in self._candidates_for_settings(source):
+            yield _candidate(source, normalized_path, base_url, signature_prefix, *compiled)
+
+    def _candidates_for_settings(self, source):
+        if not _prepares_params(source):
+            return self._candidates
+
+        key = (source.canonical, source.ladder)
+        candidates = self._prepared_candidates.get(key)
+
+        if candidates is None:
+            candidates = self._prepared_candidates[key] = tuple(_compile_prepared(source, *self._resolved))
+
+        return candidates
+
+
+def _candidate(source, normalized_path, base_url, signature_prefix, query, descriptor, params):
+    if params is not None:
+        query = _encode_params(source, normalized_path, params, signature_prefix)
+    elif signature_prefix is not None:
+        query = "%s&signature=%s" % (query, signature.generate_from_prefix(signature_prefix, query))
+
+    return Candidate(_join_query(base_url, query), descriptor)
+
+
+def _iter_candidates(source, path, params):
+    # One-off iterators compile every candidate only when it is requested, instead of compiling a whole layout
+    resolved = _resolve(url_utils.normalize_params(utils.normalize_params(params)))
+    normalized_path = url_utils.normalize_path(path)
+    path_settings = _path_settings(source, normalized_path)
+    compiled = _compile_prepared(source, *resolved) if _prepares_params(source) else _compile(*resolved)
+
+    return (_candidate(source, normalized_path, *path_settings, *candidate) for candidate in compiled)
+
+
+def _path_settings(source, normalized_path):
+    base_url = _base_url(source, normalized_path)
+    signature_prefix = signature.prefix(source, normalized_path) if source.is_secure() else None
+
+    return base_url, signature_prefix
+
+
+def _resolve(params):
+    width, height, dpr = [params.get(key) for key in ["width", "height", "dpr"]]
+
+    if _is_fluid(width):
+        if _is_fluid(dpr):
+            raise ValueError("dpr as %s is not allowed when width is list or range" % type(dpr).__name__)
+
+        return _resolve_width(params)
+    elif width or height:
+        if _is_fluid(height):
+            raise ValueError("height as %s is not allowed when width is not a list or range" % type(height).__name__)
+
+        return _resolve_dpr({**params, **{"dpr": _dprs(params)}})
+    else:
+        if _is_fluid(dpr):
+            raise ValueError("dpr as %s is not allowed without specifying width or height" % type(dpr).__name__)
+
+        return _resolve_width({**params, **{"width": DEFAULT_WIDTHS}})
+
+
+def _resolve_dpr(params):
+    return params, utils.SPLIT_DPR_KEYS, utils.split_values_dpr(params), "%dx"
+
+
+def _resolve_width(params):
+    return params, utils.SPLIT_WIDTH_KEYS, utils.split_values_width(params), "%dw"
+
+
+def _dprs(params):
+    if _is_fluid(params.get("dpr")):
+        return params["dpr"]
+    else:
+        return DEFAULT_DPRS
+
+
+def _is_fluid(value):
+    return isinstance(value, (list, range))
+
+
+def _compile(params, split_keys, split_values, descriptor):
+    if "signature" in params:
+        for values in split_values:
+            split_params = {**params, **{key: value for key, value in zip(split_keys, values) if key in params}}
+
+            yield None, descriptor % values[0], url_utils.normalize_params(split_params)
+
+        return
+
+    fragments = [url_utils.encode_param(key, value) for key, value in params.items()]
+    split_positions = [
+        (position, key, split_keys.index(key)) for position, key in enumerate(params) if key in split_keys
+    ]
+
+    for values in split_values:
+        for position, key, index in split_positions:
+            fragments[position] = url_utils.encode_param(key, "" if values[index] is None else values[index])
+
+        yield "&".join(fragments), descriptor % values[0], None
+
+
+def _compile_prepared(source, params, split_keys, split_values, descriptor):
+    # Params prepared by the source can change the width of candidates (snapped to a ladder), so width descriptors are
+    # taken from the prepared params and candidates collapsed into the same width are generated once.
+    descriptors = set()
+
+    for values in split_values:
+        split_params = {**params, **{key: value for key, value in zip(split_keys, values) if key in params}}
+        split_params = _prepare_params(source, url_utils.normalize_params(split_params))
+        split_descriptor = descriptor % (split_params["width"] if split_keys[0] == "width" else values[0])
+
+        if split_descriptor in descriptors:
+            continue
+
+        descriptors.add(split_descriptor)
+
+        if "signature" in split_params:
+            yield None, split_descriptor, split_params
+        else:
+            yield url_utils.encode_params(split_params), split_descriptor, None
@@ -0,0 +1,314 @@
+"""Helpers to generate a single URL for a request, instead of a srcset or a picture element, using the headers sent
+by browsers"""
+
+from functools import lru_cache
+from math import isfinite
+
+from .layout import _candidate, _path_settings
+from .picture import MIME_TYPES
+from .url import _source, _url_for_source
+from .utils import url as url_utils
+
+DPR_HINTS = ["sec-ch-dpr", "dpr"]
+WIDTH_HINTS = ["sec-ch-width", "width"]
+VIEWPORT_WIDTH_HINTS = ["sec-ch-viewport-width", "viewport-width"]
+
+DEFAULT_SIZES = "100vw"
+DEFAULT_VIEWPORT_WIDTH = 1024
+DEFAULT_DPR = 1
+
+DEFAULT_FORMATS = ["avif", "webp", "jpeg"]
+ACCEPT_CACHE_SIZE = 512
+
+
+def accept_format(accept, formats=DEFAULT_FORMATS):
+    """Returns the preferred format accepted by a browser, to be used as `format` param of imglab URLs
+
+    A format is accepted when its media type is explicitly listed in the `Accept` header of the request with a
+    quality greater than zero, choosing the one with the highest quality and, between them, the first one in the
+    preference list. The last format is used as fallback, so it should be supported by every browser (like `jpeg` or
+    `png`). Decisions are cached by header value, since browsers only send a small number of distinct values.
+
+    Responses with URLs selected by this function must include a `Vary: Accept` header.
+
+    :Examples:
+        >>> from imglab import negotiation
+        >>> negotiation.accept_format("image/avif,image/webp,image/apng,image/*,*/*;q=0.8")
+        'avif'
+        >>> negotiation.accept_format("image/webp,*/*")
+        'webp'
+        >>> negotiation.accept_format("*/*")
+        'jpeg'
+        >>> negotiation.accept_format("image/webp,*/*", formats=["webp", "png"])
+        'webp'
+
+    :param accept: The value of the `Accept` header of the request, or None if missing
+    :type accept: str, None
+    :param formats: The formats in order of preference, the last one used as fallback, defaults to avif, webp and jpeg
+    :type formats: list, optional
+    :raises ValueError: When formats is empty
+    :return: A string with the format
+    :rtype: str
+    """
+    formats = tuple(formats)
+
+    if not formats:
+        raise ValueError("Invalid formats. A non empty list of formats is expected.")
+
+    if not accept:
+        return formats[-1]
+
+    return _accept_format(accept, formats)
+
+
+def accept_url(source, path, accept, formats=DEFAULT_FORMATS, **params):
+    """Returns a formatted URL string for a source, with a path and optional arguments, using the preferred format
+    accepted by a browser as returned by :func:`accept_format`
+
+    :Examples:
+        >>> from imglab import negotiation
+        >>> negotiation.accept_url("assets", "example.jpeg", "image/webp,*/*", width=500)
+        'https://assets.imglab-cdn.net/example.jpeg?width=500&format=webp'
+
+    :param source: A source name as string or :class:`imglab.Source` object
+    :type source: str, class:`imglab.Source`
+    :param path: The path where the resource is located
+    :type path: str
+    :param accept: The value of the `Accept` header of the request, or None if missing
+    :type accept: str, None
+    :param formats: The formats in order of preference, the last one used as fallback, defaults to avif, webp and jpeg
+    :type formats: list, optional
+    :param params: The query parameters that we want to use as a keyword argument list, without `format`
+    :type params: list, optional
+    :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object or formats is
+        empty
+    :return: A string with the generated URL
+    :rtype: str
+    """
+    return _url_for_source(_source(source), path, {**params, **{"format": accept_format(accept, formats)}})
+
+
+def client_hints_url(source, path, headers, layout, sizes=DEFAULT_SIZES, default_width=None, default_dpr=DEFAULT_DPR):
+    """Returns the URL of the srcset candidate of a layout that best fits the client hints of a request
+
+    For layouts with widths, the candidate with the smallest width not lower than the width of the image in device
+    pixels is used. That width is taken from `Sec-CH-Width` header, or computed with `Sec-CH-Viewport-Width` and
+    `Sec-CH-DPR` headers and the sizes of the image. For layouts with pixel densities, the candidate with the smallest
+    density not lower than `Sec-CH-DPR` header is used. The largest candidate is only used when all of them are
+    smaller than that width or density.
+
+    Hints are missing in the first request of a browser and in browsers not supporting them, so missing hints fall back
+    to `default_dpr`, and a missing width falls back to `default_width` or, without it, to the width given by the sizes
+    of the image in a viewport of `DEFAULT_VIEWPORT_WIDTH` (1024) pixels.
+
+    The URL is always one of the candidates generated by `layout.srcset`, so variants are shared with srcsets, and only
+    that URL is signed for secure sources.
+
+    :Examples:
+        >>> import imglab
+        >>> from imglab import negotiation
+        >>> layout = imglab.Layout(width=[400, 800, 1600], format="webp")
+        >>> negotiation.client_hints_url("assets", "example.jpeg", {"Sec-CH-Width": "720"}, layout)
+        'https://assets.imglab-cdn.net/example.jpeg?width=800&format=webp'
+        >>> headers = {"Sec-CH-Viewport-Width": "1024", "Sec-CH-DPR": "2"}
+        >>> negotiation.client_hints_url("assets", "example.jpeg", headers, layout, sizes="(max-width: 600px) 100vw, 33vw")
+        'https://assets.imglab-cdn.net/example.jpeg?width=800&format=webp'
+
+    :param source: A source name as string or :class:`imglab.Source` object
+    :type source: str, class:`imglab.Source`
+    :param path: The path where the resource is located
+    :type path: str
+    :param headers: The headers of the request, as a mapping with case insensitive names
+    :type headers: dict
+    :param layout: The layout of the image, as used to generate its srcset
+    :type layout: class:`imglab.Layout`
+    :param sizes: The value of the sizes attribute of the image, used with `Sec-CH-Viewport-Width` header, defaults
+        to '100vw'
+    :type sizes: str, optional
+    :param default_width: The width of the image in device pixels used when it can't be taken from the hints,
+        defaults to None
+    :type default_width: int, optional
+    :param default_dpr: The pixel density used when `Sec-CH-DPR` header is missing, defaults to 1
+    :type default_dpr: int, float, optional
+    :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object
+    :return: A string with the generated URL
+    :rtype: str
+    """
+    source = _source(source)
+    candidates = layout._candidates_for_settings(source)
+    hints = _hints(headers)
+    dpr = default_dpr if hints["dpr"] is None else hints["dpr"]
+
+    if candidates[0][1].endswith("w"):
+        target = _target_width(hints, sizes, dpr, default_width)
+    else:
+        target = dpr
+
+    query, descriptor, params = _select(candidates, target)
+    normalized_path = url_utils.normalize_path(path)
+
+    return _candidate(source, normalized_path, *_path_settings(source, normalized_path), query, descriptor, params).url
+
+
+def client_hints_headers(layout):
+    """Returns the response headers requesting the client hints used by `client_hints_url` for a layout
+
+    Browsers send client hints in the requests following a response with `Accept-CH` header, and responses selected
+    with them must be marked with `Vary` header so caches don't share them between different clients.
+
+    :Examples:
+        >>> import imglab
+        >>> from imglab import negotiation
+        >>> negotiation.client_hints_headers(imglab.Layout(width=400))
+        {'Accept-CH': 'Sec-CH-DPR', 'Vary': 'Sec-CH-DPR'}
+
+    :param layout: The layout of the image, as used to generate its srcset
+    :type layout: class:`imglab.Layout`
+    :return: A dict with `Accept-CH` and `Vary` headers
+    :rtype: dict
+    """
+    if layout.descriptors[0].endswith("w"):
+        hints = "Sec-CH-DPR, Sec-CH-Width, Sec-CH-Viewport-Width"
+    else:
+        hints = "Sec-CH-DPR"
+
+    return {"Accept-CH": hints, "Vary": hints}
+
+
+def _hints(headers):
+    headers = {name.lower(): value for name, value in headers.items()}
+
+    def hint(names):
+        for name in names:
+            value = _number(headers.get(name))
+
+            if value is not None:
+                return value
+
+        return None
+
+    return {"dpr": hint(DPR_HINTS), "width": hint(WIDTH_HINTS), "viewport-width": hint(VIEWPORT_WIDTH_HINTS)}
+
+
+def _number(value):
+    if value is None:
+        return None
+
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+
+    return number if number > 0 and isfinite(number) else None
+
+
+def _target_width(hints, sizes, dpr, default_width):
+    if hints["width"] is not None:
+        return hints["width"]
+
+    viewport_width = hints["viewport-width"]
+
+    if viewport_width is None:
+        if default_width is not None:
+            return default_width
+
+        viewport_width = DEFAULT_VIEWPORT_WIDTH
+
+    # Sizes without a matching length (like `auto`) are handled as the default sizes, the width of the viewport
+    width = _sizes_width(sizes or DEFAULT_SIZES, viewport_width)
+
+    return (viewport_width if width is None else width) * dpr
+
+
+def _sizes_width(sizes, viewport_width):
+    for size in sizes.split(","):
+        size = size.strip()
+
+        if size.startswith("("):
+            condition, _, length = size[1:].partition(")")
+
+            if not _matches(condition, viewport_width):
+                continue
+        else:
+            length = size
+
+        return _length(length.strip(), viewport_width)
+
+    return None
+
+
+def _matches(condition, viewport_width):
+    feature, _, value = condition.partition(":")
+    value = _length(value.strip(), viewport_width)
+
+    if value is None:
+        return False
+    elif feature.strip() == "max-width":
+        return viewport_width <= value
+    elif feature.strip() == "min-width":
+        return viewport_width >= value
+    else:
+        return False
+
+
+def _length(length, viewport_width):
+    if length.endswith("vw"):
+        value = _number(length[:-2])
+        return None if value is None else viewport_width * value / 100
+    elif length.endswith("px"):
+        return _number(length[:-2])
+    else:
+        return None
+
+
+def _select(candidates, target):
+    values = [float(descriptor[:-1]) for _, descriptor, _ in candidates]
+
+    if target is not None:
+        fitting = [index for index, value in enumerate(values) if value >= target]
+
+        if fitting:
+            return candidates[min(fitting, key=values.__getitem__)]
+
+    return candidates[max(range(len(values)), key=values.__getitem__)]
+
+
+@lru_cache(maxsize=ACCEPT_CACHE_SIZE)
+def _accept_format(accept, formats):
+    qualities = _accept_qualities(accept)
+    best_format, best_quality = formats[-1], 0.0
+
+    for format in formats[:-1]:
+        quality = qualities.get(MIME_TYPES.get(format, "image/%s" % format), 0.0)
+
+        if quality > best_quality:
+            best_format, best_quality = format, quality
+
+    return best_format
+
+
+def _accept_qualities(accept):
+    qualities = {}
+
+    for media_range in accept.split(","):
+        media_type, _, parameters = media_range.partition(";")
+        quality = 1.0
+
+        for parameter in parameters.split(";"):
+            name, _, value = parameter.partition("=")
+
+            if name.strip().lower() == "q":
+                quality = _quality(value.strip())
+
+        qualities[media_type.strip().lower()] = quality
+
+    return qualities
+
+
+def _quality(value):
+    try:
+        quality = float(value)
+    except ValueError:
+        return 0.0
+
+    return min(quality, 1.0) if quality > 0 and isfinite(quality) else 0.0
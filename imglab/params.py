@@ -0,0 +1,319 @@
+import re
+import sys
+from collections import namedtuple
+from time import struct_time
+from urllib.parse import quote_plus
+
+from .color import COLORS
+from .position import HORIZONTAL, VERTICAL
+
+Param = namedtuple("Param", ["name", "type", "validate", "normalize", "canonicalize", "encode", "default"])
+
+SAFE_CHARACTERS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~")
+
+_INTEGER = re.compile(r"\d+\Z")
+_NUMBER = re.compile(r"-?\d+(\.\d+)?\Z")
+_COLOR_COMPONENTS = re.compile(r"\d{1,3}(,\d{1,3}){2,3}\Z")
+_HEXADECIMAL_COLOR = re.compile(r"([0-9a-fA-F]{3}|[0-9a-fA-F]{4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})\Z")
+_BOOLEANS = frozenset(["true", "false"])
+_POSITIONS = frozenset(HORIZONTAL + VERTICAL)
+
+
+def _normalize_value(value):
+    if value is None:
+        return ""
+    else:
+        return value
+
+
+def _is_datetime(value):
+    # A datetime value can only exist if the datetime module was already imported, so it is not imported here
+    datetime = sys.modules.get("datetime")
+
+    return datetime is not None and isinstance(value, datetime.datetime)
+
+
+def _normalize_timestamp(value):
+    if isinstance(value, struct_time):
+        from calendar import timegm
+
+        return timegm(value)
+    elif _is_datetime(value):
+        from calendar import timegm
+
+        return timegm(value.timetuple())
+    else:
+        return _normalize_value(value)
+
+
+def _valid_integer(value):
+    if isinstance(value, bool):
+        return False
+    elif isinstance(value, int):
+        return value >= 0
+    else:
+        return isinstance(value, str) and _INTEGER.match(value) is not None
+
+
+def _valid_number(value):
+    if isinstance(value, bool):
+        return False
+    elif isinstance(value, (int, float)):
+        return True
+    else:
+        return isinstance(value, str) and _NUMBER.match(value) is not None
+
+
+def _valid_string(value):
+    return isinstance(value, str)
+
+
+def _valid_boolean(value):
+    return isinstance(value, bool) or value in _BOOLEANS
+
+
+def _valid_color(value):
+    return isinstance(value, str) and (
+        value in COLORS or _COLOR_COMPONENTS.match(value) is not None or _HEXADECIMAL_COLOR.match(value) is not None
+    )
+
+
+def _valid_position(value):
+    return isinstance(value, str) and all(direction in _POSITIONS for direction in value.split(","))
+
+
+def _valid_timestamp(value):
+    return isinstance(value, struct_time) or _is_datetime(value) or _valid_integer(value)
+
+
+def _canonical_value(value):
+    return value
+
+
+def _canonical_integer(value):
+    if type(value) is str and _INTEGER.match(value) is not None:
+        return int(value)
+    elif type(value) is float and value.is_integer():
+        return int(value)
+    else:
+        return value
+
+
+def _canonical_number(value):
+    if type(value) is str and _NUMBER.match(value) is not None:
+        value = float(value)
+
+    if type(value) is float and value.is_integer():
+        return int(value)
+    else:
+        return value
+
+
+def _canonical_enum(value):
+    if isinstance(value, str):
+        return value.lower()
+    else:
+        return value
+
+
+def _canonical_boolean(value):
+    if value is True or value == "True":
+        return "true"
+    elif value is False or value == "False":
+        return "false"
+    else:
+        return value
+
+
+def _canonical_color(value):
+    if isinstance(value, str) and _HEXADECIMAL_COLOR.match(value) is not None:
+        return value.lower()
+    else:
+        return value
+
+
+def _canonical_position(value):
+    if isinstance(value, str) and value.count(",") == 1:
+        direction_a, direction_b = value.split(",")
+
+        if direction_a in VERTICAL and direction_b in HORIZONTAL:
+            return "%s,%s" % (direction_b, direction_a)
+
+    return value
+
+
+def _encode_value(value):
+    if type(value) is str:
+        string = value
+    elif isinstance(value, bytes):
+        return quote_plus(value)
+    else:
+        string = str(value)
+
+    if SAFE_CHARACTERS.issuperset(string):
+        return string
+    else:
+        return quote_plus(string)
+
+
+def _encode_integer(value):
+    if type(value) is int:
+        return str(value)
+    else:
+        return _encode_value(value)
+
+
+def _encode_boolean(value):
+    if type(value) is bool:
+        return str(value)
+    else:
+        return _encode_value(value)
+
+
+_TYPES = {
+    "integer": (_valid_integer, _normalize_value, _canonical_integer, _encode_integer),
+    "number": (_valid_number, _normalize_value, _canonical_number, _encode_integer),
+    "string": (_valid_string, _normalize_value, _canonical_value, _encode_value),
+    "enum": (_valid_string, _normalize_value, _canonical_enum, _encode_value),
+    "boolean": (_valid_boolean, _normalize_value, _canonical_boolean, _encode_boolean),
+    "color": (_valid_color, _normalize_value, _canonical_color, _encode_value),
+    "position": (_valid_position, _normalize_value, _canonical_position, _encode_value),
+    "url": (_valid_string, _normalize_value, _canonical_value, _encode_value),
+    "timestamp": (_valid_timestamp, _normalize_timestamp, _canonical_integer, _encode_integer),
+}
+
+# Parameters in canonical order, with their type and the default value applied by imglab when they are not specified
+_SCHEMA = [
+    ("width", "integer", None),
+    ("height", "integer", None),
+    ("aspect-ratio", "string", None),
+    ("mode", "enum", None),
+    ("crop", "enum", None),
+    ("dpr", "number", 1),
+    ("upscale", "boolean", "false"),
+    ("quality", "integer", None),
+    ("format", "enum", None),
+    ("progressive", "boolean", None),
+    ("lossless", "boolean", "false"),
+    ("download", "string", None),
+    ("rotate", "number", 0),
+    ("flip", "enum", None),
+    ("blur", "number", 0),
+    ("sharpen", "number", 0),
+    ("brightness", "number", 0),
+    ("contrast", "number", 0),
+    ("saturation", "number", 0),
+    ("hue", "number", 0),
+    ("background-color", "color", None),
+    ("trim", "enum", None),
+    ("trim-color", "color", None),
+    ("trim-threshold", "number", None),
+    ("padding", "string", None),
+    ("watermark", "url", None),
+    ("watermark-position", "position", None),
+    ("watermark-width", "integer", None),
+    ("watermark-height", "integer", None),
+    ("watermark-mode", "enum", None),
+    ("expires", "timestamp", None),
+    ("signature", "string", None),
+]
+
+
+def _build_params(schema):
+    params = {}
+
+    for name, kind, default in schema:
+        param = Param(name, kind, *_TYPES[kind], default)
+        params[name] = param
+        params[name.replace("-", "_")] = param
+
+    return params
+
+
+PARAMS = _build_params(_SCHEMA)
+
+_ORDER = {name: index for index, (name, _, _) in enumerate(_SCHEMA)}
+
+
+def lookup(key):
+    """Returns the known imglab parameter for a key, using its name with hyphens or underscores
+
+    :Examples:
+        >>> from imglab import params
+        >>> params.lookup("trim_color").name
+        'trim-color'
+        >>> params.lookup("trim_color").type
+        'color'
+        >>> params.lookup("unknown") is None
+        True
+
+    :param key: The name of the parameter
+    :type key: str
+    :return: The parameter with its name, type, validator, normalizer, canonicalizer, encoder and default value, or
+        None if the parameter is unknown
+    :rtype: class:`imglab.params.Param`, None
+    """
+    return PARAMS.get(key)
+
+
+def validate(params):
+    """Validates the values of known imglab parameters, ignoring unknown parameters and `None` values
+
+    :Examples:
+        >>> from imglab import params
+        >>> params.validate({"width": 200, "background_color": "255,128,122", "custom": "value"})
+        >>> params.validate({"width": "large"})
+        Traceback (most recent call last):
+        ...
+        ValueError: Invalid value for width parameter. A value of integer type is expected.
+
+    :param params: A dict with params to be validated
+    :type params: dict
+    :raises ValueError: When some value is not valid for the type of its parameter
+    """
+    for key, value in params.items():
+        param = PARAMS.get(key)
+
+        if param is not None and value is not None and not param.validate(value):
+            message = "Invalid value for %s parameter. A value of %s type is expected." % (param.name, param.type)
+            raise ValueError(message)
+
+
+def canonicalize(params):
+    """Returns a dict with params in their canonical form, so equivalent params generate the same query string
+
+    Known parameters are sorted in a fixed order followed by unknown parameters sorted by name, values are converted
+    to a single spelling (like `1.0` to `1`, `True` to `'true'` or `'bottom,left'` to `'left,bottom'`), and empty
+    values and values equal to the default ones applied by imglab are removed.
+
+    :Examples:
+        >>> from imglab import params
+        >>> params.canonicalize({"format": "webp", "width": "400", "dpr": 1.0, "upscale": False, "custom": ""})
+        {'width': 400, 'format': 'webp'}
+        >>> params.canonicalize({"watermark-position": "bottom,left", "dpr": 2.0, "b": 2, "a": 1})
+        {'dpr': 2, 'watermark-position': 'left,bottom', 'a': 1, 'b': 2}
+
+    :param params: A dict with normalized params, using the names of the parameters with hyphens
+    :type params: dict
+    :return: A dict with the canonical params
+    :rtype: dict
+    """
+    known, unknown = [], []
+
+    for key, value in params.items():
+        param = PARAMS.get(key)
+
+        if param is None:
+            if value != "":
+                unknown.append((key, value))
+            continue
+
+        value = param.canonicalize(value)
+
+        if value != "" and not (type(value) is type(param.default) and value == param.default):
+            known.append((_ORDER[param.name], param.name, value))
+
+    known.sort(key=lambda item: item[0])
+    unknown.sort(key=lambda item: item[0])
+
+    return dict([(name, value) for _, name, value in known] + unknown)
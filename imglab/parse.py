@@ -0,0 +1,159 @@
+from collections import namedtuple
+from functools import lru_cache
+from math import isfinite
+from urllib.parse import unquote, unquote_plus
+
+from .params import PARAMS
+from .source import Source
+
+ParsedURL = namedtuple("ParsedURL", ["scheme", "host", "port", "subdomains", "name", "path", "params", "signature"])
+
+SCHEMES = frozenset(["https", "http"])
+
+NETLOC_CACHE_SIZE = 1024
+
+
+def parse(url, host=Source.DEFAULT_HOST):
+    """Returns the source settings, the decoded path and the typed params of an imglab URL, as the inverse of
+    `imglab.url`
+
+    The URL is split using string operations only. Sources using subdomains are detected when the host of the URL is a
+    subdomain of the `host` argument, otherwise the source name is taken from the first path segment.
+
+    Values of known integer, number, boolean and timestamp params are converted only when converting them back to a
+    string gives the same value, so generating the URL again with the parsed params returns the same query string.
+
+    :Examples:
+        >>> import imglab
+        >>> parsed = imglab.parse("https://assets.imglab-cdn.net/sub%20folder/example.jpeg?width=500&dpr=1.5")
+        >>> parsed.name, parsed.subdomains, parsed.path
+        ('assets', True, 'sub folder/example.jpeg')
+        >>> parsed.params
+        {'width': 500, 'dpr': 1.5}
+        >>> parsed = imglab.parse(b"http://imglab.net:8080/assets/example.jpeg?format=webp", host="imglab.net")
+        >>> parsed.host, parsed.port, parsed.subdomains, parsed.name
+        ('imglab.net', 8080, False, 'assets')
+
+    :param url: The imglab URL as string or bytes
+    :type url: str, bytes
+    :param host: The host used by sources with subdomains, defaults to 'imglab-cdn.net'
+    :type host: str, optional
+    :raises ValueError: When the URL is not a valid imglab URL
+    :return: A named tuple with scheme, host, port, subdomains, name, path, params and signature values
+    :rtype: class:`imglab.parse.ParsedURL`
+    """
+    if isinstance(url, (bytes, bytearray)):
+        url = url.decode()
+
+    scheme, separator, rest = url.partition("://")
+
+    if not separator or scheme not in SCHEMES:
+        raise ValueError("Invalid imglab URL. A URL with https or http scheme is expected.")
+
+    rest, _, _ = rest.partition("#")
+    rest, _, query = rest.partition("?")
+    netloc, _, path = rest.partition("/")
+
+    source_host, port, subdomains, name = _parse_netloc(netloc, host)
+
+    if not subdomains:
+        name, _, path = path.partition("/")
+
+    if not name:
+        raise ValueError("Invalid imglab URL. A source name is expected.")
+
+    params, signature = _parse_query(query)
+
+    return ParsedURL(scheme, source_host, port, subdomains, name, _unquote_path(path), params, signature)
+
+
+@lru_cache(maxsize=NETLOC_CACHE_SIZE)
+def _parse_netloc(netloc, host):
+    hostname, port = netloc, None
+
+    if netloc.rfind(":") > netloc.rfind("]"):
+        hostname, _, port = netloc.rpartition(":")
+
+        if not port.isdigit():
+            raise ValueError("Invalid imglab URL. A numeric port is expected.")
+
+        port = int(port)
+
+    if hostname.endswith("." + host):
+        return host, port, True, hostname[: -len(host) - 1]
+    else:
+        return hostname, port, False, None
+
+
+def _parse_query(query):
+    params, signature = {}, None
+
+    if not query:
+        return params, signature
+
+    for fragment in query.split("&"):
+        if not fragment:
+            continue
+
+        key, _, value = fragment.partition("=")
+
+        if "%" in fragment or "+" in fragment:
+            key, value = unquote_plus(key), unquote_plus(value)
+
+        if key == "signature":
+            signature = value
+        elif key in _CONVERTERS:
+            params[key] = _CONVERTERS[key](value)
+        else:
+            params[key] = value
+
+    return params, signature
+
+
+def _unquote_path(path):
+    if "%" in path:
+        return unquote(path)
+    else:
+        return path
+
+
+def _integer(value):
+    try:
+        number = int(value)
+    except ValueError:
+        return value
+
+    return number if str(number) == value else value
+
+
+def _number(value):
+    number = _integer(value)
+
+    if number is not value:
+        return number
+
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+
+    return number if str(number) == value and isfinite(number) else value
+
+
+def _boolean(value):
+    if value == "True":
+        return True
+    elif value == "False":
+        return False
+    else:
+        return value
+
+
+_TYPES = {
+    "integer": _integer,
+    "number": _number,
+    "boolean": _boolean,
+    "timestamp": _integer,
+}
+
+_CONVERTERS = {param.name: _TYPES[param.type] for param in PARAMS.values() if param.type in _TYPES}
@@ -0,0 +1,171 @@
+from html import escape
+from math import isfinite
+
+from .layout import Layout, _path_settings
+from .url import _prepare_params, _prepares_params, _source
+from .utils import url as url_utils
+
+DEFAULT_FORMATS = ["avif", "webp", "jpeg"]
+
+MIME_TYPES = {
+    "avif": "image/avif",
+    "webp": "image/webp",
+    "jxl": "image/jxl",
+    "jpeg": "image/jpeg",
+    "jpg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+}
+
+
+def picture(source, path, formats=DEFAULT_FORMATS, sizes=None, alt="", attributes=None, writer=None, **params):
+    """Returns an HTML picture element with a source element for every format and an img element for the last one,
+    using the first candidate of its srcset as src attribute
+
+    The params are resolved once for all the formats, and the path is normalized, encoded and signed (for secure
+    sources) once for all the candidates. Values of attributes are HTML escaped, and `width` and `height` attributes
+    of the last candidate are added to the img element when both can be taken from the params (using `aspect-ratio`
+    param for the height), to avoid layout shifts while loading.
+
+    :Examples:
+        >>> import imglab
+        >>> print(imglab.picture("assets", "example.jpeg", formats=["webp", "jpeg"], width=400, height=300, dpr=[1, 2], alt="A & B"))
+        <picture>
+        <source type="image/webp" srcset="https://assets.imglab-cdn.net/example.jpeg?width=400&amp;height=300&amp;dpr=1&amp;format=webp 1x, https://assets.imglab-cdn.net/example.jpeg?width=400&amp;height=300&amp;dpr=2&amp;format=webp 2x">
+        <img src="https://assets.imglab-cdn.net/example.jpeg?width=400&amp;height=300&amp;dpr=1&amp;format=jpeg" srcset="https://assets.imglab-cdn.net/example.jpeg?width=400&amp;height=300&amp;dpr=1&amp;format=jpeg 1x, https://assets.imglab-cdn.net/example.jpeg?width=400&amp;height=300&amp;dpr=2&amp;format=jpeg 2x" width="400" height="300" alt="A &amp; B">
+        </picture>
+
+    :param source: A source name as string or :class:`imglab.Source` object
+    :type source: str, class:`imglab.Source`
+    :param path: The path where the resource is located
+    :type path: str
+    :param formats: The formats of the candidates in order of preference, the last one used by the img element,
+        defaults to avif, webp and jpeg
+    :type formats: list, optional
+    :param sizes: The value of the sizes attribute, defaults to None
+    :type sizes: str, optional
+    :param alt: The value of the alt attribute of the img element, defaults to an empty string
+    :type alt: str, optional
+    :param attributes: Additional attributes of the img element (like `class` or `loading`) as a dict, skipping None
+        values and adding `True` values without value, defaults to None
+    :type attributes: dict, optional
+    :param writer: A file-like object where the element is written instead of returned, defaults to None
+    :type writer: object, optional
+    :param params: The query parameters as keyword argument list, as expected by `imglab.srcset`, without `format`
+    :type params: list, optional
+    :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object, formats is
+        empty or some params fluid combinations are not allowed
+    :return: A string with the picture element, or None when a writer is specified
+    :rtype: str, None
+    """
+    source = _source(source)
+    formats = list(formats)
+
+    if not formats:
+        raise ValueError("Invalid formats. A non empty list of formats is expected.")
+
+    layouts = Layout._for_formats(formats, **params)
+    normalized_path = url_utils.normalize_path(path)
+    path_settings = _path_settings(source, normalized_path)
+
+    def candidates(layout):
+        return list(layout._candidates_for_path(source, normalized_path, *path_settings))
+
+    size = _size(source, layouts[-1])
+    chunks = _picture(formats, [candidates(layout) for layout in layouts], sizes, alt, attributes, size)
+
+    if writer is None:
+        return "".join(chunks)
+
+    for chunk in chunks:
+        writer.write(chunk)
+
+
+def _picture(formats, candidates, sizes, alt, attributes, size):
+    yield "<picture>\n"
+
+    for format, format_candidates in zip(formats[:-1], candidates[:-1]):
+        source_attributes = [("type", MIME_TYPES.get(format, "image/%s" % format))]
+        source_attributes += [("srcset", _srcset(format_candidates)), ("sizes", sizes)]
+
+        yield "<source%s>\n" % _attributes(source_attributes)
+
+    # Browsers supporting picture elements use the srcset attribute, so the src attribute is only a fallback
+    img_candidates = candidates[-1]
+
+    img_attributes = [("src", img_candidates[0].url), ("srcset", _srcset(img_candidates)), ("sizes", sizes)]
+    img_attributes += [("width", size[0]), ("height", size[1]), ("alt", alt)]
+    img_attributes += list((attributes or {}).items())
+
+    yield "<img%s>\n" % _attributes(img_attributes)
+    yield "</picture>"
+
+
+def _srcset(candidates):
+    return ", ".join("%s %s" % candidate for candidate in candidates)
+
+
+def _attributes(attributes):
+    fragments = []
+
+    for name, value in attributes:
+        if value is None or value is False:
+            continue
+        elif value is True:
+            fragments.append(" %s" % name)
+        else:
+            fragments.append(' %s="%s"' % (name, escape(str(value))))
+
+    return "".join(fragments)
+
+
+def _size(source, layout):
+    # The size is taken from the last candidate of the srcset (the largest one for widths) with the params prepared by
+    # the source (like widths snapped to a ladder), and both dimensions are required, since a width without a height
+    # doesn't keep the space of the image while loading
+    params, split_keys, split_values, _ = layout._resolved
+
+    if split_keys[0] == "width":
+        candidates = (zip(split_keys, values) for values in reversed(split_values))
+    else:
+        candidates = [()]
+
+    sizes = (_candidate_size(source, params, candidate) for candidate in candidates)
+    width, height = next(sizes)
+
+    if width is not None and height is None:
+        # Candidates without a height keep the ratio of the last candidate with both dimensions or the aspect ratio
+        ratios = (other_height / other_width for other_width, other_height in sizes if other_width and other_height)
+        ratio = next(ratios, None)
+        height = _height(width, params.get("aspect-ratio")) if ratio is None else max(round(width * ratio), 1)
+
+    return (width, height) if width is not None and height is not None else (None, None)
+
+
+def _candidate_size(source, params, split_items):
+    params = {**params, **{key: value for key, value in split_items if key in params}}
+
+    if _prepares_params(source):
+        params = _prepare_params(source, url_utils.normalize_params(params))
+
+    width, height = params.get("width"), params.get("height")
+
+    return (width if _is_dimension(width) else None, height if _is_dimension(height) else None)
+
+
+def _is_dimension(value):
+    return type(value) is int and value > 0
+
+
+def _height(width, aspect_ratio):
+    if not isinstance(aspect_ratio, str):
+        return None
+
+    numerator, separator, denominator = aspect_ratio.partition(":")
+
+    try:
+        ratio = float(numerator) / float(denominator) if separator else float(numerator)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+    return round(width / ratio) if ratio > 0 and isfinite(ratio) else None
@@ -1,9 +1,16 @@
+from array import array
+from functools import lru_cache
+
 DEFAULT_SIZE = 16
+CACHE_MAXSIZE = 256
 
 
 def sequence(first, last, size=DEFAULT_SIZE):
     """Returns a geometric sequence list of integer numbers inside an interval, with an optional size
 
+    Every number is computed in closed form from the first one, so rounding errors are not accumulated along the
+    sequence, and sequences are memoized by their arguments.
+
     :Examples:
         >>> from imglab import sequence
         >>> sequence(100, 8192)
@@ -26,6 +33,57 @@ def sequence(first, last, size=DEFAULT_SIZE):
     :return: A sequence of integer numbers as list
     :rtype: list
     """
+    return list(cached_sequence(first, last, size))
+
+
+@lru_cache(maxsize=CACHE_MAXSIZE, typed=True)
+def cached_sequence(first, last, size=DEFAULT_SIZE):
+    """Returns a geometric sequence of integer numbers inside an interval as an immutable tuple, memoized by its
+    arguments
+
+    :Examples:
+        >>> from imglab.sequence import cached_sequence
+        >>> cached_sequence(100, 8192, 4)
+        (100, 434, 1886, 8192)
+
+    :param first: The first number of the sequence as integer
+    :type first: int
+    :param last: The last number of the sequence as integer
+    :type last: int
+    :param size: The size of the sequence as integer, defaults to 16
+    :type size: int, optional
+    :return: A sequence of integer numbers as tuple
+    :rtype: tuple
+    """
+    return tuple(_sequence(first, last, size))
+
+
+def sequences(intervals, size=DEFAULT_SIZE):
+    """Returns the geometric sequences of integer numbers for many intervals, stored consecutively in a compact array
+
+    The sequence of the interval at position `i` is stored in the slice `[i * size:(i + 1) * size]` of the array.
+
+    :Examples:
+        >>> from imglab.sequence import sequences
+        >>> sequences([(100, 8192), (100, 2000)], 4)
+        array('q', [100, 434, 1886, 8192, 100, 271, 737, 2000])
+
+    :param intervals: An iterable of tuples with the first and the last integer numbers of every sequence
+    :type intervals: iterable
+    :param size: The size of every sequence as integer, defaults to 16
+    :type size: int, optional
+    :return: An array of signed integers with all the sequences
+    :rtype: class:`array.array`
+    """
+    values = array("q")
+
+    for first, last in intervals:
+        values.extend(_sequence(first, last, size))
+
+    return values
+
+
+def _sequence(first, last, size):
     if size <= 0:
         return []
     if size == 1:
@@ -35,9 +93,4 @@ def sequence(first, last, size=DEFAULT_SIZE):
 
     ratio = (last / first) ** (1 / (size - 1))
 
-    seq = [first]
-    for i in range(1, size - 1):
-        seq.append(seq[i - 1] * ratio)
-    seq.append(last)
-
-    return list(map(round, seq))
+    return [first] + [round(first * ratio**i) for i in range(1, size - 1)] + [last]
@@ -1,6 +1,37 @@
-import base64
-import hmac
-import hashlib
+import binascii
+
+_URLSAFE = bytes.maketrans(b"+/", b"-_")
+
+
+def keyed_hmac(secure_key, secure_salt):
+    """Returns an HMAC-SHA256 object keyed with a secure key and already fed with a secure salt, ready to be copied
+
+    :Examples:
+        >>> from imglab import signature
+        >>> signature.keyed_hmac("55IX1RVlDHpgl/4D", "ITvYA2lPfyz0w8/v").name
+        'hmac-sha256'
+
+    :param secure_key: The secure key encoded using Base64
+    :type secure_key: str
+    :param secure_salt: The secure salt encoded using Base64
+    :type secure_salt: str
+    :raises ValueError: When the secure key or the secure salt are not valid Base64 encoded strings
+    :return: An HMAC object with the decoded secure salt and a path separator as initial data
+    :rtype: class:`hmac.HMAC`
+    """
+    import base64
+    import hashlib
+    import hmac
+
+    # Surrounding whitespace (like a trailing newline of keys read from files) is ignored, but other characters outside
+    # the Base64 alphabet are rejected instead of discarded, so mistyped keys aren't accepted
+    try:
+        decoded_secure_key = base64.b64decode(secure_key.strip(), validate=True)
+        decoded_secure_salt = base64.b64decode(secure_salt.strip(), validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid secure_key or secure_salt. Base64 encoded strings are expected.")
+
+    return hmac.new(decoded_secure_key, b"%s/" % decoded_secure_salt, hashlib.sha256)
 
 
 def generate(source, path, encoded_params=None):
@@ -21,12 +52,49 @@ def generate(source, path, encoded_params=None):
     :return: A string with the signature encoded using Base64 to be used in a imglab URL
     :rtype: str
     """
-    decoded_secure_key = base64.b64decode(source.secure_key.encode())
-    decoded_secure_salt = base64.b64decode(source.secure_salt.encode())
+    return _digest(prefix(source, path), encoded_params)
+
+
+def prefix(source, path):
+    """Returns an HMAC object fed with the secure salt and path of a source, shared by signatures of the same path
+
+    :Examples:
+        >>> from imglab import signature, Source
+        >>> source = Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+        >>> state = signature.prefix(source, "example.jpeg")
+        >>> signature.generate_from_prefix(state)
+        'QFEVlDWgK289HYKr2KJdwtPC-I7LS195hSVQhS1UsRA'
+
+    :param source: The source used to generate the signatures
+    :type source: class:`imglab.Source`
+    :param path: The path of the resource
+    :type path: str
+    :return: An HMAC object to be used with :func:`generate_from_prefix`
+    :rtype: class:`hmac.HMAC`
+    """
+    state = source._hmac.copy()
+    state.update(path.encode())
+
+    return state
+
+
+def generate_from_prefix(state, encoded_params=None):
+    """Returns a generated signature for encoded parameters, using an HMAC object returned by :func:`prefix`
+
+    The HMAC object is copied, so it can be reused to generate signatures for different encoded parameters.
+
+    :param state: The HMAC object fed with the secure salt and path of a source
+    :type state: class:`hmac.HMAC`
+    :param encoded_params: Encoded query params of the URL to generate the signature, defaults to None
+    :type encoded_params: str, optional
+    :return: A string with the signature encoded using Base64 to be used in a imglab URL
+    :rtype: str
+    """
+    return _digest(state.copy(), encoded_params)
 
-    data = b"%s/%s" % (decoded_secure_salt, path.encode())
-    data = b"%s?%s" % (data, encoded_params.encode()) if encoded_params else data
 
-    digest = hmac.new(decoded_secure_key, data, hashlib.sha256).digest()
+def _digest(state, encoded_params):
+    if encoded_params:
+        state.update(b"?%s" % encoded_params.encode())
 
-    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+    return binascii.b2a_base64(state.digest(), newline=False).rstrip(b"=").translate(_URLSAFE).decode()
@@ -1,14 +1,20 @@
 import os
 
+from .ladder import Ladder
+from .signature import keyed_hmac
+
 
 class Source:
     """A class to represent imglab sources
 
+    Sources are immutable and hashable, and their scheme, network location and path prefix are computed when created.
+
     :Examples:
         >>> import imglab
         >>> source = imglab.Source("assets")
         >>> source = imglab.Source("assets", subdomains=False)
         >>> source = imglab.Source("assets", https=False, host="imglab.net", port=8080)
+        >>> source = imglab.Source("assets", ladder=imglab.sequence(100, 4000, 12))
 
     :param name: The name of source
     :type name: str
@@ -24,11 +30,39 @@ class Source:
     :type secure_salt: str, optional
     :param subdomains: A bool value specifying if the source should use subdomains or not, defaults to `True`
     :type subdomains: bool, optional
+    :param canonical: A bool value specifying if the params of generated URLs should be canonicalized (sorted, without
+        default values and with a single spelling for equivalent values) or not, defaults to `False`
+    :type canonical: bool, optional
+    :param ladder: The allowed widths used to snap width and height params of generated URLs, as a
+        :class:`imglab.Ladder` object or an iterable of positive integers, defaults to None
+    :type ladder: class:`imglab.Ladder`, iterable, optional
+    :raises ValueError: When secure_key or secure_salt are not valid Base64 encoded strings or ladder widths are not
+        positive integers
     """
 
     DEFAULT_HOST = "imglab-cdn.net"
     DEFAULT_HTTPS = True
     DEFAULT_SUBDOMAINS = True
+    DEFAULT_CANONICAL = False
+
+    __slots__ = (
+        "_host",
+        "_https",
+        "_name",
+        "_port",
+        "_secure_key",
+        "_secure_salt",
+        "_subdomains",
+        "_canonical",
+        "_ladder",
+        "_settings",
+        "_source_host",
+        "_scheme",
+        "_netloc",
+        "_prefix",
+        "_secure",
+        "_hmac",
+    )
 
     def __init__(
         self,
@@ -39,14 +73,57 @@ class Source:
         secure_key=None,
         secure_salt=None,
         subdomains=DEFAULT_SUBDOMAINS,
+        canonical=DEFAULT_CANONICAL,
+        ladder=None,
     ):
-        self._host = host
-        self._https = https
-        self._name = name
-        self._port = port
-        self._secure_key = secure_key
-        self._secure_salt = secure_salt
-        self._subdomains = subdomains
+        if ladder is not None and not isinstance(ladder, Ladder):
+            ladder = Ladder(ladder)
+
+        source_host = "%s.%s" % (name, host) if subdomains else host
+        secure = bool(secure_key and secure_salt)
+
+        attributes = {
+            "_host": host,
+            "_https": https,
+            "_name": name,
+            "_port": port,
+            "_secure_key": secure_key,
+            "_secure_salt": secure_salt,
+            "_subdomains": subdomains,
+            "_canonical": canonical,
+            "_ladder": ladder,
+            "_settings": (name, host, https, port, secure_key, secure_salt, subdomains, canonical, ladder),
+            "_source_host": source_host,
+            "_scheme": "https" if https else "http",
+            "_netloc": "%s:%s" % (source_host, port) if port else source_host,
+            "_prefix": "" if subdomains else os.path.join(name, ""),
+            "_secure": secure,
+            "_hmac": keyed_hmac(secure_key, secure_salt) if secure else None,
+        }
+
+        for attribute, value in attributes.items():
+            object.__setattr__(self, attribute, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("%s instances are immutable" % self.__class__.__name__)
+
+    def __delattr__(self, name):
+        raise AttributeError("%s instances are immutable" % self.__class__.__name__)
+
+    def __eq__(self, other):
+        if isinstance(other, Source):
+            return self._settings == other._settings
+        else:
+            return NotImplemented
+
+    def __hash__(self):
+        return hash(self._settings)
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self._name)
+
+    def __reduce__(self):
+        return (self.__class__, self._settings)
 
     @property
     def host(self):
@@ -55,10 +132,7 @@ class Source:
         :return: A string value with the host used by the source
         :rtype: str
         """
-        if self.subdomains:
-            return "%s.%s" % (self.name, self._host)
-        else:
-            return self._host
+        return self._source_host
 
     @property
     def https(self):
@@ -114,16 +188,49 @@ class Source:
         """
         return self._subdomains
 
+    @property
+    def canonical(self):
+        """Returns if the source canonicalizes the params of generated URLs or not
+
+        :return: `True` if the source canonicalizes params, `False` otherwise
+        :rtype: bool
+        """
+        return self._canonical
+
+    @property
+    def ladder(self):
+        """Returns the ladder used by the source to snap widths and heights
+
+        :return: The ladder used by the source or None if no ladder is used
+        :rtype: class:`imglab.Ladder`, None
+        """
+        return self._ladder
+
+    @property
+    def netloc(self):
+        """Returns the network location used by the source, including the port if specified
+
+        :return: A string value with the host and the port used by the source
+        :rtype: str
+        """
+        return self._netloc
+
+    @property
+    def prefix(self):
+        """Returns the prefix added to paths by the source, empty when the source uses subdomains
+
+        :return: A string value with the path prefix of the source
+        :rtype: str
+        """
+        return self._prefix
+
     def scheme(self):
         """Returns the URI scheme to be used with the source ('http' or 'https')
 
         :return: 'https' if the source is using https scheme, 'http' otherwise
         :rtype: str
         """
-        if self.https:
-            return "https"
-        else:
-            return "http"
+        return self._scheme
 
     def path(self, path):
         """Returns the path to be used with the source
@@ -144,4 +251,22 @@ class Source:
         :return: `True` if the source is secure, `False` otherwise
         :rtype: bool
         """
-        return bool(self.secure_key and self.secure_salt)
+        return self._secure
+
+    def template(self, **params):
+        """Returns a URL template compiled for the source and a fixed set of parameters
+
+        :Examples:
+            >>> import imglab
+            >>> template = imglab.Source("assets").template(width=400, format="webp")
+            >>> template("example.jpeg")
+            'https://assets.imglab-cdn.net/example.jpeg?width=400&format=webp'
+
+        :param params: The fixed query parameters of the template as a keyword argument list
+        :type params: list, optional
+        :return: A callable template receiving a path and optional parameters and returning a URL
+        :rtype: class:`imglab.Template`
+        """
+        from .template import Template
+
+        return Template(self, **params)
@@ -0,0 +1,87 @@
+from .source import Source
+from .utils.cache import LRU
+
+
+class Registry:
+    """A class to intern sources by name, constructing them lazily with their registered settings
+
+    Source settings are stored when registered, and :class:`imglab.Source` instances are only created the first time
+    they are requested, keeping up to `maxsize` of them and evicting the least recently used ones.
+
+    :Examples:
+        >>> from imglab.sources import Registry
+        >>> registry = Registry()
+        >>> registry.register("images", host="my-company.com", subdomains=False)
+        >>> registry.get("images").host
+        'my-company.com'
+        >>> registry.get("images") is registry.get("images")
+        True
+        >>> registry.get("assets").host
+        'assets.imglab-cdn.net'
+
+    :param maxsize: The maximum number of source instances kept, defaults to 1024
+    :type maxsize: int, optional
+    :raises ValueError: When maxsize is not a positive integer
+    """
+
+    DEFAULT_MAXSIZE = 1024
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self._settings = {}
+        self._sources = LRU(maxsize)
+
+    def __contains__(self, name):
+        return name in self._settings
+
+    def register(self, name, **settings):
+        """Registers the settings of a source name, replacing previous settings of the same name
+
+        :param name: The name of the source
+        :type name: str
+        :param settings: The keyword arguments used to create the :class:`imglab.Source` instance
+        :type settings: list, optional
+        """
+        self._settings[name] = settings
+        self._sources.delete(name)
+
+    def unregister(self, name):
+        """Removes the settings of a source name, if present
+
+        :param name: The name of the source
+        :type name: str
+        """
+        self._settings.pop(name, None)
+        self._sources.delete(name)
+
+    def get(self, name):
+        """Returns the interned source for a name, using the registered settings or default settings otherwise
+
+        :param name: The name of the source
+        :type name: str
+        :raises ValueError: When the registered secure_key or secure_salt are not valid Base64 encoded strings
+        :return: The source instance
+        :rtype: class:`imglab.Source`
+        """
+        return self._sources.get_or_set(name, lambda: Source(name, **self._settings.get(name, {})))
+
+    def clear(self):
+        """Removes all the registered settings and interned sources"""
+        self._settings.clear()
+        self._sources.clear()
+
+    def info(self):
+        """Returns the statistics of the interned sources
+
+        :return: A named tuple with hits, misses, maxsize and currsize values
+        :rtype: class:`imglab.utils.cache.CacheInfo`
+        """
+        return self._sources.info()
+
+
+_registry = Registry()
+
+register = _registry.register
+unregister = _registry.unregister
+get = _registry.get
+clear = _registry.clear
+info = _registry.info
@@ -1,9 +1,5 @@
-from .url import url
-from .sequence import sequence
-from .utils import srcset as utils
-
-DEFAULT_DPRS = [1, 2, 3, 4, 5, 6]
-DEFAULT_WIDTHS = sequence(100, 8192)
+from .layout import DEFAULT_DPRS, DEFAULT_WIDTHS, Candidate, Layout, _iter_candidates
+from .url import _source
 
 
 def srcset(source, path, **params):
@@ -26,47 +22,32 @@ def srcset(source, path, **params):
     :return: A string with the generated srcset value
     :rtype: str
     """
-    params = utils.normalize_params(params)
-
-    width, height, dpr = [params.get(key) for key in ["width", "height", "dpr"]]
-
-    if _is_fluid(width):
-        if _is_fluid(dpr):
-            raise ValueError("dpr as %s is not allowed when width is list or range" % type(dpr).__name__)
-
-        return _srcset_width(source, path, params)
-    elif width or height:
-        if _is_fluid(height):
-            raise ValueError("height as %s is not allowed when width is not a list or range" % type(height).__name__)
-
-        return _srcset_dpr(source, path, {**params, **{"dpr": _dprs(params)}})
-    else:
-        if _is_fluid(dpr):
-            raise ValueError("dpr as %s is not allowed without specifying width or height" % type(dpr).__name__)
-
-        return _srcset_width(source, path, {**params, **{"width": DEFAULT_WIDTHS}})
-
-
-def _dprs(params):
-    if _is_fluid(params.get("dpr")):
-        return params["dpr"]
-    else:
-        return DEFAULT_DPRS
-
+    return Layout(**params).srcset(source, path)
 
-def _is_fluid(value):
-    return isinstance(value, (list, range))
 
+def srcset_iter(source, path, **params):
+    """Returns a lazy iterator of srcset candidates for a source, with a path and optional arguments
 
-def _srcset_dpr(source, path, params):
-    return ",\n".join(
-        "%s %dx" % (url(source, path, **split_params), split_params["dpr"])
-        for split_params in utils.split_params_dpr(params)
-    )
+    Every candidate is a named tuple with the URL and its descriptor (a width like `400w` or a pixel density like
+    `2x`), generated only when requested.
 
+    :Examples:
+        >>> import imglab
+        >>> candidates = imglab.srcset_iter("assets", "example.jpeg", width=500, dpr=[1, 2])
+        >>> next(candidates)
+        Candidate(url='https://assets.imglab-cdn.net/example.jpeg?width=500&dpr=1', descriptor='1x')
+        >>> [candidate.descriptor for candidate in candidates]
+        ['2x']
 
-def _srcset_width(source, path, params):
-    return ",\n".join(
-        "%s %dw" % (url(source, path, **split_params), split_params["width"])
-        for split_params in utils.split_params_width(params)
-    )
+    :param source: A source name as string or :class:`imglab.Source` object
+    :type source: str, class:`imglab.Source`
+    :param path: The path where the resource is located
+    :type path: str
+    :param params: The query parameters that we want to use as keyword argument list
+    :type params: list, optional
+    :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object or some
+        params fluid combinations are not allowed
+    :return: An iterator of :class:`imglab.srcset.Candidate` named tuples
+    :rtype: iterator
+    """
+    return _iter_candidates(_source(source), path, params)
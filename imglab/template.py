@@ -0,0 +1,87 @@
+from .url import _encode_path, _prepare_params, _prepares_params, _sign_params, _source
+from .utils import url as utils
+
+
+class Template:
+    """A class to represent URL templates compiled for a source and a fixed set of parameters
+
+    The scheme, netloc, source path prefix and the query string of the fixed parameters are encoded once when the
+    template is compiled, so rendering a URL only needs to encode the path (and sign it for secure sources).
+
+    :Examples:
+        >>> import imglab
+        >>> template = imglab.Source("assets").template(width=400, format="webp")
+        >>> template("example.jpeg")
+        'https://assets.imglab-cdn.net/example.jpeg?width=400&format=webp'
+        >>> template("example.jpeg", quality=80)
+        'https://assets.imglab-cdn.net/example.jpeg?width=400&format=webp&quality=80'
+
+    :param source: A source name as string or :class:`imglab.Source` object used to generate the URLs
+    :type source: str, class:`imglab.Source`
+    :param params: The fixed query parameters of the template as a keyword argument list
+    :type params: list, optional
+    :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object
+    """
+
+    def __init__(self, source, **params):
+        source = _source(source)
+
+        self._source = source
+        self._normalized_params = utils.normalize_params(params)
+        self._params = _prepare_params(source, self._normalized_params)
+        self._base = "%s://%s" % (source.scheme(), source.netloc)
+        self._prefix = source.prefix
+        self._query = utils.encode_params(self._params)
+
+    @property
+    def source(self):
+        """Returns the source used by the template
+
+        :return: The source used by the template
+        :rtype: class:`imglab.Source`
+        """
+        return self._source
+
+    @property
+    def params(self):
+        """Returns a copy of the normalized fixed parameters of the template
+
+        :return: A dict with the fixed parameters of the template
+        :rtype: dict
+        """
+        return dict(self._params)
+
+    def __call__(self, path, **params):
+        """Returns a formatted URL string for a path, with optional parameters added to the fixed ones
+
+        :param path: The path where the resource is located
+        :type path: str
+        :param params: Additional query parameters as a keyword argument list, overriding fixed ones with the same name
+        :type params: list, optional
+        :return: A string with the generated URL
+        :rtype: str
+        """
+        normalized_path = utils.normalize_path(path)
+        query = self._encode_params(normalized_path, utils.normalize_params(params) if params else None)
+        encoded_path = self._prefix + _encode_path(normalized_path)
+
+        url = "%s/%s" % (self._base, encoded_path) if encoded_path else self._base
+
+        return "%s?%s" % (url, query) if query else url
+
+    def _encode_params(self, path, params):
+        if not params:
+            merged_params, query = self._params, self._query
+        elif _prepares_params(self._source):
+            # Prepared params can't be prepared again (heights snapped to a ladder would be scaled twice), so the
+            # additional params are merged with the fixed ones as they were specified
+            merged_params = _prepare_params(self._source, {**self._normalized_params, **params})
+            query = utils.encode_params(merged_params)
+        elif self._params.keys().isdisjoint(params):
+            merged_params = {**self._params, **params}
+            query = "&".join(filter(None, [self._query, utils.encode_params(params)]))
+        else:
+            merged_params = {**self._params, **params}
+            query = utils.encode_params(merged_params)
+
+        return _sign_params(self._source, path, merged_params, query)
@@ -1,7 +1,8 @@
-from urllib.parse import ParseResult, quote, urlencode
+from urllib.parse import quote
 
+from .params import canonicalize
 from .source import Source
-from .signature import generate as generate_signature
+from . import signature, sources
 from .utils import url as utils
 
 
@@ -15,7 +16,7 @@ def url(source, path, **params):
         >>> imglab.url(imglab.Source("assets"), "example.jpeg", width=500, height=600)
         'https://assets.imglab-cdn.net/example.jpeg?width=500&height=600'
 
-    :param source: A source name as string or :class:`imglab.Source` object
+    :param source: A source name as string, resolved with :mod:`imglab.sources`, or :class:`imglab.Source` object
     :type source: str, class:`imglab.Source`
     :param path: The path where the resource is located
     :type path: str
@@ -25,33 +26,56 @@ def url(source, path, **params):
     :return: A string with the generated URL
     :rtype: str
     """
+    return _url_for_source(_source(source), path, params)
+
+
+def _source(source):
     if isinstance(source, str):
-        return _url_for_source(Source(source), path, params)
+        return sources.get(source)
     elif isinstance(source, Source):
-        return _url_for_source(source, path, params)
+        return source
     else:
         raise ValueError("Invalid source name or source. A string or a %s instance is expected." % Source.__name__)
 
 
 def _url_for_source(source, path, params):
     normalized_path = utils.normalize_path(path)
-    normalized_params = utils.normalize_params(params)
+    normalized_params = _prepare_params(source, utils.normalize_params(params))
+
+    return _join_query(
+        _base_url(source, normalized_path),
+        _encode_params(source, normalized_path, normalized_params),
+    )
+
+
+def _prepare_params(source, params):
+    if source.ladder is not None:
+        params = source.ladder.snap_params(params)
+
+    if source.canonical:
+        return canonicalize(params)
+    else:
+        return params
+
 
-    return ParseResult(
-        scheme=source.scheme(),
-        netloc=_netloc(source),
-        path=source.path(_encode_path(normalized_path)),
-        params=None,
-        query=_encode_params(source, normalized_path, normalized_params),
-        fragment=None,
-    ).geturl()
+def _prepares_params(source):
+    return source.canonical or source.ladder is not None
 
 
-def _netloc(source):
-    if source.port:
-        return ":".join([source.host, str(source.port)])
+def _base_url(source, path):
+    encoded_path = source.prefix + _encode_path(path)
+
+    if encoded_path:
+        return "%s://%s/%s" % (source.scheme(), source.netloc, encoded_path)
+    else:
+        return "%s://%s" % (source.scheme(), source.netloc)
+
+
+def _join_query(base_url, query):
+    if query:
+        return "%s?%s" % (base_url, query)
     else:
-        return source.host
+        return base_url
 
 
 def _encode_path(path):
@@ -65,8 +89,21 @@ def _encode_path_component(path_component):
     return quote(path_component, safe=[])
 
 
-def _encode_params(source, path, params):
-    if source.is_secure():
-        params.update(signature=generate_signature(source, path, urlencode(params)))
+def _encode_params(source, path, params, signature_prefix=None):
+    return _sign_params(source, path, params, utils.encode_params(params), signature_prefix)
 
-    return urlencode(params)
+
+def _sign_params(source, path, params, encoded_params, signature_prefix=None):
+    if signature_prefix is not None:
+        generated_signature = signature.generate_from_prefix(signature_prefix, encoded_params)
+    elif source.is_secure():
+        generated_signature = signature.generate(source, path, encoded_params)
+    else:
+        return encoded_params
+
+    if "signature" in params:
+        return utils.encode_params({**params, "signature": generated_signature})
+    elif encoded_params:
+        return "%s&signature=%s" % (encoded_params, generated_signature)
+    else:
+        return "signature=%s" % generated_signature
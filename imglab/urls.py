@@ -0,0 +1,57 @@
+from .template import Template
+from .url import _source
+
+
+def urls(source, paths, **params):
+    """Returns a list of formatted URL strings for a source, with a list of paths and optional arguments
+
+    The source is resolved and the shared parameters are normalized only once for all the paths. Every element of
+    `paths` can be a path or a tuple with a path and a dict of parameters, which will be added to (or override) the
+    shared ones. Duplicated elements are generated only once.
+
+    :Examples:
+        >>> import imglab
+        >>> imglab.urls("assets", ["example.jpeg", ("example.png", {"format": "webp"})], width=500)
+        ['https://assets.imglab-cdn.net/example.jpeg?width=500', 'https://assets.imglab-cdn.net/example.png?width=500&format=webp']
+
+    :param source: A source name as string or :class:`imglab.Source` object
+    :type source: str, class:`imglab.Source`
+    :param paths: An iterable with paths, or tuples with a path and a dict of parameters
+    :type paths: iterable
+    :param params: The query parameters shared by all the URLs as a keyword argument list
+    :type params: list, optional
+    :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object
+    :return: A list of strings with the generated URLs, in the same order as `paths`
+    :rtype: list
+    """
+    template = Template(_source(source), **params)
+    generated = {}
+
+    return [_url(template, generated, path) for path in paths]
+
+
+def _url(template, generated, path):
+    if isinstance(path, str):
+        key, path, params = path, path, {}
+    else:
+        path, params = path
+        key = _key(path, params)
+
+    if key is None:
+        return template(path, **params)
+
+    if key not in generated:
+        generated[key] = template(path, **params)
+
+    return generated[key]
+
+
+def _key(path, params):
+    key = (path, tuple(params.items()))
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
@@ -0,0 +1,169 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_MISSING = object()
+
+
+class LRU:
+    """A thread-safe mapping with a bounded size, evicting the least recently used entries
+
+    :Examples:
+        >>> from imglab.utils.cache import LRU
+        >>> lru = LRU(2)
+        >>> lru.get_or_set("a", lambda: 1), lru.get_or_set("b", lambda: 2), lru.get_or_set("c", lambda: 3)
+        (1, 2, 3)
+        >>> lru.get("a") is None
+        True
+        >>> lru.info()
+        CacheInfo(hits=0, misses=4, maxsize=2, currsize=2)
+
+    :param maxsize: The maximum number of entries
+    :type maxsize: int
+    :raises ValueError: When maxsize is not a positive integer
+    """
+
+    def __init__(self, maxsize):
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError("Invalid maxsize. A positive integer is expected.")
+
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Returns the value of a key, marking it as the most recently used entry
+
+        :param key: The key of the entry
+        :type key: hashable
+        :param default: A value returned when the key is not found, defaults to None
+        :type default: object, optional
+        :return: The value of the entry or the default value
+        :rtype: object
+        """
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+
+            if value is _MISSING:
+                self._misses += 1
+                return default
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(self, key, value):
+        """Sets the value of a key, evicting the least recently used entry when the maximum size is exceeded
+
+        :param key: The key of the entry
+        :type key: hashable
+        :param value: The value of the entry
+        :type value: object
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key, function):
+        """Returns the value of a key, setting it with the result of a function when the key is not found
+
+        :param key: The key of the entry
+        :type key: hashable
+        :param function: A function without arguments returning the value for the key
+        :type function: callable
+        :return: The value of the entry
+        :rtype: object
+        """
+        value = self.get(key, _MISSING)
+
+        if value is _MISSING:
+            value = function()
+            self.set(key, value)
+
+        return value
+
+    def delete(self, key):
+        """Deletes the entry of a key, if present
+
+        :param key: The key of the entry
+        :type key: hashable
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def evict(self, predicate):
+        """Deletes the entries for which a function returns `True`
+
+        :param predicate: A function receiving the key and the value of an entry and returning a bool
+        :type predicate: callable
+        :return: The number of deleted entries
+        :rtype: int
+        """
+        with self._lock:
+            keys = [key for key, value in self._entries.items() if predicate(key, value)]
+
+            for key in keys:
+                del self._entries[key]
+
+            return len(keys)
+
+    def clear(self):
+        """Deletes all the entries and resets the statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        """Returns the statistics of the cache
+
+        :return: A named tuple with hits, misses, maxsize and currsize values
+        :rtype: class:`CacheInfo`
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+
+def freeze(value):
+    """Returns a hashable representation of a value, keeping the type of scalar values to tell apart `1`, `1.0` and
+    `True`, and converting lists, tuples, ranges and dicts recursively
+
+    Scalar values other than integers and strings are represented by their string form, since equal values (like
+    `0.0` and `-0.0`, or `Decimal("1.5")` and `Decimal("1.50")`) can be encoded differently in URLs.
+
+    :Examples:
+        >>> from imglab.utils import cache as utils
+        >>> utils.freeze([100, 200])
+        ('list', ((<class 'int'>, 100), (<class 'int'>, 200)))
+        >>> utils.freeze(range(100, 200))
+        ('range', 100, 200, 1)
+        >>> utils.freeze(-0.0)
+        (<class 'float'>, '-0.0')
+
+    :param value: A value to be converted
+    :type value: object
+    :raises TypeError: When the value or some nested value is not hashable
+    :return: A hashable representation of the value
+    :rtype: tuple
+    """
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(map(freeze, value)))
+    elif isinstance(value, range):
+        return ("range", value.start, value.stop, value.step)
+    elif isinstance(value, dict):
+        return ("dict", tuple((freeze(key), freeze(item)) for key, item in value.items()))
+    elif isinstance(value, (int, str)):
+        return (type(value), value)
+    else:
+        hash(value)
+        return (type(value), str(value))
@@ -1,6 +1,6 @@
-from itertools import zip_longest
+from itertools import repeat, zip_longest
 
-from ..sequence import sequence, DEFAULT_SIZE as SEQUENCE_DEFAULT_SIZE
+from ..sequence import cached_sequence, DEFAULT_SIZE as SEQUENCE_DEFAULT_SIZE
 
 NORMALIZE_KEYS = ["dpr", "width"]
 
@@ -41,10 +41,7 @@ def split_params_dpr(params):
     :return: A list of dicts with parameters to be used for every URL in a srcset
     :rtype: list
     """
-    return list(
-        _merge_params(params, {"dpr": dpr, "quality": quality})
-        for dpr, quality in _split_values(params, SPLIT_DPR_KEYS, _split_size_dpr(params["dpr"]))
-    )
+    return [_merge_params(params, SPLIT_DPR_KEYS, values) for values in split_values_dpr(params)]
 
 
 def split_params_width(params):
@@ -62,10 +59,41 @@ def split_params_width(params):
     :return: A list of dicts with parameters to be used for every URL in a srcset
     :rtype: list
     """
-    return list(
-        _merge_params(params, {"width": width, "height": height, "quality": quality})
-        for width, height, quality in _split_values(params, SPLIT_WIDTH_KEYS, _split_size_width(params["width"]))
-    )
+    return [_merge_params(params, SPLIT_WIDTH_KEYS, values) for values in split_values_width(params)]
+
+
+def split_values_dpr(params):
+    """Returns a lazy iterator of tuples with the dpr and quality values to use in every URL of a srcset split by dpr
+    parameter, using `None` when a list of values is shorter than the others
+
+    :Examples:
+        >>> from imglab.utils import srcset as utils
+        >>> list(utils.split_values_dpr({"width": 100, "dpr": [1, 2], "quality": [75], "format": "png"}))
+        [(1, 75), (2, None)]
+
+    :param params: A dict with params to be split by dpr
+    :type params: dict
+    :return: An iterator of tuples with values for every key in `SPLIT_DPR_KEYS`
+    :rtype: iterator
+    """
+    return _split_values(params, SPLIT_DPR_KEYS, _split_size_dpr(params["dpr"]))
+
+
+def split_values_width(params):
+    """Returns a lazy iterator of tuples with the width, height and quality values to use in every URL of a srcset
+    split by width parameter, using `None` when a list of values is shorter than the others
+
+    :Examples:
+        >>> from imglab.utils import srcset as utils
+        >>> list(utils.split_values_width({"width": [100, 200], "height": [300], "format": "png"}))
+        [(100, 300, None), (200, None, None)]
+
+    :param params: A dict with params to be split by width
+    :type params: dict
+    :return: An iterator of tuples with values for every key in `SPLIT_WIDTH_KEYS`
+    :rtype: iterator
+    """
+    return _split_values(params, SPLIT_WIDTH_KEYS, _split_size_width(params["width"]))
 
 
 def _split_size_dpr(value):
@@ -83,19 +111,19 @@ def _split_size_width(value):
 
 
 def _split_values(params, keys, size):
-    return list(zip_longest(*[_split_value(key, params.get(key), size) for key in keys]))
+    return zip_longest(*[_split_value(key, params.get(key), size) for key in keys])
 
 
 def _split_value(key, value, size):
     if key == "dpr" and isinstance(value, range):
-        return list(range(value.start, value.stop + 1))
+        return range(value.start, value.stop + 1)
     elif isinstance(value, range):
-        return sequence(value.start, value.stop, size)
+        return cached_sequence(value.start, value.stop, size)
     elif isinstance(value, list):
         return value
     else:
-        return [value] * size
+        return repeat(value, size)
 
 
-def _merge_params(params, merge_params):
-    return {**params, **{key: value for key, value in merge_params.items() if key in params}}
+def _merge_params(params, keys, values):
+    return {**params, **{key: value for key, value in zip(keys, values) if key in params}}
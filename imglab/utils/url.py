@@ -1,8 +1,7 @@
-from time import struct_time
-from datetime import datetime
-from calendar import timegm
 from urllib.parse import urlparse
 
+from ..params import PARAMS, SAFE_CHARACTERS, _encode_value
+
 WEB_URI_SCHEMES = ["https", "http"]
 
 
@@ -43,7 +42,65 @@ def normalize_params(params):
     :return: A dict with the normalized params
     :rtype: dict
     """
-    return dict(_normalize_param(_dasherize(key), value) for key, value in params.items())
+    normalized_params = {}
+
+    for key, value in params.items():
+        param = PARAMS.get(key)
+
+        if param is None:
+            normalized_params[_dasherize(key)] = "" if value is None else value
+        else:
+            normalized_params[param.name] = param.normalize(value)
+
+    return normalized_params
+
+
+def encode_params(params):
+    """Returns a query string with the encoded params, identical to the one returned by `urllib.parse.urlencode`
+
+    Values of known params are encoded by the encoder of their type, so integer and boolean values and strings without
+    reserved characters are added as they are, skipping the generic encoding.
+
+    :Examples:
+        >>> from imglab.utils import url as utils
+        >>> utils.encode_params({"width": 200, "format": "webp"})
+        'width=200&format=webp'
+        >>> utils.encode_params({"background-color": "255,128,122", "text": "hello world"})
+        'background-color=255%2C128%2C122&text=hello+world'
+
+    :param params: A dict with params to be encoded
+    :type params: dict
+    :return: A string with the encoded params
+    :rtype: str
+    """
+    return "&".join(encode_param(key, value) for key, value in params.items())
+
+
+def encode_param(key, value):
+    """Returns an encoded query string fragment for a single param, as it would be encoded by :func:`encode_params`
+
+    :Examples:
+        >>> from imglab.utils import url as utils
+        >>> utils.encode_param("width", 200)
+        'width=200'
+        >>> utils.encode_param("crop", "left,top")
+        'crop=left%2Ctop'
+
+    :param key: The name of the param
+    :type key: str
+    :param value: The value of the param
+    :type value: object
+    :return: A string with the encoded param
+    :rtype: str
+    """
+    param = PARAMS.get(key)
+
+    if param is None:
+        return "%s=%s" % (_encode_value(key), _encode_value(value))
+    else:
+        # Names of known params only have unreserved characters, and their values are encoded by the encoder of their
+        # type, adding integer and boolean values as they are
+        return "%s=%s" % (key, param.encode(value))
 
 
 def is_web_uri(uri):
@@ -73,14 +130,3 @@ def is_web_uri(uri):
 
 def _dasherize(value):
     return value.replace("_", "-")
-
-
-def _normalize_param(key, value):
-    if key == "expires" and isinstance(value, struct_time):
-        return (key, timegm(value))
-    elif key == "expires" and isinstance(value, datetime):
-        return (key, timegm(value.timetuple()))
-    elif value == None:
-        return (key, "")
-    else:
-        return (key, value)
@@ -0,0 +1,154 @@
+import time
+from collections import namedtuple
+from hmac import compare_digest
+
+from . import signature
+from .parse import ParsedURL, parse
+from .url import _source
+from .utils import url as utils
+
+MALFORMED = "malformed"
+WRONG_SOURCE = "wrong_source"
+MISSING_SIGNATURE = "missing_signature"
+BAD_SIGNATURE = "bad_signature"
+EXPIRED = "expired"
+
+
+class Verification(namedtuple("Verification", ["valid", "reason"])):
+    """A named tuple with the result of a verification, evaluated as `True` only when the URL is valid
+
+    The reason is None for valid URLs, and one of `malformed`, `wrong_source`, `missing_signature`, `bad_signature` or
+    `expired` otherwise.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self):
+        return self.valid
+
+
+VALID = Verification(True, None)
+
+
+def verify(url_or_parts, source, now=None):
+    """Returns if a URL was signed by a secure source and has not expired, with the reason when it is not valid
+
+    The signature is generated again with the same rules as `imglab.signature.generate` and compared in constant time.
+
+    :Examples:
+        >>> import imglab
+        >>> source = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+        >>> url = imglab.url(source, "example.jpeg", width=200, expires=1464096368)
+        >>> imglab.verify(url, source, now=1464096000)
+        Verification(valid=True, reason=None)
+        >>> imglab.verify(url, source, now=1464096400)
+        Verification(valid=False, reason='expired')
+        >>> imglab.verify(url.replace("width=200", "width=300"), source, now=1464096000)
+        Verification(valid=False, reason='bad_signature')
+
+    :param url_or_parts: The URL as string or bytes, or the value returned by `imglab.parse` for it
+    :type url_or_parts: str, bytes, class:`imglab.parse.ParsedURL`
+    :param source: A source name as string or :class:`imglab.Source` object with a secure key and salt
+    :type source: str, class:`imglab.Source`
+    :param now: The timestamp compared with `expires` param, defaults to the current time
+    :type now: int, float, optional
+    :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object or is not secure
+    :return: A named tuple with valid and reason values
+    :rtype: class:`imglab.verify.Verification`
+    """
+    return _Verifier(_source(source)).verify(url_or_parts, now)
+
+
+def verify_many(urls, source, now=None):
+    """Returns a lazy iterator with the verification of every URL, as returned by :func:`verify`
+
+    The settings of the source are resolved once, and the HMAC state fed with a path is reused by consecutive URLs
+    with the same path, like the candidates of a srcset.
+
+    :Examples:
+        >>> import imglab
+        >>> source = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+        >>> urls = [imglab.url(source, "example.jpeg", width=200), "https://assets.imglab-cdn.net/example.jpeg"]
+        >>> [verification.reason for verification in imglab.verify_many(urls, source)]
+        [None, 'missing_signature']
+
+    :param urls: An iterable of URLs as strings or bytes, or values returned by `imglab.parse`
+    :type urls: iterable
+    :param source: A source name as string or :class:`imglab.Source` object with a secure key and salt
+    :type source: str, class:`imglab.Source`
+    :param now: The timestamp compared with `expires` params, defaults to the current time when every URL is verified
+    :type now: int, float, optional
+    :raises ValueError: When the specified source is not a string or a :class:`imglab.Source` object or is not secure
+    :return: An iterator of :class:`imglab.verify.Verification` named tuples
+    :rtype: iterator
+    """
+    verifier = _Verifier(_source(source))
+
+    return (verifier.verify(url, now) for url in urls)
+
+
+class _Verifier:
+    def __init__(self, source):
+        if not source.is_secure():
+            raise ValueError("Invalid source. A source with secure_key and secure_salt is expected.")
+
+        self._source = source
+        self._settings = (source.scheme(), source._host, source.port, source.subdomains, source.name)
+        self._path = None
+        self._prefix = None
+
+    def verify(self, url, now):
+        try:
+            if isinstance(url, ParsedURL):
+                parsed, query = url, None
+            else:
+                if isinstance(url, (bytes, bytearray)):
+                    url = url.decode()
+
+                parsed, query = parse(url, host=self._source._host), _query(url)
+        except (ValueError, AttributeError):
+            return Verification(False, MALFORMED)
+
+        if (parsed.scheme, parsed.host, parsed.port, parsed.subdomains, parsed.name) != self._settings:
+            return Verification(False, WRONG_SOURCE)
+
+        if parsed.signature is None:
+            return Verification(False, MISSING_SIGNATURE)
+
+        encoded_params = utils.encode_params(parsed.params) if query is None else _unsigned_query(query)
+        generated_signature = signature.generate_from_prefix(self._prefix_for(parsed.path), encoded_params)
+
+        if not compare_digest(generated_signature.encode(), parsed.signature.encode()):
+            return Verification(False, BAD_SIGNATURE)
+
+        expires = parsed.params.get("expires")
+
+        if expires is None:
+            return VALID
+        elif type(expires) is not int:
+            return Verification(False, MALFORMED)
+        elif expires < (time.time() if now is None else now):
+            return Verification(False, EXPIRED)
+        else:
+            return VALID
+
+    def _prefix_for(self, path):
+        if path != self._path:
+            self._path, self._prefix = path, signature.prefix(self._source, path)
+
+        return self._prefix
+
+
+def _query(url):
+    return url.partition("?")[2].partition("#")[0]
+
+
+def _unsigned_query(query):
+    head, separator, tail = query.rpartition("&signature=")
+
+    if separator and "&" not in tail:
+        return head
+    elif query.startswith("signature=") and "&" not in query:
+        return ""
+    else:
+        return "&".join(fragment for fragment in query.split("&") if not fragment.startswith("signature="))
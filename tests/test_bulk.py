@@ -0,0 +1,91 @@
+import sys
+import unittest
+import doctest
+
+import imglab
+from imglab import bulk
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "bulk generation requires Python 3.7 or later")
+class TestBulk(unittest.TestCase):
+    SECURE_KEY = "ixUd9is/LDGBw6NPfLCGLjO/WraJlHdytC1+xiIFj22mXAWs/6R6ws4gxSXbDcUHMHv0G+oiTgyfMVsRS2b3"
+    SECURE_SALT = "c9G9eYKCeWen7vkEyV1cnr4MZkfLI/yo6j72JItzKHjMGDNZKqPFzRtup//qiT51HKGJrAha6Gv2huSFLwJr"
+
+    def setUp(self):
+        self.source = imglab.Source("assets", secure_key=self.SECURE_KEY, secure_salt=self.SECURE_SALT)
+        self.paths = ["%d/example.jpeg" % i for i in range(25)]
+
+    def test_urls_ordered(self):
+        urls = bulk.urls(self.source, iter(self.paths), workers=2, chunksize=3, width=200, format="png")
+
+        self.assertEqual(list(urls), imglab.urls(self.source, self.paths, width=200, format="png"))
+
+    def test_urls_unordered(self):
+        urls = bulk.urls(self.source, self.paths, workers=2, chunksize=4, ordered=False, width=200)
+
+        self.assertEqual(sorted(urls), list(enumerate(imglab.urls(self.source, self.paths, width=200))))
+
+    def test_urls_with_paths_and_params(self):
+        paths = [("example.jpeg", {"width": 400}), "example.png"]
+
+        self.assertEqual(list(bulk.urls("assets", paths, workers=1, width=200)), imglab.urls("assets", paths, width=200))
+
+    def test_srcsets_ordered(self):
+        srcsets = bulk.srcsets(self.source, self.paths, workers=2, chunksize=5, width=200, dpr=[1, 2])
+
+        self.assertEqual(list(srcsets), [imglab.srcset(self.source, path, width=200, dpr=[1, 2]) for path in self.paths])
+
+    def test_srcsets_unordered(self):
+        srcsets = bulk.srcsets(self.source, self.paths[:4], workers=2, chunksize=1, ordered=False)
+
+        self.assertEqual(sorted(srcsets), [(i, imglab.srcset(self.source, path)) for i, path in enumerate(self.paths[:4])])
+
+    def test_srcsets_with_paths_and_params(self):
+        paths = [("example.jpeg", {"width": 400}), "example.png"]
+        expected = [
+            imglab.srcset("assets", "example.jpeg", width=400, format="webp"),
+            imglab.srcset("assets", "example.png", width=200, format="webp"),
+        ]
+
+        self.assertEqual(list(bulk.srcsets("assets", paths, workers=1, width=200, format="webp")), expected)
+
+    def test_urls_without_paths(self):
+        self.assertEqual(list(bulk.urls(self.source, [], workers=1)), [])
+
+    def test_urls_with_invalid_source(self):
+        with self.assertRaises(ValueError):
+            bulk.urls(None, self.paths)
+
+    def test_urls_with_invalid_chunksize(self):
+        with self.assertRaises(ValueError):
+            bulk.urls(self.source, self.paths, chunksize=0)
+
+    def test_srcsets_with_errors(self):
+        paths = ["a.jpeg", ("b.jpeg", {"dpr": [1, 2]}), "c.jpeg"]
+
+        with self.assertRaises(ValueError):
+            list(bulk.srcsets("assets", paths, workers=1, width=[100, 200]))
+
+        srcsets = list(bulk.srcsets("assets", paths, workers=1, return_errors=True, width=[100, 200]))
+
+        self.assertEqual(srcsets[0], imglab.srcset("assets", "a.jpeg", width=[100, 200]))
+        self.assertEqual(srcsets[1], bulk.Error("dpr as list is not allowed when width is list or range"))
+        self.assertEqual(srcsets[2], imglab.srcset("assets", "c.jpeg", width=[100, 200]))
+
+
+@unittest.skipIf(sys.version_info >= (3, 7), "bulk generation is supported on Python 3.7 or later")
+class TestBulkUnsupported(unittest.TestCase):
+    def test_urls(self):
+        with self.assertRaises(RuntimeError):
+            bulk.urls("assets", ["example.jpeg"], width=200)
+
+
+def load_tests(loader, tests, ignore):
+    if sys.version_info >= (3, 7):
+        tests.addTests(doctest.DocTestSuite("imglab.bulk"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
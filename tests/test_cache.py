@@ -0,0 +1,198 @@
+import unittest
+import doctest
+from unittest import mock
+
+from time import gmtime
+from datetime import datetime
+from decimal import Decimal
+
+import imglab
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = imglab.Cache(maxsize=2)
+
+    def test_url(self):
+        self.assertEqual(self.cache.url("assets", "example.jpeg", width=200), imglab.url("assets", "example.jpeg", width=200))
+        self.assertEqual(self.cache.url("assets", "example.jpeg", width=200), imglab.url("assets", "example.jpeg", width=200))
+        self.assertEqual(self.cache.cache_info(), (1, 1, 2, 1))
+
+    def test_srcset(self):
+        srcset = imglab.srcset("assets", "example.jpeg", width=range(100, 400), quality=[80, 70])
+
+        self.assertEqual(self.cache.srcset("assets", "example.jpeg", width=range(100, 400), quality=[80, 70]), srcset)
+        self.assertEqual(self.cache.srcset("assets", "example.jpeg", width=range(100, 400), quality=[80, 70]), srcset)
+        self.assertEqual(self.cache.cache_info(), (1, 1, 2, 1))
+
+    def test_url_and_srcset_with_same_params(self):
+        self.assertEqual(self.cache.url("assets", "example.jpeg", width=200), imglab.url("assets", "example.jpeg", width=200))
+        self.assertEqual(self.cache.srcset("assets", "example.jpeg", width=200), imglab.srcset("assets", "example.jpeg", width=200))
+        self.assertEqual(self.cache.cache_info().misses, 2)
+
+    def test_normalized_keys(self):
+        self.cache.url("assets", "/example.jpeg/", trim_color="orange", expires=gmtime(1464096368))
+        self.cache.url("assets", "example.jpeg", **{"trim-color": "orange", "expires": datetime.fromtimestamp(1464096368)})
+
+        self.assertEqual(self.cache.cache_info(), (1, 1, 2, 1))
+
+    def test_params_with_different_types(self):
+        self.assertEqual(self.cache.url("assets", "example.jpeg", dpr=1), "https://assets.imglab-cdn.net/example.jpeg?dpr=1")
+        self.assertEqual(self.cache.url("assets", "example.jpeg", dpr=1.0), "https://assets.imglab-cdn.net/example.jpeg?dpr=1.0")
+        self.assertEqual(self.cache.url("assets", "example.jpeg", dpr=True), "https://assets.imglab-cdn.net/example.jpeg?dpr=True")
+
+    def test_params_with_equal_values(self):
+        self.assertEqual(self.cache.url("assets", "example.jpeg", rotate=0.0), "https://assets.imglab-cdn.net/example.jpeg?rotate=0.0")
+        self.assertEqual(self.cache.url("assets", "example.jpeg", rotate=-0.0), "https://assets.imglab-cdn.net/example.jpeg?rotate=-0.0")
+        self.assertEqual(self.cache.url("assets", "example.jpeg", dpr=Decimal("1.5")), "https://assets.imglab-cdn.net/example.jpeg?dpr=1.5")
+        self.assertEqual(self.cache.url("assets", "example.jpeg", dpr=Decimal("1.50")), "https://assets.imglab-cdn.net/example.jpeg?dpr=1.50")
+
+    def test_params_order(self):
+        self.assertEqual(self.cache.url("assets", "example.jpeg", width=200, height=300), "https://assets.imglab-cdn.net/example.jpeg?width=200&height=300")
+        self.assertEqual(self.cache.url("assets", "example.jpeg", height=300, width=200), "https://assets.imglab-cdn.net/example.jpeg?height=300&width=200")
+
+    def test_eviction(self):
+        self.cache.url("assets", "a.jpeg")
+        self.cache.url("assets", "b.jpeg")
+        self.cache.url("assets", "a.jpeg")
+        self.cache.url("assets", "c.jpeg")
+        self.cache.url("assets", "a.jpeg")
+        self.cache.url("assets", "b.jpeg")
+
+        self.assertEqual(self.cache.cache_info(), (2, 4, 2, 2))
+
+    def test_sources_with_different_settings(self):
+        self.assertEqual(self.cache.url(imglab.Source("assets"), "example.jpeg"), "https://assets.imglab-cdn.net/example.jpeg")
+        self.assertEqual(self.cache.url(imglab.Source("assets", https=False), "example.jpeg"), "http://assets.imglab-cdn.net/example.jpeg")
+        self.assertEqual(self.cache.cache_info().hits, 0)
+
+    def test_sources_with_rotated_keys(self):
+        source = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+        rotated_source = imglab.Source("assets", secure_key="ixUd9is/LDGBw6NP", secure_salt="ITvYA2lPfyz0w8/v")
+
+        self.assertEqual(self.cache.url(source, "example.jpeg"), imglab.url(source, "example.jpeg"))
+        self.assertEqual(self.cache.url(rotated_source, "example.jpeg"), imglab.url(rotated_source, "example.jpeg"))
+        self.assertNotEqual(imglab.url(source, "example.jpeg"), imglab.url(rotated_source, "example.jpeg"))
+
+    def test_unhashable_params(self):
+        self.assertEqual(self.cache.url("assets", "example.jpeg", width={200}), imglab.url("assets", "example.jpeg", width={200}))
+        self.assertEqual(self.cache.cache_info(), (0, 0, 2, 0))
+
+    def test_cache_clear(self):
+        self.cache.url("assets", "example.jpeg")
+        self.cache.url("assets", "example.jpeg")
+        self.cache.cache_clear()
+
+        self.assertEqual(self.cache.cache_info(), (0, 0, 2, 0))
+
+    def test_invalid_source(self):
+        with self.assertRaises(ValueError):
+            self.cache.url(None, "example.jpeg")
+
+        with self.assertRaises(ValueError):
+            self.cache.srcset(None, "example.jpeg")
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            imglab.Cache(maxsize=0)
+
+
+class TestSignedCache(unittest.TestCase):
+    SECURE_KEY = "55IX1RVlDHpgl/4D"
+    SECURE_SALT = "ITvYA2lPfyz0w8/v"
+
+    def setUp(self):
+        self.now = 1464096000
+        self.source = imglab.Source("assets", secure_key=self.SECURE_KEY, secure_salt=self.SECURE_SALT)
+        self.cache = imglab.SignedCache(3600, 600, maxsize=2, beta=0, clock=lambda: self.now)
+
+    def test_url(self):
+        url = imglab.url(self.source, "example.jpeg", width=200, expires=1464100200)
+
+        self.assertEqual(self.cache.url(self.source, "example.jpeg", width=200), url)
+
+        self.now += 599
+
+        self.assertEqual(self.cache.url(self.source, "example.jpeg", width=200), url)
+        self.assertEqual(self.cache.cache_info(), (1, 1, 2, 1))
+
+    def test_srcset(self):
+        srcset = imglab.srcset(self.source, "example.jpeg", width=[200, 400], expires=1464100200)
+
+        self.assertEqual(self.cache.srcset(self.source, "example.jpeg", width=[200, 400]), srcset)
+        self.assertEqual(self.cache.srcset(self.source, "example.jpeg", width=[200, 400]), srcset)
+        self.assertEqual(self.cache.cache_info(), (1, 1, 2, 1))
+
+    def test_url_with_expires_param(self):
+        with self.assertRaises(ValueError):
+            self.cache.url(self.source, "example.jpeg", width=200, expires=1)
+
+        with self.assertRaises(ValueError):
+            self.cache.srcset(self.source, "example.jpeg", width=[200, 400], expires=1)
+
+        self.assertEqual(self.cache.cache_info().currsize, 0)
+
+    def test_url_after_bucket_rollover(self):
+        self.cache.url(self.source, "example.jpeg", width=200)
+
+        self.now += 600
+
+        self.assertEqual(
+            self.cache.url(self.source, "example.jpeg", width=200),
+            imglab.url(self.source, "example.jpeg", width=200, expires=1464100800),
+        )
+
+    def test_eviction_after_bucket_rollover(self):
+        self.cache.url(self.source, "a.jpeg")
+        self.cache.url(self.source, "b.jpeg")
+
+        self.now += 600
+        self.cache.url(self.source, "a.jpeg")
+
+        self.assertEqual(self.cache.cache_info().currsize, 1)
+
+    def test_early_refresh(self):
+        cache = imglab.SignedCache(3600, 600, beta=1e12, clock=lambda: self.now)
+
+        self.assertEqual(
+            cache.url(self.source, "example.jpeg"), imglab.url(self.source, "example.jpeg", expires=1464100200)
+        )
+
+        with mock.patch("random.random", return_value=0.5):
+            self.assertEqual(
+                cache.url(self.source, "example.jpeg"), imglab.url(self.source, "example.jpeg", expires=1464100800)
+            )
+
+    def test_unhashable_params(self):
+        self.assertEqual(
+            self.cache.url(self.source, "example.jpeg", width={200}),
+            imglab.url(self.source, "example.jpeg", width={200}, expires=1464100200),
+        )
+        self.assertEqual(self.cache.cache_info(), (0, 0, 2, 0))
+
+    def test_cache_clear(self):
+        self.cache.url(self.source, "example.jpeg")
+        self.cache.cache_clear()
+
+        self.assertEqual(self.cache.cache_info(), (0, 0, 2, 0))
+
+    def test_invalid_arguments(self):
+        for expires_in, expires_bucket in [(3600, None), (3600, 0), (-1, 600)]:
+            with self.assertRaises(ValueError):
+                imglab.SignedCache(expires_in, expires_bucket)
+
+        with self.assertRaises(ValueError):
+            imglab.SignedCache(3600, 600, maxsize=0)
+
+        with self.assertRaises(ValueError):
+            self.cache.url(None, "example.jpeg")
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.cache"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import imglab
+from imglab.cli import main
+
+
+class TestCli(unittest.TestCase):
+    SECURE_KEY = "55IX1RVlDHpgl/4D"
+    SECURE_SALT = "ITvYA2lPfyz0w8/v"
+
+    def run_cli(self, argv, stdin=""):
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        with mock.patch("sys.stdin", io.StringIO(stdin)), mock.patch("sys.stdout", stdout):
+            with mock.patch("sys.stderr", stderr):
+                status = main(argv)
+
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_urls(self):
+        stdin = "example.jpeg\nsub folder/example.png\n"
+        status, stdout, _ = self.run_cli(["--source", "assets", "-p", "width=500"], stdin)
+
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            stdout,
+            "example.jpeg\thttps://assets.imglab-cdn.net/example.jpeg?width=500\n"
+            "sub folder/example.png\thttps://assets.imglab-cdn.net/sub%20folder/example.png?width=500\n",
+        )
+
+    def test_urls_with_json_lines(self):
+        stdin = '{"path": "example.jpeg", "params": {"format": "png"}}\n\n{"path": "example.png"}\n'
+        argv = ["--source", "assets", "--params", '{"width": 500}', "--format", "jsonl"]
+        status, stdout, _ = self.run_cli(argv, stdin)
+
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            [json.loads(line) for line in stdout.splitlines()],
+            [
+                {"path": "example.jpeg", "url": imglab.url("assets", "example.jpeg", width=500, format="png")},
+                {"path": "example.png", "url": imglab.url("assets", "example.png", width=500)},
+            ],
+        )
+
+    def test_urls_with_source_options(self):
+        argv = ["--source", "assets", "--host", "imglab.net", "--port", "8080", "--http", "--no-subdomains"]
+        argv += ["--secure-key", self.SECURE_KEY, "--secure-salt", self.SECURE_SALT, "--format", "csv"]
+        source = imglab.Source(
+            "assets",
+            host="imglab.net",
+            port=8080,
+            https=False,
+            subdomains=False,
+            secure_key=self.SECURE_KEY,
+            secure_salt=self.SECURE_SALT,
+        )
+
+        status, stdout, _ = self.run_cli(argv, "example.jpeg\n")
+
+        self.assertEqual(status, 0)
+        self.assertEqual(stdout, "example.jpeg,%s\n" % imglab.url(source, "example.jpeg"))
+
+    def test_urls_with_canonical_source(self):
+        stdin = '{"path": "example.jpeg", "params": {"dpr": 1, "format": "webp"}}\n'
+        status, stdout, _ = self.run_cli(["--source", "assets", "--canonical", "-p", "width=0500"], stdin)
+
+        self.assertEqual(status, 0)
+        self.assertEqual(stdout, "example.jpeg\thttps://assets.imglab-cdn.net/example.jpeg?width=500&format=webp\n")
+
+    def test_srcsets(self):
+        stdin = 'example.jpeg\n{"path": "example.png", "params": {"width": [100, 300]}}\n'
+        argv = ["--source", "assets", "--srcset", "--params", '{"width": [100, 200]}', "--format", "jsonl"]
+
+        status, stdout, _ = self.run_cli(argv, stdin)
+
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            [json.loads(line)["srcset"] for line in stdout.splitlines()],
+            [
+                imglab.srcset("assets", "example.jpeg", width=[100, 200]),
+                imglab.srcset("assets", "example.png", width=[100, 300]),
+            ],
+        )
+
+    def test_srcsets_in_single_line(self):
+        status, stdout, _ = self.run_cli(["--source", "assets", "--srcset", "-p", "width=100"], "example.jpeg\n")
+
+        self.assertEqual(status, 0)
+        srcset = imglab.srcset("assets", "example.jpeg", width=100)
+
+        self.assertEqual(stdout, "example.jpeg\t%s\n" % srcset.replace(",\n", ", "))
+
+    @unittest.skipIf(sys.version_info < (3, 7), "worker processes require Python 3.7 or later")
+    def test_workers(self):
+        stdin = "".join("%d/example.jpeg\n" % i for i in range(20))
+        stdin += '{"path": "example.png", "params": {"width": 300}}\n'
+        argv = ["--source", "assets", "-p", "width=200", "--workers", "2", "--chunksize", "3"]
+
+        status, stdout, _ = self.run_cli(argv, stdin)
+        status_srcset, stdout_srcset, _ = self.run_cli(argv + ["--srcset"], stdin)
+
+        self.assertEqual((status, status_srcset), (0, 0))
+        self.assertEqual(stdout, self.run_cli(argv[:-4], stdin)[1])
+        self.assertEqual(stdout_srcset, self.run_cli(argv[:-4] + ["--srcset"], stdin)[1])
+
+    @unittest.skipIf(sys.version_info < (3, 7), "worker processes require Python 3.7 or later")
+    def test_workers_generation_error(self):
+        stdin = 'a.jpeg\n{"path": "b.jpeg", "params": {"width": [100], "dpr": [1, 2]}}\nc.jpeg\n'
+        argv = ["--source", "assets", "--srcset", "--workers", "2", "--chunksize", "2"]
+
+        status, stdout, stderr = self.run_cli(argv, stdin)
+
+        self.assertEqual(status, 1)
+        self.assertEqual((stdout, stderr), self.run_cli(argv[:-4], stdin)[1:])
+        self.assertIn("line 2: dpr as list is not allowed", stderr)
+
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            names = [os.path.join(directory, name) for name in ["a.txt", "b.txt"]]
+
+            for name, path in zip(names, ["a.jpeg", "b.jpeg"]):
+                with open(name, "w") as file:
+                    file.write(path + "\n")
+
+            argv = ["--source", "assets", "--format", "csv", names[0], "-", names[1]]
+            status, stdout, _ = self.run_cli(argv, "c.jpeg")
+
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            [line.split(",")[0] for line in stdout.splitlines()],
+            ["a.jpeg", "c.jpeg", "b.jpeg"],
+        )
+
+    def test_invalid_lines(self):
+        status, stdout, stderr = self.run_cli(["--source", "assets"], 'a.jpeg\n{"path": 1}\n{invalid\nb.jpeg\n')
+
+        self.assertEqual(status, 1)
+        self.assertEqual([line.split("\t")[0] for line in stdout.splitlines()], ["a.jpeg", "b.jpeg"])
+        self.assertIn("line 2", stderr)
+        self.assertIn("line 3", stderr)
+
+    def test_lines_input(self):
+        status, stdout, _ = self.run_cli(["--source", "assets", "--input", "lines"], "{a}.jpeg\n")
+
+        self.assertEqual(status, 0)
+        self.assertEqual(stdout, "{a}.jpeg\thttps://assets.imglab-cdn.net/%7Ba%7D.jpeg\n")
+
+    def test_invalid_arguments(self):
+        for argv in [
+            ["--source", "assets", "--params", "[1]"],
+            ["--source", "assets", "-p", "width"],
+            ["--source", "assets", "--secure-key", "invalid", "--secure-salt", "invalid"],
+            ["--source", "assets", "--srcset", "--params", '{"width": [100], "dpr": [1, 2]}'],
+            ["--source", "assets", "--chunksize", "0"],
+        ]:
+            with self.assertRaises(SystemExit) as context:
+                self.run_cli(argv)
+
+            self.assertEqual(context.exception.code, 2)
+
+    def test_generation_error(self):
+        argv = ["--source", "assets", "--srcset"]
+        stdin = 'a.jpeg\n{"path": "b.jpeg", "params": {"width": [100], "dpr": [1, 2]}}\nc.jpeg\n'
+        status, stdout, stderr = self.run_cli(argv, stdin)
+
+        self.assertEqual(status, 1)
+        self.assertEqual([line.split("\t")[0] for line in stdout.splitlines()], ["a.jpeg", "c.jpeg"])
+        self.assertIn("line 2: dpr as list is not allowed", stderr)
+
+    def test_generation_error_in_urls(self):
+        url = imglab.Template.__call__
+
+        def call(template, path, **params):
+            if path == "b.jpeg":
+                raise ValueError("invalid path")
+
+            return url(template, path, **params)
+
+        with mock.patch.object(imglab.Template, "__call__", call):
+            status, stdout, stderr = self.run_cli(["--source", "assets"], "a.jpeg\nb.jpeg\nc.jpeg\n")
+
+        self.assertEqual(status, 1)
+        self.assertEqual([line.split("\t")[0] for line in stdout.splitlines()], ["a.jpeg", "c.jpeg"])
+        self.assertEqual(stderr, "imglab: line 2: invalid path\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
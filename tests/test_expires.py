@@ -0,0 +1,44 @@
+import unittest
+import doctest
+from unittest import mock
+
+import imglab
+
+
+class TestExpires(unittest.TestCase):
+    def test_expires(self):
+        self.assertEqual(imglab.expires(3600, now=1464096368), 1464099968)
+        self.assertEqual(imglab.expires(3600, now=1464096368.2), 1464099969)
+        self.assertEqual(imglab.expires(0, now=1464096368), 1464096368)
+
+    def test_expires_with_current_time(self):
+        with mock.patch("time.time", return_value=1464096368):
+            self.assertEqual(imglab.expires(3600), 1464099968)
+
+    def test_expires_with_bucket(self):
+        self.assertEqual(imglab.expires(3600, 600, now=1464096000), 1464100200)
+        self.assertEqual(imglab.expires(3600, 600, now=1464096599.9), 1464100200)
+        self.assertEqual(imglab.expires(3600, 600, now=1464096600), 1464100800)
+
+    def test_expires_with_bucket_is_valid_during_expires_in(self):
+        for now in range(1464096000, 1464097200, 7):
+            expires = imglab.expires(3600, 600, now=now)
+
+            self.assertGreater(expires, now + 3600)
+            self.assertLessEqual(expires, now + 3600 + 600)
+            self.assertEqual(expires % 600, 0)
+
+    def test_invalid_arguments(self):
+        for expires_in, expires_bucket in [(-1, None), ("3600", None), (None, None), (3600, 0), (3600, 60.5)]:
+            with self.assertRaises(ValueError):
+                imglab.expires(expires_in, expires_bucket)
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.expires"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
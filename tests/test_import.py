@@ -0,0 +1,79 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import imglab
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["base64", "calendar", "datetime", "hashlib", "hmac", "urllib.parse", "imglab.url", "imglab.layout"]
+
+# A generous budget for the cumulative time of `import imglab`, far above the time of a lazy import but below the
+# time of importing all the modules used to generate URLs
+IMPORT_TIME_BUDGET = 0.015
+
+
+def _run(statement):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    return result.stdout, result.stderr
+
+
+def _import_time(stderr):
+    for line in stderr.splitlines():
+        _, _, module = line.rpartition("|")
+
+        if module.strip() == "imglab":
+            return int(line.split("|")[1]) / 1000000
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "lazy imports require Python 3.7 or later")
+class TestImport(unittest.TestCase):
+    def test_heavy_modules_not_imported(self):
+        stdout, _ = _run("import sys, imglab; print(' '.join(sorted(sys.modules)))")
+        modules = stdout.split()
+
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_import_time_budget(self):
+        times = [_import_time(_run("import imglab")[1]) for _ in range(3)]
+
+        self.assertLess(min(times), IMPORT_TIME_BUDGET)
+
+    def test_public_attributes(self):
+        for name in imglab.__all__:
+            self.assertTrue(callable(getattr(imglab, name)))
+
+        self.assertEqual(imglab.params.lookup("width").name, "width")
+        self.assertTrue(callable(imglab.sources.register))
+
+    def test_functions_not_shadowed_by_submodules(self):
+        stdout, _ = _run(
+            "import imglab.cache, imglab.bulk, imglab; "
+            "print(imglab.url('assets', 'a.jpeg')); print(imglab.srcset('assets', 'a.jpeg', width=[100]))"
+        )
+
+        self.assertEqual(
+            stdout.splitlines(),
+            ["https://assets.imglab-cdn.net/a.jpeg", "https://assets.imglab-cdn.net/a.jpeg?width=100 100w"],
+        )
+
+    def test_dir(self):
+        self.assertTrue(set(imglab.__all__) <= set(dir(imglab)))
+        self.assertIn("params", dir(imglab))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            imglab.unknown
+
+
+if __name__ == "__main__":
+    unittest.main()
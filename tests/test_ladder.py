@@ -0,0 +1,167 @@
+import unittest
+import doctest
+import pickle
+from unittest import mock
+
+import imglab
+from imglab import Ladder
+
+
+class TestLadder(unittest.TestCase):
+    def setUp(self):
+        self.ladder = Ladder([960, 320, 640, 480, 480], statistics=True)
+
+    def test_widths(self):
+        self.assertEqual(self.ladder.widths, (320, 480, 640, 960))
+        self.assertEqual(Ladder(imglab.sequence(100, 8192, 4)).widths, (100, 434, 1886, 8192))
+        self.assertEqual(Ladder.sequence(100, 8192, 4), Ladder([100, 434, 1886, 8192]))
+
+    def test_invalid_widths(self):
+        for widths in [[], [0, 100], [-100], [100.5], ["100"], [True]]:
+            with self.assertRaises(ValueError):
+                Ladder(widths)
+
+    def test_snap(self):
+        self.assertEqual(self.ladder.snap(1), 320)
+        self.assertEqual(self.ladder.snap(320), 320)
+        self.assertEqual(self.ladder.snap(321), 480)
+        self.assertEqual(self.ladder.snap(437), 480)
+        self.assertEqual(self.ladder.snap(960), 960)
+        self.assertEqual(self.ladder.snap(4000), 960)
+
+    def test_snap_params(self):
+        self.assertEqual(self.ladder.snap_params({"width": 437, "format": "webp"}), {"width": 480, "format": "webp"})
+        self.assertEqual(self.ladder.snap_params({"width": "437"}), {"width": 480})
+        self.assertEqual(self.ladder.snap_params({"width": 400, "height": 200}), {"width": 480, "height": 240})
+        self.assertEqual(self.ladder.snap_params({"height": 500}), {"height": 640})
+        self.assertEqual(self.ladder.snap_params({"width": 2000, "height": 1000}), {"width": 960, "height": 480})
+
+    def test_snap_params_without_size(self):
+        params = {"width": "large", "format": "webp"}
+
+        self.assertIs(self.ladder.snap_params(params), params)
+        self.assertEqual(self.ladder.snap_params({"width": 0}), {"width": 0})
+        self.assertEqual(self.ladder.snap_params({}), {})
+        self.assertEqual(self.ladder.info(), (0, 0, 0))
+
+    def test_info(self):
+        for width in [437, 441, 452, 480, 600]:
+            self.ladder.snap_params({"width": width})
+
+        self.assertEqual(self.ladder.info(), (5, 2, 3))
+        self.assertEqual(self.ladder.info().collapsed, 3)
+
+        self.ladder.reset()
+
+        self.assertEqual(self.ladder.info(), (0, 0, 0))
+
+    def test_info_without_statistics(self):
+        ladder = Ladder([320, 480])
+        ladder.snap_params({"width": 437})
+
+        self.assertEqual(ladder.info(), (0, 0, 0))
+
+    def test_info_maxsize(self):
+        with mock.patch.object(Ladder, "STATISTICS_MAXSIZE", 2):
+            for width in [100, 200, 300, 400]:
+                self.ladder.snap_params({"width": width})
+
+        self.assertEqual(self.ladder.info(), (2, 1, 1))
+
+    def test_equality_and_pickle(self):
+        self.ladder.snap_params({"width": 437})
+
+        self.assertEqual(self.ladder, Ladder([320, 480, 640, 960]))
+        self.assertEqual(hash(self.ladder), hash(Ladder([320, 480, 640, 960])))
+        self.assertNotEqual(self.ladder, Ladder([320, 480]))
+        self.assertEqual(pickle.loads(pickle.dumps(self.ladder)), self.ladder)
+        self.assertEqual(pickle.loads(pickle.dumps(self.ladder)).info(), (0, 0, 0))
+        self.assertEqual(repr(self.ladder), "Ladder([320, 480, 640, 960])")
+
+
+class TestLadderWithSource(unittest.TestCase):
+    def setUp(self):
+        self.source = imglab.Source("assets", ladder=Ladder([320, 480, 640, 960], statistics=True))
+
+    def test_url(self):
+        self.assertEqual(
+            imglab.url(self.source, "example.jpeg", width=437, height=300, format="webp"),
+            "https://assets.imglab-cdn.net/example.jpeg?width=480&height=330&format=webp",
+        )
+        self.assertEqual(
+            imglab.url(self.source, "example.jpeg", width=437), imglab.url(self.source, "example.jpeg", width=441)
+        )
+        self.assertEqual(self.source.ladder.info(), (3, 2, 1))
+
+    def test_url_signed(self):
+        source = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v", ladder=[480])
+        non_ladder_source = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+
+        self.assertEqual(
+            imglab.url(source, "example.jpeg", width=437), imglab.url(non_ladder_source, "example.jpeg", width=480)
+        )
+
+    def test_url_with_canonical_source(self):
+        source = imglab.Source("assets", canonical=True, ladder=[320, 480])
+
+        self.assertEqual(
+            imglab.url(source, "example.jpeg", format="webp", width="0437", dpr=1),
+            "https://assets.imglab-cdn.net/example.jpeg?width=480&format=webp",
+        )
+
+    def test_template(self):
+        template = self.source.template(width=437, format="webp")
+
+        self.assertEqual(template("example.jpeg"), imglab.url(self.source, "example.jpeg", width=480, format="webp"))
+        self.assertEqual(
+            template("example.jpeg", width=600, height=300),
+            imglab.url(self.source, "example.jpeg", width=640, format="webp", height=320),
+        )
+
+    def test_template_with_additional_height(self):
+        template = self.source.template(width=437)
+
+        self.assertEqual(template("example.jpeg", height=300), imglab.url(self.source, "example.jpeg", width=437, height=300))
+        self.assertEqual(
+            imglab.urls(self.source, [("example.jpeg", {"height": 300})], width=437),
+            [imglab.url(self.source, "example.jpeg", width=437, height=300)],
+        )
+
+    def test_srcset_with_widths(self):
+        self.assertEqual(
+            imglab.srcset(self.source, "example.jpeg", width=[300, 310, 440, 700, 2000]),
+            "https://assets.imglab-cdn.net/example.jpeg?width=320 320w,\n"
+            "https://assets.imglab-cdn.net/example.jpeg?width=480 480w,\n"
+            "https://assets.imglab-cdn.net/example.jpeg?width=960 960w",
+        )
+
+    def test_srcset_with_dprs(self):
+        self.assertEqual(
+            imglab.srcset(self.source, "example.jpeg", width=437, dpr=[1, 2]),
+            "https://assets.imglab-cdn.net/example.jpeg?width=480&dpr=1 1x,\n"
+            "https://assets.imglab-cdn.net/example.jpeg?width=480&dpr=2 2x",
+        )
+
+    def test_layout_with_sources(self):
+        layout = imglab.Layout(width=[300, 500])
+
+        self.assertEqual(
+            [candidate.descriptor for candidate in layout.srcset_iter(self.source, "example.jpeg")], ["320w", "640w"]
+        )
+        self.assertEqual(
+            [candidate.descriptor for candidate in layout.srcset_iter("assets", "example.jpeg")], ["300w", "500w"]
+        )
+        self.assertEqual(
+            [candidate.descriptor for candidate in layout.srcset_iter(imglab.Source("assets", ladder=[500]), "a.jpeg")],
+            ["500w"],
+        )
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.ladder"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
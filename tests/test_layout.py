@@ -0,0 +1,116 @@
+import unittest
+import doctest
+import pickle
+
+import imglab
+
+
+class TestLayout(unittest.TestCase):
+    SECURE_KEY = "ixUd9is/LDGBw6NPfLCGLjO/WraJlHdytC1+xiIFj22mXAWs/6R6ws4gxSXbDcUHMHv0G+oiTgyfMVsRS2b3"
+    SECURE_SALT = "c9G9eYKCeWen7vkEyV1cnr4MZkfLI/yo6j72JItzKHjMGDNZKqPFzRtup//qiT51HKGJrAha6Gv2huSFLwJr"
+
+    def setUp(self):
+        self.source = imglab.Source("assets", secure_key=self.SECURE_KEY, secure_salt=self.SECURE_SALT)
+
+    def test_layout_with_fixed_width(self):
+        layout = imglab.Layout(width=100, dpr=[1, 2], format="png")
+
+        self.assertEqual(layout.descriptors, ("1x", "2x"))
+        self.assertEqual(layout.srcset("assets", "example.jpeg"), imglab.srcset("assets", "example.jpeg", width=100, dpr=[1, 2], format="png"))
+
+    def test_layout_with_fluid_width(self):
+        layout = imglab.Layout(width=range(100, 1000), quality=range(80, 40), format="webp")
+
+        self.assertEqual(len(layout.descriptors), 16)
+        self.assertEqual(
+            layout.srcset(self.source, "example.jpeg"),
+            imglab.srcset(self.source, "example.jpeg", width=range(100, 1000), quality=range(80, 40), format="webp"),
+        )
+
+    def test_layout_without_size(self):
+        layout = imglab.Layout(format="webp")
+
+        self.assertEqual(layout.descriptors[0], "100w")
+        self.assertEqual(layout.descriptors[-1], "8192w")
+        self.assertEqual(layout.srcset(self.source, "example.jpeg"), imglab.srcset(self.source, "example.jpeg", format="webp"))
+
+    def test_layout_with_many_paths(self):
+        layout = imglab.Layout(width=400, height=300, dpr=range(1, 3), trim_color="orange")
+
+        for path in ["a.jpeg", "/subfolder/b.jpeg", "https://assets.com/c.jpeg"]:
+            self.assertEqual(
+                layout.srcset(self.source, path),
+                imglab.srcset(self.source, path, width=400, height=300, dpr=range(1, 3), trim_color="orange"),
+            )
+
+    def test_layout_with_signature_param(self):
+        layout = imglab.Layout(width=400, signature="unused", dpr=[1, 2])
+
+        self.assertEqual(
+            list(layout.srcset_iter(self.source, "example.jpeg")),
+            [
+                (imglab.url(self.source, "example.jpeg", width=400, signature="unused", dpr=1), "1x"),
+                (imglab.url(self.source, "example.jpeg", width=400, signature="unused", dpr=2), "2x"),
+            ],
+        )
+
+    def test_layout_srcset_iter(self):
+        candidates = imglab.Layout(width=[100, 200]).srcset_iter("assets", "example.jpeg")
+
+        self.assertEqual(next(candidates), ("https://assets.imglab-cdn.net/example.jpeg?width=100", "100w"))
+        self.assertEqual(next(candidates), ("https://assets.imglab-cdn.net/example.jpeg?width=200", "200w"))
+
+    def test_layout_pickle(self):
+        layout = pickle.loads(pickle.dumps(imglab.Layout(width=[100, 200], format="png")))
+
+        self.assertEqual(layout.srcset("assets", "example.jpeg"), imglab.srcset("assets", "example.jpeg", width=[100, 200], format="png"))
+
+    def test_layout_with_canonical_source(self):
+        source = imglab.Source("assets", canonical=True)
+        layout = imglab.Layout(format="webp", width=400, dpr=[1, 2])
+
+        self.assertEqual(
+            layout.srcset(source, "example.jpeg"),
+            "https://assets.imglab-cdn.net/example.jpeg?width=400&format=webp 1x,\n"
+            "https://assets.imglab-cdn.net/example.jpeg?width=400&dpr=2&format=webp 2x",
+        )
+        self.assertEqual(layout.srcset("assets", "example.jpeg"), imglab.srcset("assets", "example.jpeg", format="webp", width=400, dpr=[1, 2]))
+
+    def test_layout_with_secure_canonical_source(self):
+        source = imglab.Source("assets", secure_key=self.SECURE_KEY, secure_salt=self.SECURE_SALT, canonical=True)
+        layout = imglab.Layout(format="webp", width=[100, 200])
+
+        self.assertEqual(
+            list(layout.srcset_iter(source, "example.jpeg")),
+            [
+                (imglab.url(source, "example.jpeg", width=100, format="webp"), "100w"),
+                (imglab.url(source, "example.jpeg", width=200, format="webp"), "200w"),
+            ],
+        )
+
+    def test_layout_with_invalid_params(self):
+        with self.assertRaises(ValueError):
+            imglab.Layout(width=[100, 200], dpr=[1, 2])
+
+        with self.assertRaises(ValueError):
+            imglab.Layout(width=100, height=[100, 200])
+
+        with self.assertRaises(ValueError):
+            imglab.Layout(dpr=[1, 2])
+
+    def test_layout_with_invalid_source(self):
+        with self.assertRaises(ValueError):
+            imglab.Layout(width=100).srcset(None, "example.jpeg")
+
+        with self.assertRaises(ValueError):
+            imglab.Layout(width=100).srcset_iter(None, "example.jpeg")
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.layout"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import unittest
+import doctest
+from unittest import mock
+
+import imglab
+from imglab import negotiation, signature
+
+
+class TestClientHints(unittest.TestCase):
+    def setUp(self):
+        self.layout = imglab.Layout(width=[400, 800, 1600], format="webp")
+        self.dpr_layout = imglab.Layout(width=400, format="webp")
+
+    def url(self, headers, layout=None, source="assets", sizes=negotiation.DEFAULT_SIZES):
+        return negotiation.client_hints_url(source, "example.jpeg", headers, layout or self.layout, sizes)
+
+    def candidate(self, descriptor, layout=None, source="assets"):
+        candidates = (layout or self.layout).srcset_iter(source, "example.jpeg")
+
+        return next(candidate.url for candidate in candidates if candidate.descriptor == descriptor)
+
+    def test_width_hint(self):
+        self.assertEqual(self.url({"Sec-CH-Width": "400"}), self.candidate("400w"))
+        self.assertEqual(self.url({"Sec-CH-Width": "401"}), self.candidate("800w"))
+        self.assertEqual(self.url({"sec-ch-width": "1600.0"}), self.candidate("1600w"))
+        self.assertEqual(self.url({"Sec-CH-Width": "3000"}), self.candidate("1600w"))
+        self.assertEqual(self.url({"Width": "100"}), self.candidate("400w"))
+
+    def test_viewport_width_hint(self):
+        self.assertEqual(self.url({"Sec-CH-Viewport-Width": "390"}), self.candidate("400w"))
+        self.assertEqual(self.url({"Sec-CH-Viewport-Width": "390", "Sec-CH-DPR": "3"}), self.candidate("1600w"))
+        self.assertEqual(self.url({"Viewport-Width": "1024", "DPR": "1"}, sizes="50vw"), self.candidate("800w"))
+        self.assertEqual(self.url({"Sec-CH-Viewport-Width": "1024"}, sizes="300px"), self.candidate("400w"))
+
+    def test_viewport_width_hint_with_media_conditions(self):
+        sizes = "(max-width: 600px) 100vw, (min-width: 1400px) 25vw, 50vw"
+
+        self.assertEqual(self.url({"Sec-CH-Viewport-Width": "600", "Sec-CH-DPR": "2"}, sizes=sizes), self.candidate("1600w"))
+        self.assertEqual(self.url({"Sec-CH-Viewport-Width": "1000", "Sec-CH-DPR": "1"}, sizes=sizes), self.candidate("800w"))
+        self.assertEqual(self.url({"Sec-CH-Viewport-Width": "1400", "Sec-CH-DPR": "1"}, sizes=sizes), self.candidate("400w"))
+        self.assertEqual(self.url({"Sec-CH-Viewport-Width": "1000"}, sizes="(orientation: portrait) 10vw, 30vw"), self.candidate("400w"))
+
+    def test_width_hint_over_viewport_width_hint(self):
+        self.assertEqual(self.url({"Sec-CH-Width": "300", "Sec-CH-Viewport-Width": "1600"}), self.candidate("400w"))
+
+    def test_dpr_hint(self):
+        self.assertEqual(self.url({"Sec-CH-DPR": "1"}, self.dpr_layout), self.candidate("1x", self.dpr_layout))
+        self.assertEqual(self.url({"Sec-CH-DPR": "2.625"}, self.dpr_layout), self.candidate("3x", self.dpr_layout))
+        self.assertEqual(self.url({"Sec-CH-DPR": "10"}, self.dpr_layout), self.candidate("6x", self.dpr_layout))
+
+    def test_missing_or_invalid_hints(self):
+        sizes = "(max-width: 600px) 100vw, 50vw"
+
+        self.assertEqual(self.url({}, sizes=sizes), self.candidate("800w"))
+        self.assertEqual(self.url({"Sec-CH-Width": "wide", "Sec-CH-DPR": "-1"}, sizes=sizes), self.candidate("800w"))
+        self.assertEqual(self.url({"Sec-CH-DPR": "2"}, sizes=sizes), self.candidate("1600w"))
+        self.assertEqual(self.url({"Sec-CH-Viewport-Width": "390"}, sizes="auto"), self.candidate("400w"))
+        self.assertEqual(self.url({}, self.dpr_layout), self.candidate("1x", self.dpr_layout))
+        self.assertEqual(self.url({"Sec-CH-DPR": "nan"}, self.dpr_layout), self.candidate("1x", self.dpr_layout))
+
+    def test_default_width_and_dpr(self):
+        def url(headers, layout=self.layout, **defaults):
+            return negotiation.client_hints_url("assets", "example.jpeg", headers, layout, **defaults)
+
+        self.assertEqual(url({}, default_width=300), self.candidate("400w"))
+        self.assertEqual(url({"Sec-CH-Width": "1000"}, default_width=300), self.candidate("1600w"))
+        self.assertEqual(url({}, default_dpr=2), self.candidate("1600w"))
+        self.assertEqual(url({}, self.dpr_layout, default_dpr=2), self.candidate("2x", self.dpr_layout))
+
+    def test_secure_source_signs_only_selected_url(self):
+        source = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+
+        with mock.patch.object(signature, "generate_from_prefix", wraps=signature.generate_from_prefix) as generate:
+            url = self.url({"Sec-CH-Width": "720"}, source=source)
+
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(url, self.candidate("800w", source=source))
+
+    def test_ladder_source(self):
+        source = imglab.Source("assets", ladder=[500, 1000])
+
+        self.assertEqual(self.url({"Sec-CH-Width": "600"}, source=source), self.candidate("1000w", source=source))
+
+    def test_headers(self):
+        self.assertEqual(
+            negotiation.client_hints_headers(self.layout),
+            {
+                "Accept-CH": "Sec-CH-DPR, Sec-CH-Width, Sec-CH-Viewport-Width",
+                "Vary": "Sec-CH-DPR, Sec-CH-Width, Sec-CH-Viewport-Width",
+            },
+        )
+        self.assertEqual(
+            negotiation.client_hints_headers(self.dpr_layout), {"Accept-CH": "Sec-CH-DPR", "Vary": "Sec-CH-DPR"}
+        )
+
+    def test_invalid_source(self):
+        with self.assertRaises(ValueError):
+            self.url({}, source=None)
+
+
+class TestAcceptFormat(unittest.TestCase):
+    CHROME_ACCEPT = "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8"
+    SAFARI_ACCEPT = "image/webp,image/avif,image/jxl,image/heic,image/heic-sequence,video/*;q=0.8,image/png,image/svg+xml,image/*;q=0.8,*/*;q=0.5"
+
+    def test_accept_format(self):
+        self.assertEqual(negotiation.accept_format(self.CHROME_ACCEPT), "avif")
+        self.assertEqual(negotiation.accept_format(self.SAFARI_ACCEPT), "avif")
+        self.assertEqual(negotiation.accept_format("image/webp,*/*"), "webp")
+        self.assertEqual(negotiation.accept_format("image/png,image/*;q=0.8,*/*;q=0.5"), "jpeg")
+
+    def test_accept_format_without_header(self):
+        self.assertEqual(negotiation.accept_format(None), "jpeg")
+        self.assertEqual(negotiation.accept_format(""), "jpeg")
+        self.assertEqual(negotiation.accept_format(None, formats=["webp", "png"]), "png")
+
+    def test_accept_format_with_qualities(self):
+        self.assertEqual(negotiation.accept_format("image/avif;q=0.5, image/webp"), "webp")
+        self.assertEqual(negotiation.accept_format("image/avif;q=0.9,image/webp;q=0.9"), "avif")
+        self.assertEqual(negotiation.accept_format("image/avif;q=0,image/webp;q=0"), "jpeg")
+        self.assertEqual(negotiation.accept_format("image/avif;q=high,IMAGE/WEBP ; Q=0.5"), "webp")
+        self.assertEqual(negotiation.accept_format("image/avif;q=2,image/webp"), "avif")
+
+    def test_accept_format_with_formats(self):
+        self.assertEqual(negotiation.accept_format(self.CHROME_ACCEPT, formats=["webp", "avif", "jpeg"]), "webp")
+        self.assertEqual(negotiation.accept_format(self.SAFARI_ACCEPT, formats=("jxl", "png")), "jxl")
+        self.assertEqual(negotiation.accept_format(self.CHROME_ACCEPT, formats=["png"]), "png")
+
+        with self.assertRaises(ValueError):
+            negotiation.accept_format(self.CHROME_ACCEPT, formats=[])
+
+    def test_accept_format_cache(self):
+        negotiation._accept_format.cache_clear()
+
+        for _ in range(3):
+            negotiation.accept_format(self.CHROME_ACCEPT)
+
+        self.assertEqual(negotiation._accept_format.cache_info().hits, 2)
+        self.assertEqual(negotiation._accept_format.cache_info().maxsize, negotiation.ACCEPT_CACHE_SIZE)
+
+    def test_accept_url(self):
+        self.assertEqual(
+            negotiation.accept_url("assets", "example.jpeg", self.CHROME_ACCEPT, width=500, format="png"),
+            imglab.url("assets", "example.jpeg", width=500, format="avif"),
+        )
+        self.assertEqual(
+            negotiation.accept_url("assets", "example.jpeg", None, formats=["webp", "png"], width=500),
+            imglab.url("assets", "example.jpeg", width=500, format="png"),
+        )
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.negotiation"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
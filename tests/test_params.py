@@ -0,0 +1,92 @@
+import unittest
+import doctest
+
+from time import gmtime
+from datetime import datetime
+
+from imglab import params
+
+
+class TestParams(unittest.TestCase):
+    def test_lookup(self):
+        self.assertEqual(params.lookup("width").name, "width")
+        self.assertEqual(params.lookup("width").type, "integer")
+        self.assertEqual(params.lookup("trim-color").name, "trim-color")
+        self.assertIs(params.lookup("trim_color"), params.lookup("trim-color"))
+        self.assertIs(params.lookup("background_color"), params.lookup("background-color"))
+        self.assertEqual(params.lookup("unknown"), None)
+
+    def test_normalize(self):
+        self.assertEqual(params.lookup("width").normalize(200), 200)
+        self.assertEqual(params.lookup("download").normalize(None), "")
+        self.assertEqual(params.lookup("expires").normalize(gmtime(1464096368)), 1464096368)
+        self.assertEqual(params.lookup("expires").normalize(datetime.fromtimestamp(1464096368)), 1464096368)
+        self.assertEqual(params.lookup("expires").normalize("1464096368"), "1464096368")
+
+    def test_encode(self):
+        self.assertEqual(params.lookup("width").encode(200), "200")
+        self.assertEqual(params.lookup("width").encode("200"), "200")
+        self.assertEqual(params.lookup("dpr").encode(1.5), "1.5")
+        self.assertEqual(params.lookup("upscale").encode(True), "True")
+        self.assertEqual(params.lookup("format").encode("webp"), "webp")
+        self.assertEqual(params.lookup("background-color").encode("255,128,122"), "255%2C128%2C122")
+        self.assertEqual(params.lookup("watermark").encode("logo image.svg"), "logo+image.svg")
+
+    def test_validate(self):
+        params.validate({})
+        params.validate({"width": 200, "height": "300", "dpr": 1.5, "quality": 80, "format": "webp"})
+        params.validate({"background_color": "255,128,122", "trim-color": "red", "trim_color": "F00A"})
+        params.validate({"watermark-position": "left,bottom", "upscale": True, "progressive": "true"})
+        params.validate({"expires": gmtime(1464096368), "download": None, "custom": object()})
+
+    def test_validate_invalid_values(self):
+        invalid_params = [
+            {"width": "large"},
+            {"width": -1},
+            {"width": True},
+            {"dpr": "high"},
+            {"format": 1},
+            {"background_color": "255,128"},
+            {"trim_color": "unknown"},
+            {"watermark-position": "left,unknown"},
+            {"upscale": "yes"},
+            {"expires": "tomorrow"},
+        ]
+
+        for invalid in invalid_params:
+            with self.assertRaises(ValueError):
+                params.validate(invalid)
+
+    def test_canonicalize(self):
+        self.assertEqual(params.canonicalize({}), {})
+        self.assertEqual(
+            list(params.canonicalize({"format": "webp", "custom": "value", "width": 200, "another": "value"})),
+            ["width", "format", "another", "custom"],
+        )
+        self.assertEqual(params.canonicalize({"width": "0200", "dpr": 2.0, "height": 300.0}), {"width": 200, "height": 300, "dpr": 2})
+        self.assertEqual(params.canonicalize({"upscale": True, "lossless": "False"}), {"upscale": "true"})
+        self.assertEqual(params.canonicalize({"background-color": "FFAA00", "trim-color": "Red"}), {"background-color": "ffaa00", "trim-color": "Red"})
+        self.assertEqual(params.canonicalize({"watermark-position": "bottom,left"}), {"watermark-position": "left,bottom"})
+        self.assertEqual(
+            params.canonicalize({"mode": "Crop", "crop": "LEFT,top", "format": "WEBP", "flip": "H", "trim": "Color"}),
+            {"mode": "crop", "crop": "left,top", "format": "webp", "flip": "h", "trim": "color"},
+        )
+        self.assertEqual(params.canonicalize({"download": "Image.JPEG", "watermark-mode": "Contain"}), {"download": "Image.JPEG", "watermark-mode": "contain"})
+        self.assertEqual(params.canonicalize({"mode": "crop", "watermark-position": "left,bottom"})["watermark-position"], "left,bottom")
+
+    def test_canonicalize_defaults_and_empty_values(self):
+        self.assertEqual(params.canonicalize({"dpr": 1, "rotate": 0, "blur": 0.0, "download": ""}), {})
+        self.assertEqual(params.canonicalize({"dpr": 1.5, "rotate": 90, "custom": ""}), {"dpr": 1.5, "rotate": 90})
+
+    def test_canonicalize_invalid_values(self):
+        self.assertEqual(params.canonicalize({"width": "large", "dpr": "high"}), {"width": "large", "dpr": "high"})
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.params"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
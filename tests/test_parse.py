@@ -0,0 +1,156 @@
+import unittest
+import doctest
+
+import imglab
+from imglab.parse import ParsedURL
+
+
+class TestParse(unittest.TestCase):
+    SECURE_KEY = "55IX1RVlDHpgl/4D"
+    SECURE_SALT = "ITvYA2lPfyz0w8/v"
+
+    def test_parse(self):
+        parsed = imglab.parse("https://assets.imglab-cdn.net/example.jpeg?width=200&height=300&format=png")
+
+        self.assertEqual(
+            parsed,
+            ParsedURL(
+                scheme="https",
+                host="imglab-cdn.net",
+                port=None,
+                subdomains=True,
+                name="assets",
+                path="example.jpeg",
+                params={"width": 200, "height": 300, "format": "png"},
+                signature=None,
+            ),
+        )
+
+    def test_parse_without_path_and_params(self):
+        parsed = imglab.parse("https://assets.imglab-cdn.net")
+
+        self.assertEqual((parsed.name, parsed.path, parsed.params, parsed.signature), ("assets", "", {}, None))
+
+    def test_parse_bytes(self):
+        self.assertEqual(
+            imglab.parse(b"https://assets.imglab-cdn.net/example.jpeg?width=200"),
+            imglab.parse("https://assets.imglab-cdn.net/example.jpeg?width=200"),
+        )
+
+    def test_parse_encoded_path(self):
+        parsed = imglab.parse("https://assets.imglab-cdn.net/sub%20folder/%C3%A9xample%3F.jpeg")
+
+        self.assertEqual(parsed.path, "sub folder/éxample?.jpeg")
+
+    def test_parse_web_uri_path(self):
+        parsed = imglab.parse("https://assets.imglab-cdn.net/https%3A%2F%2Fdomain.com%2Fexample.jpeg?width=200")
+
+        self.assertEqual(parsed.path, "https://domain.com/example.jpeg")
+
+    def test_parse_without_subdomains(self):
+        parsed = imglab.parse("http://imglab.net:8080/assets/subfolder/example.jpeg", host="imglab.net")
+
+        self.assertEqual(parsed.scheme, "http")
+        self.assertEqual(parsed.host, "imglab.net")
+        self.assertEqual(parsed.port, 8080)
+        self.assertFalse(parsed.subdomains)
+        self.assertEqual(parsed.name, "assets")
+        self.assertEqual(parsed.path, "subfolder/example.jpeg")
+
+    def test_parse_with_custom_host(self):
+        parsed = imglab.parse("https://assets.images.com/example.jpeg", host="images.com")
+
+        self.assertEqual((parsed.host, parsed.subdomains, parsed.name), ("images.com", True, "assets"))
+
+    def test_parse_signature(self):
+        parsed = imglab.parse("https://assets.imglab-cdn.net/example.jpeg?width=200&signature=abc-_123")
+
+        self.assertEqual(parsed.params, {"width": 200})
+        self.assertEqual(parsed.signature, "abc-_123")
+
+    def test_parse_typed_params(self):
+        parsed = imglab.parse(
+            "https://assets.imglab-cdn.net/example.jpeg?"
+            "width=0200&height=300&dpr=1.5&rotate=-90&blur=nan&upscale=True&lossless=true&expires=1464096368&custom=1"
+        )
+
+        self.assertEqual(
+            parsed.params,
+            {
+                "width": "0200",
+                "height": 300,
+                "dpr": 1.5,
+                "rotate": -90,
+                "blur": "nan",
+                "upscale": True,
+                "lossless": "true",
+                "expires": 1464096368,
+                "custom": "1",
+            },
+        )
+
+    def test_parse_encoded_params(self):
+        parsed = imglab.parse(
+            "https://assets.imglab-cdn.net/example.jpeg?background-color=255%2C128%2C122&text=hello+world&empty"
+        )
+
+        self.assertEqual(parsed.params, {"background-color": "255,128,122", "text": "hello world", "empty": ""})
+
+    def test_parse_fragment(self):
+        parsed = imglab.parse("https://assets.imglab-cdn.net/example.jpeg?width=200#top")
+
+        self.assertEqual(parsed.params, {"width": 200})
+
+    def test_parse_invalid_urls(self):
+        for url in [
+            "assets.imglab-cdn.net/example.jpeg",
+            "ftp://assets.imglab-cdn.net/example.jpeg",
+            "https://imglab-cdn.net/",
+            "https://assets.imglab-cdn.net:port/example.jpeg",
+            b"https://assets.imglab-cdn.net/\xff",
+        ]:
+            with self.assertRaises(ValueError):
+                imglab.parse(url)
+
+    def test_parse_inverse_of_url(self):
+        sources = [
+            ("imglab-cdn.net", imglab.Source("assets")),
+            ("imglab.net", imglab.Source("assets", https=False, host="imglab.net", port=8080)),
+            ("imglab.net", imglab.Source("assets", host="imglab.net", subdomains=False)),
+            ("imglab-cdn.net", imglab.Source("assets", secure_key=self.SECURE_KEY, secure_salt=self.SECURE_SALT)),
+        ]
+        paths = ["example.jpeg", "sub folder/éxample.jpeg", "https://domain.com/example.jpeg?width=100", ""]
+        params = [
+            {},
+            {"width": 200, "height": 300, "format": "webp"},
+            {"dpr": 1.5, "upscale": True, "background_color": "255,128,122", "custom": "a b&c"},
+            {"watermark": imglab.url("assets", "logo.svg", width=100), "expires": 1464096368},
+        ]
+
+        for host, source in sources:
+            for path in paths:
+                for query in params:
+                    url = imglab.url(source, path, **query)
+                    parsed = imglab.parse(url, host=host)
+                    parsed_source = imglab.Source(
+                        parsed.name,
+                        host=parsed.host,
+                        https=parsed.scheme == "https",
+                        port=parsed.port,
+                        secure_key=source.secure_key,
+                        secure_salt=source.secure_salt,
+                        subdomains=parsed.subdomains,
+                    )
+
+                    self.assertEqual(imglab.url(parsed_source, parsed.path, **parsed.params), url)
+                    self.assertEqual(parsed.signature is not None, source.is_secure())
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.parse"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+import doctest
+import io
+
+import imglab
+
+
+class TestPicture(unittest.TestCase):
+    SECURE_KEY = "55IX1RVlDHpgl/4D"
+    SECURE_SALT = "ITvYA2lPfyz0w8/v"
+
+    def srcset(self, source, path, **params):
+        return ", ".join("%s %s" % candidate for candidate in imglab.srcset_iter(source, path, **params))
+
+    def test_picture_with_formats(self):
+        html = imglab.picture("assets", "example.jpeg", width=[400, 800])
+        srcsets = {
+            format: self.srcset("assets", "example.jpeg", width=[400, 800], format=format).replace("&", "&amp;")
+            for format in ["avif", "webp", "jpeg"]
+        }
+        src = imglab.url("assets", "example.jpeg", width=400, format="jpeg").replace("&", "&amp;")
+
+        self.assertEqual(
+            html,
+            "<picture>\n"
+            '<source type="image/avif" srcset="%s">\n'
+            '<source type="image/webp" srcset="%s">\n'
+            '<img src="%s" srcset="%s" alt="">\n'
+            "</picture>" % (srcsets["avif"], srcsets["webp"], src, srcsets["jpeg"]),
+        )
+
+    def test_picture_with_single_format(self):
+        self.assertEqual(
+            imglab.picture("assets", "example.jpeg", formats=["png"], width=400, height=300, dpr=[1]),
+            "<picture>\n"
+            '<img src="https://assets.imglab-cdn.net/example.jpeg?width=400&amp;height=300&amp;dpr=1&amp;format=png" '
+            'srcset="https://assets.imglab-cdn.net/example.jpeg?width=400&amp;height=300&amp;dpr=1&amp;format=png 1x" '
+            'width="400" height="300" alt="">\n'
+            "</picture>",
+        )
+
+    def test_picture_with_secure_source(self):
+        source = imglab.Source("assets", secure_key=self.SECURE_KEY, secure_salt=self.SECURE_SALT)
+        html = imglab.picture(source, "sub folder/example.jpeg", formats=["webp", "jpeg"], width=[400, 800])
+
+        for format in ["webp", "jpeg"]:
+            srcset = self.srcset(source, "sub folder/example.jpeg", width=[400, 800], format=format)
+
+            self.assertIn('srcset="%s"' % srcset.replace("&", "&amp;"), html)
+
+    def test_picture_with_canonical_and_ladder_source(self):
+        source = imglab.Source("assets", canonical=True, ladder=[480, 960])
+        html = imglab.picture(source, "example.jpeg", formats=["webp"], width=[400, 450, 900], dpr=None)
+
+        self.assertIn(
+            'srcset="https://assets.imglab-cdn.net/example.jpeg?width=480&amp;format=webp 480w, '
+            'https://assets.imglab-cdn.net/example.jpeg?width=960&amp;format=webp 960w"',
+            html,
+        )
+
+    def test_picture_attributes(self):
+        html = imglab.picture(
+            "assets",
+            "example.jpeg",
+            formats=["webp", "jpeg"],
+            width=400,
+            sizes="(max-width: 600px) 100vw, 50vw",
+            alt='"Quoted" <alt> & text',
+            attributes={"class": "hero", "loading": "lazy", "hidden": True, "title": None, "draggable": False},
+        )
+
+        self.assertIn('<source type="image/webp" srcset="', html)
+        self.assertEqual(html.count(' sizes="(max-width: 600px) 100vw, 50vw"'), 2)
+        self.assertIn(' alt="&quot;Quoted&quot; &lt;alt&gt; &amp; text" class="hero" loading="lazy" hidden>', html)
+        self.assertNotIn("title", html)
+        self.assertNotIn("draggable", html)
+
+    def test_picture_size_attributes(self):
+        cases = [
+            ({"width": 400, "height": 300}, ' width="400" height="300"'),
+            ({"width": 400}, ""),
+            ({"height": 300}, ""),
+            ({"width": 400, "aspect_ratio": "16:9", "mode": "crop"}, ' width="400" height="225"'),
+            ({"width": [400, 800], "aspect_ratio": "1.5", "mode": "crop"}, ' width="800" height="533"'),
+            ({"width": [400, 800], "height": [300, 600]}, ' width="800" height="600"'),
+            ({"width": [400, 800], "height": [300]}, ' width="800" height="600"'),
+            ({"width": range(400, 1600, 400), "aspect_ratio": "4:3", "mode": "crop"}, ' width="1600" height="1200"'),
+            ({"width": range(400, 1600, 400)}, ""),
+            ({"width": 400, "aspect_ratio": "wide", "mode": "crop"}, ""),
+            ({"width": "400", "height": 300}, ""),
+            ({}, ""),
+        ]
+
+        for params, size_attributes in cases:
+            html = imglab.picture("assets", "example.jpeg", formats=["jpeg"], **params)
+
+            self.assertIn('"%s alt=""' % size_attributes, html)
+
+    def test_picture_size_attributes_with_ladder_source(self):
+        source = imglab.Source("assets", ladder=[500, 1000])
+        html = imglab.picture(source, "example.jpeg", formats=["jpeg"], width=[400, 800], height=[300, 600])
+
+        self.assertIn("example.jpeg?width=1000&amp;height=750&amp;format=jpeg 1000w", html)
+        self.assertIn(' width="1000" height="750" alt=""', html)
+
+    def test_picture_with_writer(self):
+        writer = io.StringIO()
+
+        self.assertIsNone(imglab.picture("assets", "example.jpeg", writer=writer, width=[400, 800]))
+        self.assertEqual(writer.getvalue(), imglab.picture("assets", "example.jpeg", width=[400, 800]))
+
+    def test_picture_with_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            imglab.picture("assets", "example.jpeg", formats=[])
+
+        with self.assertRaises(ValueError):
+            imglab.picture(None, "example.jpeg")
+
+        with self.assertRaises(ValueError):
+            imglab.picture("assets", "example.jpeg", width=[400, 800], dpr=[1, 2])
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.picture"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 import unittest
 import doctest
 
+from array import array
+
 from imglab import sequence
+from imglab.sequence import cached_sequence, sequences
 
 
 class TestSequence(unittest.TestCase):
@@ -33,6 +36,48 @@ class TestSequence(unittest.TestCase):
         self.assertEqual(sequence(8192, 100, 16), [8192, 6107, 4553, 3394, 2530, 1886, 1406, 1048, 781, 583, 434, 324, 241, 180, 134, 100])
         self.assertEqual(sequence(8192, 100, 32), [8192, 7107, 6165, 5348, 4640, 4025, 3492, 3029, 2628, 2280, 1978, 1716, 1488, 1291, 1120, 972, 843, 731, 634, 550, 477, 414, 359, 312, 270, 235, 204, 177, 153, 133, 115, 100])
 
+    def test_returns_new_list(self):
+        seq = sequence(100, 8192, 4)
+        seq.append(10000)
+
+        self.assertEqual(sequence(100, 8192, 4), [100, 434, 1886, 8192])
+
+
+class TestCachedSequence(unittest.TestCase):
+    def test_cached_sequence(self):
+        self.assertEqual(cached_sequence(100, 8192, 4), (100, 434, 1886, 8192))
+        self.assertEqual(cached_sequence(100, 8192), tuple(sequence(100, 8192)))
+        self.assertEqual(cached_sequence(100, 8192, 0), ())
+
+    def test_cached_sequence_is_memoized(self):
+        self.assertIs(cached_sequence(320, 4096, 10), cached_sequence(320, 4096, 10))
+
+    def test_cached_sequence_distinguishes_types(self):
+        self.assertEqual(cached_sequence(100, 8192, 1), (100,))
+        self.assertIsInstance(cached_sequence(100.0, 8192, 1)[0], float)
+
+
+class TestSequences(unittest.TestCase):
+    def test_sequences(self):
+        values = sequences([(100, 8192), (8192, 100), (320, 4096)], 16)
+
+        self.assertIsInstance(values, array)
+        self.assertEqual(len(values), 48)
+        self.assertEqual(list(values[0:16]), sequence(100, 8192))
+        self.assertEqual(list(values[16:32]), sequence(8192, 100))
+        self.assertEqual(list(values[32:48]), sequence(320, 4096))
+
+    def test_sequences_small_sizes(self):
+        self.assertEqual(list(sequences([(100, 8192), (200, 400)], 1)), [100, 200])
+        self.assertEqual(list(sequences([(100, 8192), (200, 400)], 2)), [100, 8192, 200, 400])
+        self.assertEqual(list(sequences([(100, 8192)], 0)), [])
+
+    def test_sequences_empty(self):
+        self.assertEqual(list(sequences([])), [])
+
+    def test_sequences_from_iterator(self):
+        self.assertEqual(list(sequences(iter([(100, 8192)]), 4)), [100, 434, 1886, 8192])
+
 
 def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite("imglab.sequence"))
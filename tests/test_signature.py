@@ -22,6 +22,27 @@ class TestSignature(unittest.TestCase):
 
         self.assertEqual(sig, "aRgmnJ-7b2A0QLxXpR3cqrHVYmCfpRCOglL-nsp7SdQ")
 
+    def test_generate_reusing_keyed_hmac(self):
+        params = urlencode({"width": 200, "height": 300, "format": "png"})
+
+        self.assertEqual(signature.generate(self.source, "example.jpeg"), "aRgmnJ-7b2A0QLxXpR3cqrHVYmCfpRCOglL-nsp7SdQ")
+        self.assertEqual(signature.generate(self.source, "example.jpeg", params), "VJ159IlBl_AlN59QWvyJov5SlQXlrZNpXgDJLJgzP8g")
+        self.assertEqual(signature.generate(self.source, "example.jpeg"), "aRgmnJ-7b2A0QLxXpR3cqrHVYmCfpRCOglL-nsp7SdQ")
+
+    def test_generate_from_prefix(self):
+        state = signature.prefix(self.source, "example.jpeg")
+
+        self.assertEqual(signature.generate_from_prefix(state), "aRgmnJ-7b2A0QLxXpR3cqrHVYmCfpRCOglL-nsp7SdQ")
+        self.assertEqual(
+            signature.generate_from_prefix(state, urlencode({"width": 200, "height": 300, "format": "png"})),
+            "VJ159IlBl_AlN59QWvyJov5SlQXlrZNpXgDJLJgzP8g",
+        )
+        self.assertEqual(signature.generate_from_prefix(state), "aRgmnJ-7b2A0QLxXpR3cqrHVYmCfpRCOglL-nsp7SdQ")
+
+    def test_keyed_hmac_with_invalid_secure_key(self):
+        with self.assertRaises(ValueError):
+            signature.keyed_hmac("invalid-key", self.SECURE_SALT)
+
 
 def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite("imglab.signature"))
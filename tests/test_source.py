@@ -1,7 +1,9 @@
 import unittest
 import doctest
+import pickle
 
-from imglab import Source
+import imglab
+from imglab import Ladder, Source
 
 
 class TestSource(unittest.TestCase):
@@ -15,6 +17,8 @@ class TestSource(unittest.TestCase):
         self.assertEqual(source.secure_key, None)
         self.assertEqual(source.secure_salt, None)
         self.assertEqual(source.subdomains, Source.DEFAULT_SUBDOMAINS)
+        self.assertEqual(source.canonical, Source.DEFAULT_CANONICAL)
+        self.assertEqual(source.ladder, None)
 
     def test_source_instance_with_expected_optional_values(self):
         self.assertEqual(Source("assets", host="imglab.net").host, "assets.imglab.net")
@@ -23,6 +27,9 @@ class TestSource(unittest.TestCase):
         self.assertEqual(Source("assets", secure_key="secure-key").secure_key, "secure-key")
         self.assertEqual(Source("assets", secure_salt="secure-salt").secure_salt, "secure-salt")
         self.assertEqual(Source("assets", subdomains=False).subdomains, False)
+        self.assertEqual(Source("assets", canonical=True).canonical, True)
+        self.assertEqual(Source("assets", ladder=[200, 100]).ladder, Ladder([100, 200]))
+        self.assertEqual(Source("assets", ladder=Ladder([100, 200])).ladder, Ladder([100, 200]))
 
     def test_scheme(self):
         self.assertEqual(Source("assets").scheme(), "https")
@@ -48,7 +55,83 @@ class TestSource(unittest.TestCase):
         self.assertEqual(Source("assets").is_secure(), False)
         self.assertEqual(Source("assets", secure_key="secure-key").is_secure(), False)
         self.assertEqual(Source("assets", secure_salt="secure-salt").is_secure(), False)
-        self.assertEqual(Source("assets", secure_key="secure-key", secure_salt="secure-salt").is_secure(), True)
+        self.assertEqual(Source("assets", secure_key="c2VjdXJlLWtleQ==", secure_salt="c2VjdXJlLXNhbHQ=").is_secure(), True)
+
+    def test_invalid_secure_key_or_secure_salt(self):
+        with self.assertRaises(ValueError):
+            Source("assets", secure_key="secure-key", secure_salt="c2VjdXJlLXNhbHQ=")
+
+        with self.assertRaises(ValueError):
+            Source("assets", secure_key="c2VjdXJlLWtleQ==", secure_salt="secure-salt")
+
+        with self.assertRaises(ValueError):
+            Source("assets", secure_key="$$$$", secure_salt="c2VjdXJlLXNhbHQ=")
+
+        with self.assertRaises(ValueError):
+            Source("assets", secure_key="c2VjdXJl LWtleQ==", secure_salt="c2VjdXJlLXNhbHQ=")
+
+    def test_secure_key_and_secure_salt_with_surrounding_whitespace(self):
+        source = Source("assets", secure_key="55IX1RVlDHpgl/4D\n", secure_salt=" ITvYA2lPfyz0w8/v\r\n")
+
+        self.assertEqual(
+            imglab.url(source, "example.jpeg"),
+            imglab.url(Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v"), "example.jpeg"),
+        )
+
+    def test_netloc(self):
+        self.assertEqual(Source("assets").netloc, "assets.imglab-cdn.net")
+        self.assertEqual(Source("assets", port=8080).netloc, "assets.imglab-cdn.net:8080")
+        self.assertEqual(Source("assets", subdomains=False, host="imglab.net", port=8080).netloc, "imglab.net:8080")
+
+    def test_prefix(self):
+        self.assertEqual(Source("assets").prefix, "")
+        self.assertEqual(Source("assets", subdomains=True).prefix, "")
+        self.assertEqual(Source("assets", subdomains=False).prefix, "assets/")
+
+    def test_immutability(self):
+        source = Source("assets")
+
+        with self.assertRaises(AttributeError):
+            source.name = "images"
+
+        with self.assertRaises(AttributeError):
+            source._name = "images"
+
+        with self.assertRaises(AttributeError):
+            del source._name
+
+        self.assertEqual(source.name, "assets")
+
+    def test_equality_and_hash(self):
+        self.assertEqual(Source("assets"), Source("assets"))
+        self.assertEqual(hash(Source("assets")), hash(Source("assets")))
+        self.assertEqual(Source("assets", port=8080), Source("assets", port=8080))
+        self.assertNotEqual(Source("assets"), Source("images"))
+        self.assertNotEqual(Source("assets"), Source("assets", https=False))
+        self.assertNotEqual(Source("assets"), Source("assets", canonical=True))
+        self.assertNotEqual(Source("assets"), Source("assets", ladder=[100, 200]))
+        self.assertEqual(Source("assets", ladder=[100, 200]), Source("assets", ladder=Ladder([200, 100])))
+        self.assertNotEqual(Source("assets"), "assets")
+        self.assertNotEqual(
+            Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v"),
+            Source("assets", secure_key="ixUd9is/LDGBw6NP", secure_salt="ITvYA2lPfyz0w8/v"),
+        )
+        self.assertEqual(len({Source("assets"), Source("assets"), Source("images")}), 2)
+
+    def test_pickle(self):
+        source = pickle.loads(pickle.dumps(Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")))
+
+        self.assertEqual(source.name, "assets")
+        self.assertEqual(source.secure_key, "55IX1RVlDHpgl/4D")
+        self.assertEqual(source.secure_salt, "ITvYA2lPfyz0w8/v")
+        self.assertEqual(source.is_secure(), True)
+        self.assertEqual(source, Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v"))
+
+    def test_pickle_canonical(self):
+        self.assertEqual(pickle.loads(pickle.dumps(Source("assets", canonical=True))).canonical, True)
+
+    def test_pickle_ladder(self):
+        self.assertEqual(pickle.loads(pickle.dumps(Source("assets", ladder=[100, 200]))).ladder, Ladder([100, 200]))
 
 
 def load_tests(loader, tests, ignore):
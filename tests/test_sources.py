@@ -0,0 +1,96 @@
+import unittest
+import doctest
+
+import imglab
+from imglab import sources
+from imglab.sources import Registry
+
+
+class TestRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = Registry(maxsize=2)
+
+    def test_get_without_registered_settings(self):
+        source = self.registry.get("assets")
+
+        self.assertEqual(source.name, "assets")
+        self.assertEqual(source.host, "assets.imglab-cdn.net")
+        self.assertIs(self.registry.get("assets"), source)
+
+    def test_get_with_registered_settings(self):
+        self.registry.register("images", https=False, host="my-company.com", port=8080, subdomains=False)
+
+        source = self.registry.get("images")
+
+        self.assertEqual(source.https, False)
+        self.assertEqual(source.host, "my-company.com")
+        self.assertEqual(source.port, 8080)
+        self.assertEqual(source.subdomains, False)
+        self.assertIn("images", self.registry)
+        self.assertNotIn("assets", self.registry)
+
+    def test_register_replaces_interned_source(self):
+        source = self.registry.get("assets")
+        self.registry.register("assets", https=False)
+
+        self.assertIsNot(self.registry.get("assets"), source)
+        self.assertEqual(self.registry.get("assets").https, False)
+
+    def test_register_is_lazy(self):
+        self.registry.register("assets", secure_key="secure-key", secure_salt="secure-salt")
+
+        with self.assertRaises(ValueError):
+            self.registry.get("assets")
+
+    def test_unregister(self):
+        self.registry.register("assets", https=False)
+        self.registry.unregister("assets")
+        self.registry.unregister("unknown")
+
+        self.assertEqual(self.registry.get("assets").https, True)
+
+    def test_bounded_sources(self):
+        self.registry.register("a", https=False)
+
+        source = self.registry.get("a")
+        self.registry.get("b")
+        self.registry.get("c")
+
+        self.assertEqual(self.registry.info().currsize, 2)
+        self.assertIsNot(self.registry.get("a"), source)
+        self.assertEqual(self.registry.get("a").https, False)
+
+    def test_clear(self):
+        self.registry.register("assets", https=False)
+        self.registry.get("assets")
+        self.registry.clear()
+
+        self.assertNotIn("assets", self.registry)
+        self.assertEqual(self.registry.info(), (0, 0, 2, 0))
+
+
+class TestSources(unittest.TestCase):
+    def tearDown(self):
+        sources.unregister("images")
+
+    def test_url_with_registered_source_name(self):
+        sources.register("images", host="my-company.com", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+
+        self.assertIs(sources.get("images"), sources.get("images"))
+        self.assertEqual(
+            imglab.url("images", "logo.png", width=300),
+            imglab.url(imglab.Source("images", host="my-company.com", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v"), "logo.png", width=300),
+        )
+
+    def test_url_with_unregistered_source_name(self):
+        self.assertEqual(imglab.url("images", "logo.png"), "https://images.imglab-cdn.net/logo.png")
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.sources"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
 import doctest
+from unittest import mock
 
 import imglab
+from imglab.utils import url as url_utils
 
 
 class TestSrcsetWithSourceName(unittest.TestCase):
@@ -2970,6 +2972,86 @@ class TestSrcsetWithInvalidSource(unittest.TestCase):
             imglab.srcset(10, "example.jpeg")
 
 
+
+class TestSrcsetIter(unittest.TestCase):
+    SECURE_KEY = "ixUd9is/LDGBw6NPfLCGLjO/WraJlHdytC1+xiIFj22mXAWs/6R6ws4gxSXbDcUHMHv0G+oiTgyfMVsRS2b3"
+    SECURE_SALT = "c9G9eYKCeWen7vkEyV1cnr4MZkfLI/yo6j72JItzKHjMGDNZKqPFzRtup//qiT51HKGJrAha6Gv2huSFLwJr"
+
+    def setUp(self):
+        self.source = imglab.Source("assets", secure_key=self.SECURE_KEY, secure_salt=self.SECURE_SALT)
+
+    def test_srcset_iter_with_fixed_width(self):
+        candidates = list(imglab.srcset_iter("assets", "example.jpeg", width=100, dpr=[1, 2], format="png"))
+
+        self.assertEqual(
+            candidates,
+            [
+                ("https://assets.imglab-cdn.net/example.jpeg?width=100&dpr=1&format=png", "1x"),
+                ("https://assets.imglab-cdn.net/example.jpeg?width=100&dpr=2&format=png", "2x"),
+            ],
+        )
+        self.assertEqual(candidates[0].url, "https://assets.imglab-cdn.net/example.jpeg?width=100&dpr=1&format=png")
+        self.assertEqual(candidates[0].descriptor, "1x")
+
+    def test_srcset_iter_with_fluid_width(self):
+        candidates = list(imglab.srcset_iter("assets", "example.jpeg", width=[100, 200], height=[300], quality=[75]))
+
+        self.assertEqual(
+            candidates,
+            [
+                ("https://assets.imglab-cdn.net/example.jpeg?width=100&height=300&quality=75", "100w"),
+                ("https://assets.imglab-cdn.net/example.jpeg?width=200&height=&quality=", "200w"),
+            ],
+        )
+
+    def test_srcset_iter_without_size(self):
+        candidates = list(imglab.srcset_iter(self.source, "example.jpeg", format="webp"))
+
+        self.assertEqual(len(candidates), 16)
+        self.assertEqual(candidates[0], (imglab.url(self.source, "example.jpeg", format="webp", width=100), "100w"))
+        self.assertEqual(candidates[-1], (imglab.url(self.source, "example.jpeg", format="webp", width=8192), "8192w"))
+
+    def test_srcset_iter_with_secure_source(self):
+        candidates = imglab.srcset_iter(self.source, "example.jpeg", width=range(100, 400), quality=[80, 70], trim_color="orange")
+
+        self.assertEqual(
+            ",\n".join("%s %s" % candidate for candidate in candidates),
+            imglab.srcset(self.source, "example.jpeg", width=range(100, 400), quality=[80, 70], trim_color="orange"),
+        )
+
+    def test_srcset_iter_with_signature_param(self):
+        candidates = list(imglab.srcset_iter(self.source, "example.jpeg", width=100, signature="unused", dpr=[1, 2]))
+
+        self.assertEqual(
+            candidates,
+            [
+                (imglab.url(self.source, "example.jpeg", width=100, signature="unused", dpr=1), "1x"),
+                (imglab.url(self.source, "example.jpeg", width=100, signature="unused", dpr=2), "2x"),
+            ],
+        )
+
+    def test_srcset_iter_is_lazy(self):
+        candidates = imglab.srcset_iter("assets", "example.jpeg", width=range(100, 8192))
+
+        self.assertEqual(next(candidates).url, "https://assets.imglab-cdn.net/example.jpeg?width=100")
+        self.assertEqual(len(list(candidates)), 15)
+
+    def test_srcset_iter_encodes_one_candidate_at_a_time(self):
+        with mock.patch("imglab.utils.url.encode_param", wraps=url_utils.encode_param) as encode_param:
+            candidates = imglab.srcset_iter("assets", "example.jpeg", width=range(100, 8192), format="webp")
+
+            self.assertEqual(encode_param.call_count, 0)
+            self.assertEqual(next(candidates).url, "https://assets.imglab-cdn.net/example.jpeg?width=100&format=webp")
+            # The fixed fragments of the query string and the width of the first candidate
+            self.assertEqual(encode_param.call_count, 3)
+
+    def test_srcset_iter_errors_are_not_deferred(self):
+        with self.assertRaises(ValueError):
+            imglab.srcset_iter(None, "example.jpeg")
+
+        with self.assertRaises(ValueError):
+            imglab.srcset_iter("assets", "example.jpeg", width=[100, 200], dpr=[1, 2])
+
 def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite("imglab.srcset"))
 
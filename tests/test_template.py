@@ -0,0 +1,146 @@
+import unittest
+import doctest
+
+from time import gmtime
+
+import imglab
+
+
+class TestTemplate(unittest.TestCase):
+    def setUp(self):
+        self.source = imglab.Source("assets")
+
+    def test_template_without_params(self):
+        template = self.source.template()
+
+        self.assertEqual(template("example.jpeg"), "https://assets.imglab-cdn.net/example.jpeg")
+
+    def test_template_with_source_name(self):
+        template = imglab.Template("assets", width=400)
+
+        self.assertEqual(template.source, imglab.Source("assets"))
+        self.assertEqual(template("example.jpeg"), imglab.url("assets", "example.jpeg", width=400))
+
+    def test_template_with_invalid_source(self):
+        with self.assertRaises(ValueError):
+            imglab.Template(None, width=400)
+
+    def test_template_with_params(self):
+        template = self.source.template(width=200, height=300, format="png")
+
+        self.assertEqual(template("example.jpeg"), "https://assets.imglab-cdn.net/example.jpeg?width=200&height=300&format=png")
+        self.assertEqual(template("subfolder/other.jpeg"), "https://assets.imglab-cdn.net/subfolder/other.jpeg?width=200&height=300&format=png")
+
+    def test_template_with_normalized_params(self):
+        template = self.source.template(trim="color", trim_color="orange", download=None, expires=gmtime(1464096368))
+
+        self.assertEqual(template.params, {"trim": "color", "trim-color": "orange", "download": "", "expires": 1464096368})
+        self.assertEqual(
+            template("example.jpeg"),
+            imglab.url(self.source, "example.jpeg", trim="color", trim_color="orange", download=None, expires=gmtime(1464096368)),
+        )
+
+    def test_template_with_additional_params(self):
+        template = self.source.template(width=200, format="png")
+
+        self.assertEqual(template("example.jpeg", quality=80), "https://assets.imglab-cdn.net/example.jpeg?width=200&format=png&quality=80")
+        self.assertEqual(template("example.jpeg", trim_color="orange"), "https://assets.imglab-cdn.net/example.jpeg?width=200&format=png&trim-color=orange")
+
+    def test_template_with_overridden_params(self):
+        template = self.source.template(width=200, format="png")
+
+        self.assertEqual(template("example.jpeg", width=400, quality=80), "https://assets.imglab-cdn.net/example.jpeg?width=400&format=png&quality=80")
+        self.assertEqual(template("example.jpeg"), "https://assets.imglab-cdn.net/example.jpeg?width=200&format=png")
+
+    def test_template_with_additional_params_without_fixed_params(self):
+        template = self.source.template()
+
+        self.assertEqual(template("example.jpeg", width=200), "https://assets.imglab-cdn.net/example.jpeg?width=200")
+
+    def test_template_with_path_using_reserved_characters(self):
+        template = self.source.template(width=200)
+
+        self.assertEqual(template("/subfolder images/example image%2C01%2C02.jpeg/"), "https://assets.imglab-cdn.net/subfolder%20images/example%20image%252C01%252C02.jpeg?width=200")
+
+    def test_template_with_path_using_https_url(self):
+        template = self.source.template(width=200)
+
+        self.assertEqual(template("https://assets.com/subfolder/example.jpeg"), "https://assets.imglab-cdn.net/https%3A%2F%2Fassets.com%2Fsubfolder%2Fexample.jpeg?width=200")
+
+    def test_template_with_empty_path(self):
+        self.assertEqual(self.source.template()(""), imglab.url(self.source, ""))
+        self.assertEqual(self.source.template(width=200)("/"), imglab.url(self.source, "/", width=200))
+
+    def test_template_source(self):
+        self.assertIs(self.source.template().source, self.source)
+
+
+class TestTemplateWithSourceOptions(unittest.TestCase):
+    def test_template_with_disabled_subdomains(self):
+        source = imglab.Source("assets", subdomains=False)
+
+        self.assertEqual(source.template(width=200)("example.jpeg"), "https://imglab-cdn.net/assets/example.jpeg?width=200")
+        self.assertEqual(source.template()(""), imglab.url(source, ""))
+
+    def test_template_with_host_port_and_http(self):
+        source = imglab.Source("assets", https=False, host="imglab.net", port=8080)
+
+        self.assertEqual(source.template(width=200)("example.jpeg"), "http://assets.imglab.net:8080/example.jpeg?width=200")
+
+
+class TestTemplateWithSecureSource(unittest.TestCase):
+    SECURE_KEY = "ixUd9is/LDGBw6NPfLCGLjO/WraJlHdytC1+xiIFj22mXAWs/6R6ws4gxSXbDcUHMHv0G+oiTgyfMVsRS2b3"
+    SECURE_SALT = "c9G9eYKCeWen7vkEyV1cnr4MZkfLI/yo6j72JItzKHjMGDNZKqPFzRtup//qiT51HKGJrAha6Gv2huSFLwJr"
+
+    def setUp(self):
+        self.source = imglab.Source("assets", secure_key=self.SECURE_KEY, secure_salt=self.SECURE_SALT)
+
+    def test_template_without_params(self):
+        template = self.source.template()
+
+        self.assertEqual(template("example.jpeg"), imglab.url(self.source, "example.jpeg"))
+
+    def test_template_with_params(self):
+        template = self.source.template(width=200, height=300, format="png")
+
+        self.assertEqual(
+            template("example.jpeg"),
+            "https://assets.imglab-cdn.net/example.jpeg?width=200&height=300&format=png&signature=VJ159IlBl_AlN59QWvyJov5SlQXlrZNpXgDJLJgzP8g",
+        )
+
+    def test_template_with_additional_and_overridden_params(self):
+        template = self.source.template(width=200, format="png")
+
+        self.assertEqual(template("example.jpeg", quality=80), imglab.url(self.source, "example.jpeg", width=200, format="png", quality=80))
+        self.assertEqual(template("example.jpeg", width=400), imglab.url(self.source, "example.jpeg", width=400, format="png"))
+
+    def test_template_with_signature_param(self):
+        template = self.source.template(signature="unused", width=200)
+
+        self.assertEqual(template("example.jpeg"), imglab.url(self.source, "example.jpeg", signature="unused", width=200))
+
+
+class TestTemplateWithCanonicalSource(unittest.TestCase):
+    def setUp(self):
+        self.source = imglab.Source("assets", canonical=True)
+
+    def test_template_with_params(self):
+        template = self.source.template(format="webp", width=200, dpr=1)
+
+        self.assertEqual(template("example.jpeg"), imglab.url(self.source, "example.jpeg", width=200, format="webp"))
+
+    def test_template_with_additional_and_overridden_params(self):
+        template = self.source.template(format="webp", width=200)
+
+        self.assertEqual(template("example.jpeg", quality=80), imglab.url(self.source, "example.jpeg", width=200, format="webp", quality=80))
+        self.assertEqual(template("example.jpeg", format=None), imglab.url(self.source, "example.jpeg", width=200))
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.template"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -575,6 +575,55 @@ class TestUrlWithSecureSource(unittest.TestCase):
         self.assertEqual(url, "https://assets.imglab-cdn.net/https%3A%2F%2Fassets.com%2Fsubfolder%2Fexample%252C01%252C02.jpeg?width=200&height=300&format=png&signature=-zvh2hWXP8bHkoJVh8AdJFe9Kqdd1HpP1c2UmuQcYFQ")
 
 
+class TestUrlWithCanonicalSource(unittest.TestCase):
+    def setUp(self):
+        self.source = imglab.Source("assets", canonical=True)
+
+    def test_url_with_params_in_different_order(self):
+        self.assertEqual(
+            imglab.url(self.source, "example.jpeg", format="webp", width=400, custom="value", blur=5),
+            "https://assets.imglab-cdn.net/example.jpeg?width=400&format=webp&blur=5&custom=value",
+        )
+        self.assertEqual(
+            imglab.url(self.source, "example.jpeg", format="webp", width=400),
+            imglab.url(self.source, "example.jpeg", width=400, format="webp"),
+        )
+
+    def test_url_without_default_and_empty_params(self):
+        self.assertEqual(
+            imglab.url(self.source, "example.jpeg", width=400, dpr=1, upscale=False, rotate=0, download=None),
+            "https://assets.imglab-cdn.net/example.jpeg?width=400",
+        )
+
+    def test_url_with_normalized_values(self):
+        self.assertEqual(
+            imglab.url(
+                self.source,
+                "example.jpeg",
+                width="0400",
+                dpr=2.0,
+                upscale=True,
+                background_color="FFAA00",
+                watermark_position="bottom,left",
+            ),
+            "https://assets.imglab-cdn.net/example.jpeg?width=400&dpr=2&upscale=true&background-color=ffaa00"
+            "&watermark-position=left%2Cbottom",
+        )
+        self.assertEqual(
+            imglab.url(self.source, "example.jpeg", format="WEBP", mode="Crop"),
+            imglab.url(self.source, "example.jpeg", format="webp", mode="crop"),
+        )
+
+    def test_url_signed_over_canonical_params(self):
+        source = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v", canonical=True)
+        non_canonical_source = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+
+        self.assertEqual(
+            imglab.url(source, "example.jpeg", format="webp", width=400, dpr=1),
+            imglab.url(non_canonical_source, "example.jpeg", width=400, format="webp"),
+        )
+
+
 class TestUrlWithInvalidSource(unittest.TestCase):
     def test_url_with_none_as_source(self):
         with self.assertRaises(ValueError):
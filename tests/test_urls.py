@@ -0,0 +1,80 @@
+import unittest
+import doctest
+
+import imglab
+
+
+class TestUrls(unittest.TestCase):
+    def test_urls_with_source_name(self):
+        urls = imglab.urls("assets", ["example.jpeg", "/subfolder/example.png/"], width=200, format="png")
+
+        self.assertEqual(
+            urls,
+            [
+                "https://assets.imglab-cdn.net/example.jpeg?width=200&format=png",
+                "https://assets.imglab-cdn.net/subfolder/example.png?width=200&format=png",
+            ],
+        )
+
+    def test_urls_with_source(self):
+        source = imglab.Source("assets", subdomains=False)
+
+        self.assertEqual(imglab.urls(source, ["example.jpeg"], width=200), [imglab.url(source, "example.jpeg", width=200)])
+
+    def test_urls_with_secure_source(self):
+        source = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+        paths = ["example.jpeg", ("example.jpeg", {"width": 400}), ("example.png", {"trim_color": "orange"})]
+
+        self.assertEqual(
+            imglab.urls(source, paths, width=200, format="png"),
+            [
+                imglab.url(source, "example.jpeg", width=200, format="png"),
+                imglab.url(source, "example.jpeg", width=400, format="png"),
+                imglab.url(source, "example.png", width=200, format="png", trim_color="orange"),
+            ],
+        )
+
+    def test_urls_with_paths_and_params(self):
+        urls = imglab.urls("assets", [("example.jpeg", {"width": 400}), ("example.jpeg", {"quality": 80})], width=200)
+
+        self.assertEqual(
+            urls,
+            [
+                "https://assets.imglab-cdn.net/example.jpeg?width=400",
+                "https://assets.imglab-cdn.net/example.jpeg?width=200&quality=80",
+            ],
+        )
+
+    def test_urls_with_duplicated_paths(self):
+        source = imglab.Source("assets", secure_key="55IX1RVlDHpgl/4D", secure_salt="ITvYA2lPfyz0w8/v")
+
+        urls = imglab.urls(source, ["a.jpeg", "b.jpeg", "a.jpeg", ("a.jpeg", {"width": 100}), ("a.jpeg", {"width": 100})])
+
+        self.assertEqual(urls, [imglab.url(source, "a.jpeg"), imglab.url(source, "b.jpeg"), imglab.url(source, "a.jpeg"), imglab.url(source, "a.jpeg", width=100), imglab.url(source, "a.jpeg", width=100)])
+
+    def test_urls_with_unhashable_params(self):
+        urls = imglab.urls("assets", [("example.jpeg", {"width": [100, 200]})])
+
+        self.assertEqual(urls, [imglab.url("assets", "example.jpeg", width=[100, 200])])
+
+    def test_urls_with_generator(self):
+        urls = imglab.urls("assets", ("%d.jpeg" % i for i in range(3)))
+
+        self.assertEqual(urls, ["https://assets.imglab-cdn.net/%d.jpeg" % i for i in range(3)])
+
+    def test_urls_without_paths(self):
+        self.assertEqual(imglab.urls("assets", [], width=200), [])
+
+    def test_urls_with_invalid_source(self):
+        with self.assertRaises(ValueError):
+            imglab.urls(None, ["example.jpeg"])
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.urls"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
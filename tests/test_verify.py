@@ -0,0 +1,145 @@
+import unittest
+import doctest
+
+import imglab
+from imglab.verify import Verification
+
+
+class TestVerify(unittest.TestCase):
+    SECURE_KEY = "55IX1RVlDHpgl/4D"
+    SECURE_SALT = "ITvYA2lPfyz0w8/v"
+
+    def setUp(self):
+        self.source = imglab.Source("assets", secure_key=self.SECURE_KEY, secure_salt=self.SECURE_SALT)
+
+    def test_verify_valid(self):
+        for path, params in [
+            ("example.jpeg", {}),
+            ("example.jpeg", {"width": 200, "height": 300, "format": "png"}),
+            ("sub folder/éxample.jpeg", {"background_color": "255,128,122", "custom": "a b&c"}),
+            ("https://domain.com/example.jpeg", {"dpr": 1.5, "upscale": True}),
+            ("", {"width": 200}),
+        ]:
+            url = imglab.url(self.source, path, **params)
+
+            self.assertEqual(imglab.verify(url, self.source), Verification(True, None))
+            self.assertEqual(imglab.verify(url.encode(), self.source), Verification(True, None))
+            self.assertEqual(imglab.verify(imglab.parse(url), self.source), Verification(True, None))
+
+    def test_verify_bool(self):
+        url = imglab.url(self.source, "example.jpeg", width=200)
+
+        self.assertTrue(imglab.verify(url, self.source))
+        self.assertFalse(imglab.verify(url + "0", self.source))
+
+    def test_verify_source_name(self):
+        imglab.sources.register("verified", secure_key=self.SECURE_KEY, secure_salt=self.SECURE_SALT)
+        self.addCleanup(imglab.sources.unregister, "verified")
+
+        url = imglab.url("verified", "example.jpeg", width=200)
+
+        self.assertTrue(imglab.verify(url, "verified"))
+
+    def test_verify_on_premises_source(self):
+        source = imglab.Source(
+            "assets",
+            https=False,
+            host="imglab.net",
+            port=8080,
+            subdomains=False,
+            secure_key=self.SECURE_KEY,
+            secure_salt=self.SECURE_SALT,
+        )
+        url = imglab.url(source, "subfolder/example.jpeg", width=200)
+
+        self.assertTrue(imglab.verify(url, source))
+        self.assertEqual(imglab.verify(url, self.source).reason, "wrong_source")
+
+    def test_verify_bad_signature(self):
+        url = imglab.url(self.source, "example.jpeg", width=200)
+        other = imglab.Source("assets", secure_key="c2VjdXJlLWtleQ==", secure_salt="c2VjdXJlLXNhbHQ=")
+
+        for tampered in [
+            url.replace("width=200", "width=300"),
+            url.replace("example.jpeg", "example.png"),
+            url[:-1] + ("A" if url[-1] != "A" else "B"),
+            url + "%C3%A9",
+        ]:
+            self.assertEqual(imglab.verify(tampered, self.source).reason, "bad_signature")
+
+        self.assertEqual(imglab.verify(url, other).reason, "bad_signature")
+
+    def test_verify_signature_not_last(self):
+        url = imglab.url(self.source, "example.jpeg", width=200)
+        query = url.partition("?")[2]
+        reordered = url.replace(query, "%s&%s" % (query.split("&")[1], query.split("&")[0]))
+
+        self.assertTrue(imglab.verify(reordered, self.source))
+
+    def test_verify_wrong_source(self):
+        url = imglab.url(self.source, "example.jpeg", width=200)
+
+        for wrong in [
+            url.replace("https://assets.", "https://avatars."),
+            url.replace("https://", "http://"),
+            url.replace("imglab-cdn.net", "imglab-cdn.net:8080"),
+        ]:
+            self.assertEqual(imglab.verify(wrong, self.source).reason, "wrong_source")
+
+    def test_verify_missing_signature(self):
+        url = imglab.url("assets", "example.jpeg", width=200)
+
+        self.assertEqual(imglab.verify(url, self.source).reason, "missing_signature")
+
+    def test_verify_malformed(self):
+        invalid_bytes = b"https://assets.imglab-cdn.net/\xff"
+
+        for url in ["example.jpeg", "ftp://assets.imglab-cdn.net/example.jpeg", invalid_bytes, None]:
+            self.assertEqual(imglab.verify(url, self.source), Verification(False, "malformed"))
+
+    def test_verify_expires(self):
+        url = imglab.url(self.source, "example.jpeg", width=200, expires=1464096368)
+
+        self.assertTrue(imglab.verify(url, self.source, now=1464096368))
+        self.assertEqual(imglab.verify(url, self.source, now=1464096369).reason, "expired")
+        self.assertEqual(imglab.verify(url, self.source).reason, "expired")
+
+    def test_verify_expires_not_timestamp(self):
+        url = imglab.url(self.source, "example.jpeg", width=200, expires="tomorrow")
+
+        self.assertEqual(imglab.verify(url, self.source).reason, "malformed")
+
+    def test_verify_not_secure_source(self):
+        with self.assertRaises(ValueError):
+            imglab.verify(imglab.url("assets", "example.jpeg"), imglab.Source("assets"))
+
+    def test_verify_many(self):
+        urls = [imglab.url(self.source, "example.jpeg", width=width) for width in [100, 200, 300]]
+        urls += [urls[0].replace("width=100", "width=101"), "invalid", imglab.url(self.source, "other.jpeg")]
+
+        reasons = [verification.reason for verification in imglab.verify_many(iter(urls), self.source)]
+
+        self.assertEqual(reasons, [None, None, None, "bad_signature", "malformed", None])
+
+    def test_verify_many_is_lazy(self):
+        def urls():
+            yield imglab.url(self.source, "example.jpeg")
+            raise RuntimeError("consumed")
+
+        verifications = imglab.verify_many(urls(), self.source)
+
+        self.assertTrue(next(verifications))
+
+    def test_verify_many_not_secure_source(self):
+        with self.assertRaises(ValueError):
+            imglab.verify_many([], imglab.Source("assets"))
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.verify"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
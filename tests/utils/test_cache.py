@@ -0,0 +1,72 @@
+import unittest
+import doctest
+from decimal import Decimal
+
+from imglab.utils import cache as utils
+from imglab.utils.cache import LRU
+
+
+class TestCacheUtils(unittest.TestCase):
+    def test_lru(self):
+        lru = LRU(2)
+        lru.set("a", 1)
+        lru.set("b", 2)
+
+        self.assertEqual(lru.get("a"), 1)
+
+        lru.set("c", 3)
+
+        self.assertEqual(lru.get("b"), None)
+        self.assertEqual(lru.get("c"), 3)
+        self.assertEqual(len(lru), 2)
+        self.assertEqual(lru.info(), (2, 1, 2, 2))
+
+    def test_lru_delete(self):
+        lru = LRU(2)
+        lru.set("a", 1)
+        lru.delete("a")
+        lru.delete("b")
+
+        self.assertEqual(lru.get("a", 0), 0)
+
+    def test_lru_evict(self):
+        lru = LRU(3)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.set("c", 3)
+
+        self.assertEqual(lru.evict(lambda key, value: value % 2 == 1), 2)
+        self.assertEqual(lru.get("a"), None)
+        self.assertEqual(lru.get("b"), 2)
+        self.assertEqual(len(lru), 1)
+
+    def test_lru_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            LRU(0)
+
+        with self.assertRaises(ValueError):
+            LRU(None)
+
+    def test_freeze(self):
+        self.assertEqual(utils.freeze("webp"), (str, "webp"))
+        self.assertNotEqual(utils.freeze(1), utils.freeze(1.0))
+        self.assertNotEqual(utils.freeze(1), utils.freeze(True))
+        self.assertNotEqual(utils.freeze([1, 2]), utils.freeze((1, 2)))
+        self.assertNotEqual(utils.freeze(0.0), utils.freeze(-0.0))
+        self.assertNotEqual(utils.freeze(Decimal("1.5")), utils.freeze(Decimal("1.50")))
+        self.assertEqual(utils.freeze(float("nan")), utils.freeze(float("nan")))
+        self.assertEqual(utils.freeze({"a": [1]}), ("dict", (((str, "a"), ("list", ((int, 1),))),)))
+
+    def test_freeze_unhashable(self):
+        with self.assertRaises(TypeError):
+            utils.freeze({1, 2})
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite("imglab.utils.cache"))
+
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -151,6 +151,16 @@ class TestSrcsetUtils(unittest.TestCase):
         )
 
 
+    def test_split_values_dpr(self):
+        self.assertEqual(list(utils.split_values_dpr({"width": 100, "dpr": [1, 2], "format": "png"})), [(1, None), (2, None)])
+        self.assertEqual(list(utils.split_values_dpr({"dpr": [1, 2], "quality": 75})), [(1, 75), (2, 75)])
+        self.assertEqual(list(utils.split_values_dpr({"dpr": range(1, 3), "quality": range(75, 40)})), [(1, 75), (2, 55), (3, 40)])
+
+    def test_split_values_width(self):
+        self.assertEqual(list(utils.split_values_width({"width": [100, 200], "height": 300})), [(100, 300, None), (200, 300, None)])
+        self.assertEqual(list(utils.split_values_width({"width": [100], "quality": [80, 70]})), [(100, None, 80), (None, None, 70)])
+        self.assertEqual(len(list(utils.split_values_width({"width": range(100, 200)}))), 16)
+
 def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite("imglab.utils.srcset"))
 
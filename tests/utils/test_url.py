@@ -3,6 +3,8 @@ import doctest
 
 from time import gmtime
 from datetime import datetime
+from enum import IntEnum
+from urllib.parse import urlencode
 
 from imglab.utils import url as utils
 
@@ -57,6 +59,43 @@ class TestUrlUtils(unittest.TestCase):
             {"width": 200, "expires": 1464096368},
         )
 
+    def test_encode_params(self):
+        self.assertEqual(utils.encode_params({}), "")
+        self.assertEqual(utils.encode_params({"width": 200, "height": 300}), "width=200&height=300")
+        self.assertEqual(utils.encode_params({"download": ""}), "download=")
+        self.assertEqual(utils.encode_params({"trim-color": "orange"}), "trim-color=orange")
+        self.assertEqual(utils.encode_params({"crop": "left,bottom"}), "crop=left%2Cbottom")
+        self.assertEqual(utils.encode_params({"text": "hello world"}), "text=hello+world")
+
+    def test_encode_params_identical_to_urlencode(self):
+        class Size(IntEnum):
+            SMALL = 100
+
+        values = [
+            0,
+            200,
+            -5,
+            1.5,
+            True,
+            None,
+            Size.SMALL,
+            "",
+            "webp",
+            "example_01.svg~",
+            "255,128,122",
+            "hello world",
+            "example.svg?width=100&format=png",
+            "https://assets.imglab-cdn.net/example.svg?width=100&format=png&signature=abc-_",
+            "ñandú/€",
+            b"bytes value",
+            [100, 200],
+        ]
+
+        for value in values:
+            params = {"key": value, "trim-color": "orange", "key with spaces": value}
+
+            self.assertEqual(utils.encode_params(params), urlencode(params))
+
     def test_is_web_uri(self):
         self.assertEqual(utils.is_web_uri("https://assets.com/example.jpeg"), True)
         self.assertEqual(utils.is_web_uri("http://assets.com/example.jpeg"), True)